@@ -9,12 +9,34 @@ This script is intentionally simple and portable:
 from __future__ import annotations
 
 import argparse
+import codecs
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analytics.bulk_io import PARALLEL_MIN_FILES
 
 DEFAULT_INPUT_DIR = Path("data/structured/incidents/schema_v2_3")
 DEFAULT_OUTPUT_JSON = Path("out/association_mining/incidents_aggregated.json")
+OUTPUT_FORMATS = ("json", "ndjson")
+READ_WORKERS = 16
+# Files per process-pool task on large directories; each task reads its
+# files with READ_WORKERS threads.
+READ_CHUNK_FILES = 64
+# Output is written in 1 MiB chunks; per-incident writes are coalesced in the buffer.
+WRITE_BUFFER_BYTES = 1 << 20
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,58 +61,174 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_OUTPUT_JSON.as_posix()})"
         ),
     )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Write a JSON list (default) or one incident object per line (ndjson).",
+    )
     return parser.parse_args()
 
 
-def discover_json_files(input_dir: Path) -> list[Path]:
-    """Recursively discover candidate incident JSON files."""
-    return sorted(
-        [
-            path
-            for path in input_dir.rglob("*.json")
-            if path.is_file() and not path.name.startswith(".")
-        ],
-        key=lambda p: p.as_posix(),
-    )
+def _iter_json(root: str) -> Iterator[str]:
+    # DirEntry.is_dir/is_file use the d_type from the directory read, so no
+    # extra stat per entry. Like rglob, symlinked directories are not descended.
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_json(entry.path)
+            elif entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file():
+                yield entry.path
 
 
-def load_incident(path: Path) -> dict[str, Any] | None:
-    """Load one incident JSON payload; return None on invalid payload."""
+def discover_json_files(input_dir: Path) -> list[Path]:
+    """Recursively discover candidate incident JSON files."""
+    if not input_dir.is_dir():
+        return []
+    # Sort the scandir strings directly (C string compares, no Path objects);
+    # every path shares the input_dir prefix, so this matches as_posix() order.
+    paths = list(_iter_json(str(input_dir)))
+    if os.sep == "/":
+        paths.sort()
+    else:
+        paths.sort(key=lambda path: path.replace(os.sep, "/"))
+    return [Path(path) for path in paths]
+
+
+def read_all_files(paths: list[Path], max_workers: int = READ_WORKERS) -> list[bytes]:
+    """Read raw file payloads in one batch, preserving input order.
+
+    File reads release the GIL, so a small thread pool keeps several
+    open/read/close sequences in flight and hides per-file latency on
+    cold caches.
+    """
+    if len(paths) <= 1:
+        return [path.read_bytes() for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(Path.read_bytes, paths))
+
+
+def parse_incident(path: Path, raw: bytes) -> dict[str, Any] | None:
+    """Parse one incident JSON payload; return None on invalid payload."""
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        data = raw.removeprefix(codecs.BOM_UTF8)
+        payload = orjson.loads(data) if orjson is not None else json.loads(data)
     except json.JSONDecodeError:
         return None
 
     if not isinstance(payload, dict):
         return None
-
-    # Minimal metadata for downstream reproducibility.
-    payload.setdefault("incident_id", path.stem)
-    payload.setdefault("source_file", path.as_posix())
     return payload
 
 
-def aggregate(input_dir: Path, output_json: Path) -> int:
-    json_files = discover_json_files(input_dir)
-    aggregated: list[dict[str, Any]] = []
+def with_metadata(path: Path, payload: dict[str, Any]) -> dict[str, Any]:
+    """Add minimal metadata for downstream reproducibility at write time.
 
-    for json_file in json_files:
-        incident = load_incident(json_file)
-        if incident is None:
-            continue
-        aggregated.append(incident)
+    Existing ``incident_id``/``source_file`` values win, as with setdefault.
+    The parsed payload is never mutated; it is returned as-is when nothing
+    is missing.
+    """
+    missing: dict[str, Any] = {}
+    if "incident_id" not in payload:
+        missing["incident_id"] = path.stem
+    if "source_file" not in payload:
+        missing["source_file"] = path.as_posix()
+    return {**payload, **missing} if missing else payload
 
+
+def load_incident(path: Path) -> dict[str, Any] | None:
+    """Load one incident JSON payload; return None on invalid payload."""
+    return parse_incident(path, path.read_bytes())
+
+
+def load_incidents(paths: list[Path]) -> list[dict[str, Any] | None]:
+    """Load a batch of incidents: read them with :func:`read_all_files`, then parse."""
+    return [parse_incident(p, raw) for p, raw in zip(paths, read_all_files(paths))]
+
+
+def _dump_incident(incident: dict[str, Any], indent: bool) -> bytes:
+    """Serialize one incident, with orjson when installed.
+
+    Payloads orjson rejects (e.g. integers wider than 64 bits) fall back to
+    the stdlib encoder.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(incident, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(incident, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(incident, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_incidents(
+    incidents: Iterable[dict[str, Any]],
+    output_json: Path,
+    output_format: str = "json",
+) -> int:
+    """Stream incidents to disk one record at a time; return the count written.
+
+    The ``json`` format has the layout of ``json.dumps(list, indent=2)``
+    without ever holding the serialized list in memory. With orjson some
+    float spellings differ (``1e16`` rather than ``1e+16``); the parsed
+    values are the same.
+    """
+    count = 0
     output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(
-        json.dumps(aggregated, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    with output_json.open("wb", buffering=WRITE_BUFFER_BYTES) as handle:
+        if output_format == "ndjson":
+            for incident in incidents:
+                handle.write(_dump_incident(incident, indent=False) + b"\n")
+                count += 1
+            return count
+
+        handle.write(b"[")
+        for incident in incidents:
+            handle.write(b",\n  " if count else b"\n  ")
+            # JSON strings never contain raw newlines, so this only re-indents structure.
+            handle.write(_dump_incident(incident, indent=True).replace(b"\n", b"\n  "))
+            count += 1
+        handle.write(b"\n]" if count else b"]")
+    return count
+
+
+def _write_aggregated(
+    json_files: list[Path],
+    incidents: Iterable[dict[str, Any] | None],
+    output_json: Path,
+    output_format: str,
+) -> int:
+    records = (
+        with_metadata(path, incident)
+        for path, incident in zip(json_files, incidents)
+        if incident is not None
     )
-    return len(aggregated)
+    return write_incidents(records, output_json, output_format)
+
+
+def aggregate(input_dir: Path, output_json: Path, output_format: str = "json") -> int:
+    json_files = discover_json_files(input_dir)
+
+    if len(json_files) < PARALLEL_MIN_FILES:
+        return _write_aggregated(
+            json_files, load_incidents(json_files), output_json, output_format
+        )
+
+    # Each worker reads its chunk with the batched threaded read, then parses.
+    # map() is ordered, so output keeps the deterministic path ordering.
+    chunks = [
+        json_files[i:i + READ_CHUNK_FILES] for i in range(0, len(json_files), READ_CHUNK_FILES)
+    ]
+    with ProcessPoolExecutor() as pool:
+        incidents = chain.from_iterable(pool.map(load_incidents, chunks))
+        return _write_aggregated(json_files, incidents, output_json, output_format)
 
 
 def main() -> None:
     args = parse_args()
-    count = aggregate(args.input_dir, args.output_json)
+    count = aggregate(args.input_dir, args.output_json, args.format)
     print(f"Aggregated {count} incident file(s) into {args.output_json}")
 
 
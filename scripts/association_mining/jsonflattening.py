@@ -1,19 +1,43 @@
 """Flatten aggregated incidents into barrier/control tabular rows.
 
-Input is expected to be a JSON list of incident objects produced by jsonaggregation.py.
+Input is expected to be a JSON list of incident objects produced by jsonaggregation.py,
+or the same incidents written one object per line (``--format ndjson``; read as
+NDJSON for ``.ndjson``/``.jsonl`` inputs or with ``--input-format ndjson``).
 Output CSV is stable and intentionally narrow for association-mining workflows.
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import json
+import mmap
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analytics.bulk_io import encode_csv_rows
 
 DEFAULT_INPUT_JSON = Path("out/association_mining/incidents_aggregated.json")
 DEFAULT_OUTPUT_CSV = Path("out/association_mining/incidents_flat.csv")
+# JSON lists at least this large are parsed incrementally with ijson (when
+# installed) so resident memory stays at roughly one incident.
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+WRITE_BATCH_ROWS = 10_000
+INPUT_FORMATS = ("json", "ndjson")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
 
 CSV_COLUMNS = [
     "incident_id",
@@ -57,13 +81,67 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional output Excel path. If omitted, Excel is not written.",
     )
+    parser.add_argument(
+        "--input-format",
+        choices=INPUT_FORMATS,
+        default=None,
+        help="Input format (default: ndjson for .ndjson/.jsonl files, json otherwise)",
+    )
     return parser.parse_args()
 
 
 def _stringify_list(value: Any) -> str:
-    if isinstance(value, list):
-        return ",".join(str(item) for item in value)
-    return ""
+    if type(value) is not list:
+        return ""
+    try:
+        # Common case: ID lists are already all strings.
+        return ",".join(value)
+    except TypeError:
+        return ",".join([str(item) for item in value])
+
+
+def _control_row(ctrl: dict[str, Any], incident_id: Any) -> tuple[Any, ...]:
+    """Extract one control as a tuple in CSV_COLUMNS order.
+
+    JSON-decoded containers are always exact ``dict``/``list`` instances, so
+    ``type(...) is`` stands in for the slower ``isinstance`` checks.
+    """
+    get = ctrl.get
+    performance = get("performance")
+    if type(performance) is not dict:
+        performance = {}
+    human = get("human")
+    if type(human) is not dict:
+        human = {}
+    evidence = get("evidence")
+    if type(evidence) is not dict:
+        evidence = {}
+    supporting_text = evidence.get("supporting_text")
+
+    return (
+        incident_id,
+        get("control_id", ""),
+        get("name", ""),
+        get("side", ""),
+        get("barrier_role", ""),
+        get("barrier_type", ""),
+        get("line_of_defense", ""),
+        get("lod_basis", ""),
+        _stringify_list(get("linked_threat_ids")),
+        _stringify_list(get("linked_consequence_ids")),
+        performance.get("barrier_status", ""),
+        performance.get("barrier_failed", False),
+        human.get("human_contribution_value", ""),
+        human.get("barrier_failed_human", False),
+        evidence.get("confidence", ""),
+        len(supporting_text) if type(supporting_text) is list else 0,
+    )
+
+
+def _incident_rows(incident: dict[str, Any]) -> list[tuple[Any, ...]]:
+    incident_id = incident.get("incident_id", "unknown")
+    controls = incident.get("bowtie", {}).get("controls", [])
+    return [_control_row(ctrl, incident_id) for ctrl in controls if type(ctrl) is dict]
 
 
 def flatten_incident(incident: dict[str, Any]) -> list[dict[str, Any]]:
@@ -74,59 +152,119 @@ def flatten_incident(incident: dict[str, Any]) -> list[dict[str, Any]]:
     - Missing optional fields are emitted as empty values.
     - One CSV row represents one barrier/control observation for one incident.
     """
-    incident_id = incident.get("incident_id", "unknown")
-    controls = incident.get("bowtie", {}).get("controls", [])
-    rows: list[dict[str, Any]] = []
-
-    for ctrl in controls:
-        if not isinstance(ctrl, dict):
-            continue
-
-        performance = ctrl.get("performance", {}) if isinstance(ctrl.get("performance"), dict) else {}
-        human = ctrl.get("human", {}) if isinstance(ctrl.get("human"), dict) else {}
-        evidence = ctrl.get("evidence", {}) if isinstance(ctrl.get("evidence"), dict) else {}
-
-        rows.append(
-            {
-                "incident_id": incident_id,
-                "control_id": ctrl.get("control_id", ""),
-                "control_name": ctrl.get("name", ""),
-                "side": ctrl.get("side", ""),
-                "barrier_role": ctrl.get("barrier_role", ""),
-                "barrier_type": ctrl.get("barrier_type", ""),
-                "line_of_defense": ctrl.get("line_of_defense", ""),
-                "lod_basis": ctrl.get("lod_basis", ""),
-                "linked_threat_ids": _stringify_list(ctrl.get("linked_threat_ids")),
-                "linked_consequence_ids": _stringify_list(ctrl.get("linked_consequence_ids")),
-                "barrier_status": performance.get("barrier_status", ""),
-                "barrier_failed": performance.get("barrier_failed", False),
-                "human_contribution_value": human.get("human_contribution_value", ""),
-                "barrier_failed_human": human.get("barrier_failed_human", False),
-                "confidence": evidence.get("confidence", ""),
-                "supporting_text_count": len(evidence.get("supporting_text", []))
-                if isinstance(evidence.get("supporting_text"), list)
-                else 0,
-            }
-        )
-
-    return rows
-
-
-def flatten(input_json: Path, output_csv: Path, output_xlsx: Path | None = None) -> int:
-    incidents = json.loads(input_json.read_text(encoding="utf-8"))
+    return [dict(zip(CSV_COLUMNS, row)) for row in _incident_rows(incident)]
+
+
+def _iter_ndjson(input_json: Path) -> Iterator[Any]:
+    loads = orjson.loads if orjson is not None else json.loads
+    with input_json.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield loads(line)
+
+
+def _iter_json_stream(input_json: Path) -> Iterator[Any]:
+    with input_json.open("rb") as handle:
+        yield from ijson.items(handle, "item", use_float=True)
+
+
+def iter_incidents(input_json: Path, input_format: str | None = None) -> Iterator[Any]:
+    """Return an iterator over incident objects in a JSON list or an NDJSON file.
+
+    *input_format* is ``"json"`` or ``"ndjson"``; when omitted, ``.ndjson``
+    and ``.jsonl`` files are read as NDJSON (lazily, line by line) and
+    anything else as a JSON list. A JSON input that is not a list raises
+    ``ValueError`` here, before any output is opened. A JSON list of at least
+    ``STREAM_MIN_BYTES`` is streamed item by item with ijson when it is
+    installed. Otherwise, with orjson installed, it is parsed straight from a
+    read-only memory map, so the file is paged in on demand instead of being
+    copied into a bytes object and then decoded to str.
+    """
+    if input_format is None:
+        input_format = "ndjson" if input_json.suffix.lower() in NDJSON_SUFFIXES else "json"
+    if input_format == "ndjson":
+        return _iter_ndjson(input_json)
+
+    with input_json.open("rb") as handle:
+        if not handle.read(4096).lstrip().startswith(b"["):
+            raise ValueError("Input JSON must be a list of incident objects")
+        if ijson is not None and input_json.stat().st_size >= STREAM_MIN_BYTES:
+            return _iter_json_stream(input_json)
+
+        handle.seek(0)
+        if orjson is not None:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    incidents = orjson.loads(view)
+        else:
+            incidents = json.loads(handle.read())
+
     if not isinstance(incidents, list):
         raise ValueError("Input JSON must be a list of incident objects")
+    return iter(incidents)
+
+
+def _to_columns(rows: list[tuple[Any, ...]]) -> dict[str, list[Any]]:
+    """Transpose tuple rows into columns, rendering values as csv.DictWriter would."""
+    columns: dict[str, list[Any]] = {}
+    transposed = zip(*rows) if rows else ([] for _ in CSV_COLUMNS)
+    for col, values in zip(CSV_COLUMNS, transposed):
+        if col == "supporting_text_count":
+            columns[col] = list(values)
+        else:
+            columns[col] = [None if v is None else str(v) for v in values]
+    return columns
 
-    rows: list[dict[str, Any]] = []
+
+def _iter_row_batches(incidents: Iterator[Any]) -> Iterator[list[tuple[Any, ...]]]:
+    batch: list[tuple[Any, ...]] = []
     for incident in incidents:
         if isinstance(incident, dict):
-            rows.extend(flatten_incident(incident))
+            batch.extend(_incident_rows(incident))
+            if len(batch) >= WRITE_BATCH_ROWS:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _keep_rows(
+    batches: Iterator[list[tuple[Any, ...]]], kept: list[tuple[Any, ...]]
+) -> Iterator[list[tuple[Any, ...]]]:
+    for batch in batches:
+        kept.extend(batch)
+        yield batch
+
+
+def _write_csv(batches: Iterator[list[tuple[Any, ...]]], output_csv: Path) -> int:
+    """Write row batches as they arrive; return the number of rows written.
+
+    Output is byte-identical to ``csv.writer`` (see :func:`encode_csv_rows`).
+    """
+    count = 0
+    with output_csv.open("wb") as handle:
+        handle.write(encode_csv_rows([CSV_COLUMNS]))
+        for batch in batches:
+            handle.write(encode_csv_rows(batch))
+            count += len(batch)
+    return count
+
+
+def flatten(
+    input_json: Path,
+    output_csv: Path,
+    output_xlsx: Path | None = None,
+    input_format: str | None = None,
+) -> int:
+    # Checks the input shape up front, so a bad input never truncates output_csv.
+    batches = _iter_row_batches(iter_incidents(input_json, input_format))
+    # Excel output needs every row at once; otherwise batches go straight to disk.
+    kept_rows: list[tuple[Any, ...]] = []
+    if output_xlsx is not None:
+        batches = _keep_rows(batches, kept_rows)
 
     output_csv.parent.mkdir(parents=True, exist_ok=True)
-    with output_csv.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+    row_count = _write_csv(batches, output_csv)
 
     if output_xlsx is not None:
         output_xlsx.parent.mkdir(parents=True, exist_ok=True)
@@ -135,14 +273,14 @@ def flatten(input_json: Path, output_csv: Path, output_xlsx: Path | None = None)
         except ImportError as exc:
             raise RuntimeError("pandas is required for --output-xlsx") from exc
 
-        pd.DataFrame(rows, columns=CSV_COLUMNS).to_excel(output_xlsx, index=False)
+        pd.DataFrame(_to_columns(kept_rows), columns=CSV_COLUMNS).to_excel(output_xlsx, index=False)
 
-    return len(rows)
+    return row_count
 
 
 def main() -> None:
     args = parse_args()
-    row_count = flatten(args.input_json, args.output_csv, args.output_xlsx)
+    row_count = flatten(args.input_json, args.output_csv, args.output_xlsx, args.input_format)
     print(f"Flattened {row_count} control row(s) to {args.output_csv}")
     if args.output_xlsx is not None:
         print(f"Wrote Excel output to {args.output_xlsx}")
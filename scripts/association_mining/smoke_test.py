@@ -7,6 +7,7 @@ and validates basic output shape.
 from __future__ import annotations
 
 import csv
+import io
 import json
 import subprocess
 import sys
@@ -77,6 +78,62 @@ def main() -> None:
         with flat_csv.open("r", encoding="utf-8", newline="") as handle:
             rows = list(csv.reader(handle))
         assert len(rows) >= 2, "CSV should include header and at least one data row"
+        expected = io.StringIO(newline="")
+        csv.writer(expected).writerows(rows)
+        assert flat_csv.read_bytes() == expected.getvalue().encode("utf-8"), (
+            "CSV bytes should match csv.writer output"
+        )
+
+        # --- NDJSON round trip must flatten to the same rows ---
+        agg_ndjson = tmp_path / "incidents_aggregated.ndjson"
+        flat_ndjson_csv = tmp_path / "incidents_flat_ndjson.csv"
+
+        subprocess.run(
+            [
+                sys.executable,
+                "scripts/association_mining/jsonaggregation.py",
+                "--input-dir",
+                str(input_dir),
+                "--output-json",
+                str(agg_ndjson),
+                "--format",
+                "ndjson",
+            ],
+            check=True,
+        )
+        subprocess.run(
+            [
+                sys.executable,
+                "scripts/association_mining/jsonflattening.py",
+                "--input-json",
+                str(agg_ndjson),
+                "--output-csv",
+                str(flat_ndjson_csv),
+            ],
+            check=True,
+        )
+        with flat_ndjson_csv.open("r", encoding="utf-8", newline="") as handle:
+            assert list(csv.reader(handle)) == rows, "NDJSON input should flatten identically"
+
+        # --- A top-level object is rejected without truncating the output ---
+        object_json = tmp_path / "incident_object.json"
+        object_json.write_text(json.dumps(SAMPLE_INCIDENT), encoding="utf-8")
+        previous = flat_csv.read_bytes()
+        result = subprocess.run(
+            [
+                sys.executable,
+                "scripts/association_mining/jsonflattening.py",
+                "--input-json",
+                str(object_json),
+                "--output-csv",
+                str(flat_csv),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode != 0, "A JSON object input should be rejected"
+        assert "must be a list" in result.stderr
+        assert flat_csv.read_bytes() == previous, "Rejected input must not touch the output CSV"
 
         # --- Step 3: Normalize barrier families ---
         norm_csv = tmp_path / "normalized_df.csv"
@@ -1,45 +1,72 @@
 # LEGACY — V1-era barrier coverage analytics. Superseded by src/modeling/ pipeline.
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, NamedTuple, Optional
 from src._legacy.bowtie import Bowtie, Barrier
 from src._legacy.incident import Incident
 
-def calculate_barrier_coverage(incident: Incident, bowtie: Bowtie) -> Dict[str, float]:
+
+class BarrierNamePartition(NamedTuple):
+    """Lowercased bowtie barrier names split by type, with per-partition counts."""
+    prevention: FrozenSet[str]
+    mitigation: FrozenSet[str]
+    all: FrozenSet[str]
+    n_prevention: int
+    n_mitigation: int
+    n_all: int
+
+
+def partition_barrier_names(bowtie: Bowtie) -> BarrierNamePartition:
+    """
+    Partitions a Bowtie's barrier names by type in a single pass.
+
+    Compute this once per Bowtie and pass it to calculate_barrier_coverage()
+    when scoring many incidents against the same Bowtie.
+    """
+    prev_names = [b.name.lower() for b in bowtie.barriers if b.type == "prevention"]
+    mit_names = [b.name.lower() for b in bowtie.barriers if b.type == "mitigation"]
+    all_names = [b.name.lower() for b in bowtie.barriers]
+    return BarrierNamePartition(
+        frozenset(prev_names), frozenset(mit_names), frozenset(all_names),
+        len(prev_names), len(mit_names), len(all_names),
+    )
+
+
+def calculate_barrier_coverage(
+    incident: Incident,
+    bowtie: Bowtie,
+    partition: Optional[BarrierNamePartition] = None,
+) -> Dict[str, float]:
     """
     Calculates the percentage of Bowtie barriers present in the incident.
 
     Args:
         incident: The incident data with identified barriers.
         bowtie: The reference Bowtie diagram.
+        partition: Precomputed partition_barrier_names(bowtie); computed here if omitted.
 
     Returns:
         Dictionary with coverage metrics (0.0 to 1.0).
     """
-    def _calc_coverage(incident_barriers: List[str], bowtie_barriers: List[Barrier]) -> float:
-        if not bowtie_barriers:
+    def _calc_coverage(incident_barriers: List[str], target_names: FrozenSet[str], n_targets: int) -> float:
+        if not n_targets:
             return 0.0
 
         # Match by name (assuming exact match for now, simple string comparison)
         # In a real system, this might use IDs or fuzzy matching
-        present_count = 0
-        bowtie_names = [b.name.lower() for b in bowtie_barriers]
-
-        for ib in incident_barriers:
-            if ib.lower() in bowtie_names:
-                present_count += 1
+        present_count = sum(1 for ib in incident_barriers if ib.lower() in target_names)
 
         # Cap at 1.0 even if duplicates exist in incident data
-        return min(1.0, present_count / len(bowtie_barriers))
+        return min(1.0, present_count / n_targets)
 
-    # Filter bowtie barriers by type
-    prev_barriers = [b for b in bowtie.barriers if b.type == "prevention"]
-    mit_barriers = [b for b in bowtie.barriers if b.type == "mitigation"]
+    # Name sets give O(1) membership tests
+    if partition is None:
+        partition = partition_barrier_names(bowtie)
 
-    prevention_cov = _calc_coverage(incident.prevention_barriers, prev_barriers)
-    mitigation_cov = _calc_coverage(incident.mitigation_barriers, mit_barriers)
+    prevention_cov = _calc_coverage(incident.prevention_barriers, partition.prevention, partition.n_prevention)
+    mitigation_cov = _calc_coverage(incident.mitigation_barriers, partition.mitigation, partition.n_mitigation)
 
     # Overall coverage (all barriers)
     all_incident_barriers = incident.prevention_barriers + incident.mitigation_barriers
-    overall_cov = _calc_coverage(all_incident_barriers, bowtie.barriers)
+    overall_cov = _calc_coverage(all_incident_barriers, partition.all, partition.n_all)
 
     return {
         "prevention_coverage": prevention_cov,
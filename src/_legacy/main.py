@@ -4,7 +4,7 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
-from src._legacy.utils import load_data
+from src._legacy.utils import data_cache_key, load_data
 
 # Configuration
 st.set_page_config(page_title="Bowtie Risk Analytics", layout="wide")
@@ -12,6 +12,12 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 
 
+@st.cache_data(show_spinner=False)
+def _load_data_cached(processed_dir: str, cache_key: tuple):
+    # cache_key only participates in hashing: it changes when any input file does.
+    return load_data(Path(processed_dir))
+
+
 def render_incident_details(incident):
     title = incident.get('title', incident.get('description', 'No description')[:50])
     st.subheader(f"{incident['incident_id']}: {title}")
@@ -58,7 +64,7 @@ def main():
 
     # Load Data
     with st.spinner("Loading data..."):
-        incidents, metrics = load_data(PROCESSED_DIR)
+        incidents, metrics = _load_data_cached(str(PROCESSED_DIR), data_cache_key(PROCESSED_DIR))
 
     st.sidebar.success(f"Loaded {len(incidents)} incidents")
 
@@ -3,9 +3,36 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
+
+def _loads(file_path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    return json.loads(file_path.read_text(encoding='utf-8'))
+
+
+def data_cache_key(processed_dir: Path) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint of the files load_data() reads: (name, mtime_ns) pairs.
+
+    Cheap to compute (stat only, no parsing), so callers can memoize
+    load_data() on it and still pick up new or modified files.
+    """
+    if not processed_dir.exists():
+        return ()
+    paths = list(processed_dir.glob("INC-*.json"))
+    metrics_file = processed_dir / "fleet_metrics.json"
+    if metrics_file.exists():
+        paths.append(metrics_file)
+    return tuple(sorted((p.name, p.stat().st_mtime_ns) for p in paths))
+
+
 def load_data(processed_dir: Path) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """Loads incidents and metrics from the processed directory."""
     incidents = []
@@ -22,7 +49,7 @@ def load_data(processed_dir: Path) -> Tuple[List[Dict[str, Any]], Dict[str, Any]
     # Load incidents
     for file_path in processed_dir.glob("INC-*.json"):
         try:
-            data = json.loads(file_path.read_text(encoding='utf-8'))
+            data = _loads(file_path)
             incidents.append(data)
         except Exception as e:
             logger.warning(f"Failed to load incident from {file_path}: {e}")
@@ -31,7 +58,7 @@ def load_data(processed_dir: Path) -> Tuple[List[Dict[str, Any]], Dict[str, Any]
     metrics_file = processed_dir / "fleet_metrics.json"
     if metrics_file.exists():
         try:
-            metrics = json.loads(metrics_file.read_text(encoding='utf-8'))
+            metrics = _loads(metrics_file)
         except Exception as e:
             logger.warning(f"Failed to load metrics from {metrics_file}: {e}")
 
@@ -1,6 +1,5 @@
 # LEGACY — V1-era fleet aggregation analytics. Superseded by src/modeling/ pipeline.
 from typing import List, Dict, Any
-import statistics
 
 def calculate_fleet_metrics(incidents_data: List[Dict[str, Any]]) -> Dict[str, float]:
     """
@@ -22,22 +21,21 @@ def calculate_fleet_metrics(incidents_data: List[Dict[str, Any]]) -> Dict[str, f
 
     total_incidents = len(incidents_data)
 
-    # Extract coverage scores, defaulting to 0.0 if missing (though pipeline should ensure they exist)
-    prev_scores = []
-    mit_scores = []
-    overall_scores = []
+    # Running sums in a single pass; coverage scores default to 0.0 if missing
+    # (though pipeline should ensure they exist)
+    prev_sum = mit_sum = overall_sum = 0.0
 
     for inc in incidents_data:
         analytics = inc.get("analytics", {})
         coverage = analytics.get("coverage", {})
 
-        prev_scores.append(coverage.get("prevention_coverage", 0.0))
-        mit_scores.append(coverage.get("mitigation_coverage", 0.0))
-        overall_scores.append(coverage.get("overall_coverage", 0.0))
+        prev_sum += coverage.get("prevention_coverage", 0.0)
+        mit_sum += coverage.get("mitigation_coverage", 0.0)
+        overall_sum += coverage.get("overall_coverage", 0.0)
 
     return {
         "total_incidents": total_incidents,
-        "average_prevention_coverage": statistics.mean(prev_scores) if prev_scores else 0.0,
-        "average_mitigation_coverage": statistics.mean(mit_scores) if mit_scores else 0.0,
-        "average_overall_coverage": statistics.mean(overall_scores) if overall_scores else 0.0
+        "average_prevention_coverage": prev_sum / total_incidents,
+        "average_mitigation_coverage": mit_sum / total_incidents,
+        "average_overall_coverage": overall_sum / total_incidents
     }
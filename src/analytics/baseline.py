@@ -1,28 +1,90 @@
 """Baseline analytics on flattened controls dataset."""
 import json
 import logging
+from collections import Counter
+from itertools import combinations
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from src.analytics.flatten import CONTROLS_CSV_COLUMNS, flatten_all_rows, write_controls_csv
 
 logger = logging.getLogger(__name__)
 
+# Low-cardinality label columns; categorical dtype lets groupby/value_counts
+# work on integer codes instead of hashing every string.
+CATEGORICAL_COLUMNS = (
+    "barrier_status",
+    "barrier_type",
+    "side",
+    "line_of_defense",
+    "lod_basis",
+    "barrier_role",
+    "confidence",
+)
+BOOL_COLUMNS = ("barrier_failed", "barrier_failed_human")
+
+
+def _controls_frame(table: pa.Table) -> pd.DataFrame:
+    df = table.to_pandas()
+    # Arrow dictionaries keep first-seen order; sort so groupby output stays lexical
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+    # Missing flags leave an object column of True/False/None. pd.read_csv
+    # followed by astype(bool) turned a blank (NaN) into True; keep that.
+    for col in BOOL_COLUMNS:
+        if col in df.columns and df[col].dtype != bool:
+            df[col] = df[col].fillna(True).astype(bool)
+    return df
+
 
 def load_controls(csv_path: Path) -> pd.DataFrame:
-    """Load flattened controls CSV into DataFrame."""
+    """Load flattened controls CSV into DataFrame.
+
+    Parsed with Arrow's multithreaded CSV reader. Label columns are decoded
+    straight to dictionary (pandas categorical) and flag columns to bool.
+    Empty cells become missing values, as with ``pd.read_csv``.
+    """
     if not csv_path.exists():
         raise FileNotFoundError(f"Controls CSV not found: {csv_path}")
-    df = pd.read_csv(csv_path)
-    # Convert boolean-like columns
-    for col in ["barrier_failed", "barrier_failed_human"]:
-        if col in df.columns:
-            df[col] = df[col].astype(bool)
-    return df
+    column_types = {col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORICAL_COLUMNS}
+    column_types.update({col: pa.bool_() for col in BOOL_COLUMNS})
+    table = pa_csv.read_csv(
+        csv_path,
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+    )
+    return _controls_frame(table)
+
+
+def controls_from_rows(rows: list[dict]) -> pd.DataFrame:
+    """Build the load_controls() DataFrame directly from flatten_controls() rows.
+
+    Values are typed the way a CSV round trip would decode them (empty or
+    None -> missing, labels as strings), without serializing to text.
+    """
+    columns = {}
+    for col in CONTROLS_CSV_COLUMNS:
+        values = [row.get(col) for row in rows]
+        if col in BOOL_COLUMNS:
+            columns[col] = pa.array([v if isinstance(v, bool) else None for v in values], pa.bool_())
+        elif col == "supporting_text_count":
+            columns[col] = pa.array(values, pa.int64())
+        else:
+            strings = pa.array(
+                [None if v is None or v == "" else str(v) for v in values], pa.string()
+            )
+            columns[col] = strings.dictionary_encode() if col in CATEGORICAL_COLUMNS else strings
+    return _controls_frame(pa.table(columns))
 
 
 def barrier_status_distribution(df: pd.DataFrame) -> dict:
     """Count and percentage of each barrier_status value."""
     counts = df["barrier_status"].value_counts()
+    counts = counts[counts > 0]  # categorical value_counts also lists unused categories
     total = len(df)
     return {
         status: {"count": int(count), "pct": round(count / total, 4) if total > 0 else 0.0}
@@ -34,7 +96,7 @@ def failure_rates(df: pd.DataFrame, group_col: str) -> dict:
     """Failure rate (barrier_failed=True proportion) grouped by a column."""
     if group_col not in df.columns:
         return {}
-    grouped = df.groupby(group_col)["barrier_failed"].agg(["sum", "count"])
+    grouped = df.groupby(group_col, observed=True)["barrier_failed"].agg(["sum", "count"])
     grouped["rate"] = grouped["sum"] / grouped["count"]
     return {
         idx: {"failed": int(row["sum"]), "total": int(row["count"]), "rate": round(row["rate"], 4)}
@@ -44,27 +106,43 @@ def failure_rates(df: pd.DataFrame, group_col: str) -> dict:
 
 def co_occurrence_crosstab(df: pd.DataFrame) -> pd.DataFrame:
     """Crosstab of control names that co-occur as failed within the same incident."""
-    failed = df[df["barrier_failed"]][["incident_id", "name"]]
+    failed = df.loc[df["barrier_failed"], ["incident_id", "name"]].dropna(subset=["name"])
     if failed.empty:
         return pd.DataFrame()
 
-    # Self-join on incident_id to find co-occurring failures
-    merged = failed.merge(failed, on="incident_id", suffixes=("_a", "_b"))
-    # Remove self-pairs and duplicates
-    merged = merged[merged["name_a"] < merged["name_b"]]
-
-    if merged.empty:
+    # Count pairs per incident instead of self-joining on incident_id, which
+    # materializes k^2 rows for an incident with k failed controls. A name
+    # repeated within an incident contributes one pair per occurrence, as
+    # the join did.
+    pair_counts: Counter = Counter()
+    for _, names in failed.groupby("incident_id", sort=False, dropna=False)["name"]:
+        name_counts = Counter(names)
+        for a, b in combinations(sorted(name_counts), 2):
+            pair_counts[(a, b)] += name_counts[a] * name_counts[b]
+
+    if not pair_counts:
         return pd.DataFrame()
 
-    crosstab = merged.groupby(["name_a", "name_b"]).size().reset_index(name="co_occurrences")
+    crosstab = pd.DataFrame(
+        [(a, b, n) for (a, b), n in sorted(pair_counts.items())],
+        columns=["name_a", "name_b", "co_occurrences"],
+    )
     return crosstab
 
 
 def human_contribution_summary(df: pd.DataFrame) -> dict:
     """Summary statistics for human contribution and human-caused failures."""
     total = len(df)
-    human_mentioned = (df["human_contribution_value"].notna() & (df["human_contribution_value"] != "")).sum()
-    human_failed = df["barrier_failed_human"].sum() if "barrier_failed_human" in df.columns else 0
+    # Reduce on the numpy buffers: count_nonzero/sum over contiguous bool arrays
+    # skip the pandas reduction machinery.
+    hcv = df["human_contribution_value"]
+    mentioned_mask = hcv.notna().to_numpy(dtype=bool) & (hcv != "").to_numpy(dtype=bool)
+    human_mentioned = int(np.count_nonzero(mentioned_mask))
+    human_failed = (
+        int(np.count_nonzero(df["barrier_failed_human"].to_numpy(dtype=bool, na_value=False)))
+        if "barrier_failed_human" in df.columns
+        else 0
+    )
 
     return {
         "total_controls": int(total),
@@ -75,8 +153,8 @@ def human_contribution_summary(df: pd.DataFrame) -> dict:
     }
 
 
-def run_baseline(controls_csv: Path, out_dir: Path) -> None:
-    """Run all baseline analyses and write outputs.
+def run_baseline_from_df(df: pd.DataFrame, out_dir: Path) -> None:
+    """Run all baseline analyses on a loaded controls DataFrame and write outputs.
 
     Outputs:
         - out_dir/control_summary.json: status distribution, failure rates, human summary
@@ -84,9 +162,6 @@ def run_baseline(controls_csv: Path, out_dir: Path) -> None:
     """
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    df = load_controls(controls_csv)
-    logger.info(f"Loaded {len(df)} control rows from {controls_csv}")
-
     summary = {
         "total_controls": len(df),
         "total_incidents": int(df["incident_id"].nunique()),
@@ -110,3 +185,34 @@ def run_baseline(controls_csv: Path, out_dir: Path) -> None:
         # Write empty CSV with headers
         crosstab_path.write_text("name_a,name_b,co_occurrences\n", encoding="utf-8")
         logger.info(f"No co-occurring failures found, wrote empty crosstab to {crosstab_path}")
+
+
+def run_baseline(controls_csv: Path, out_dir: Path) -> None:
+    """Run all baseline analyses and write outputs.
+
+    Outputs:
+        - out_dir/control_summary.json: status distribution, failure rates, human summary
+        - out_dir/failure_crosstab.csv: co-occurrence of failures
+    """
+    df = load_controls(controls_csv)
+    logger.info(f"Loaded {len(df)} control rows from {controls_csv}")
+    run_baseline_from_df(df, out_dir)
+
+
+def run_flatten_and_baseline(structured_dir: Path, controls_csv: Path, out_dir: Path) -> int:
+    """Flatten Schema v2.3 incidents and run the baseline in one pass.
+
+    Equivalent to ``flatten_all()`` followed by ``run_baseline()``, but the
+    analytics consume the flattened rows in memory; the controls CSV is
+    still written as a side output, never re-parsed.
+
+    Returns:
+        Number of control rows flattened (0 means nothing was written).
+    """
+    rows = flatten_all_rows(structured_dir)
+    if not rows:
+        return 0
+
+    write_controls_csv(rows, controls_csv)
+    run_baseline_from_df(controls_from_rows(rows), out_dir)
+    return len(rows)
@@ -0,0 +1,57 @@
+"""Shared helpers for the bulk JSON-to-CSV jobs.
+
+Used by :mod:`src.analytics.flatten` and the association-mining scripts
+(``jsonaggregation.py``, ``jsonflattening.py``).
+"""
+import csv
+import io
+from typing import Any, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Below this many files, process start-up costs more than the parallel parse saves.
+PARALLEL_MIN_FILES = 32
+
+# Arrow's "needed" style still quotes every string (and Arrow always quotes
+# the header), so it cannot match csv.writer's minimal quoting. Unquoted
+# rows are byte-identical to it (CRLF, None and "" both empty) and Arrow
+# raises ArrowInvalid when a value would need quotes.
+_ARROW_WRITE_OPTIONS = (
+    pa_csv.WriteOptions(include_header=False, quoting_style="none", eol="\r\n")
+    if pa is not None
+    else None
+)
+
+
+def _arrow_column(values: Sequence[Any]) -> "pa.Array":
+    # Arrow spells ints like str() does; everything else is rendered as csv.writer would.
+    if all(type(v) is int for v in values):
+        return pa.array(values, type=pa.int64())
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def encode_csv_rows(rows: Sequence[Sequence[Any]]) -> bytes:
+    """Encode *rows* as UTF-8 CSV, byte-identical to ``csv.writer``.
+
+    Rows go through Arrow's C++ writer when pyarrow is installed and no
+    value needs quoting (commas, quotes, line breaks); otherwise, and for
+    single-column rows, where csv.writer quotes empty fields, through
+    ``csv.writer``.
+    """
+    if pa is not None and rows and len(rows[0]) > 1:
+        buffer = io.BytesIO()
+        try:
+            columns = [_arrow_column(values) for values in zip(*rows)]
+            table = pa.Table.from_arrays(columns, names=[str(i) for i in range(len(columns))])
+            pa_csv.write_csv(table, buffer, _ARROW_WRITE_OPTIONS)
+        except (pa.ArrowInvalid, OverflowError):
+            pass
+        else:
+            return buffer.getvalue()
+    text = io.StringIO()
+    csv.writer(text).writerows(rows)
+    return text.getvalue().encode("utf-8")
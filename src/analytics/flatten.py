@@ -1,10 +1,18 @@
 """Flatten Schema v2.3 incident controls into a tabular CSV dataset."""
-import csv
+import codecs
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.analytics.bulk_io import PARALLEL_MIN_FILES, encode_csv_rows
+
 logger = logging.getLogger(__name__)
 
 CONTROLS_CSV_COLUMNS = [
@@ -26,6 +34,25 @@ CONTROLS_CSV_COLUMNS = [
     "supporting_text_count",
 ]
 
+def _write_controls_csv(rows: list[dict[str, Any]], out_path: Path) -> None:
+    """Write flat control rows to CSV, byte-identical to ``csv.DictWriter``."""
+    out_path.write_bytes(
+        encode_csv_rows([CONTROLS_CSV_COLUMNS])
+        + encode_csv_rows([tuple(row.get(col) for col in CONTROLS_CSV_COLUMNS) for row in rows])
+    )
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file with ``utf-8-sig`` semantics (leading BOM tolerated).
+
+    Uses orjson when installed; it parses the raw bytes directly and skips
+    the intermediate ``str`` decode. Falls back to the stdlib parser.
+    """
+    data = path.read_bytes().removeprefix(codecs.BOM_UTF8)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def flatten_controls(incident: dict[str, Any]) -> list[dict[str, Any]]:
     """Flatten controls from a single Schema v2.3 incident dict into flat rows.
@@ -67,41 +94,76 @@ def flatten_controls(incident: dict[str, Any]) -> list[dict[str, Any]]:
     return rows
 
 
-def flatten_all(structured_dir: Path, out_path: Path) -> int:
-    """Flatten controls from all Schema v2.3 JSON files into a single CSV.
+def _flatten_file(path: Path) -> tuple[list[dict[str, Any]], str | None]:
+    """Load and flatten one incident file.
+
+    Top-level so it can be pickled into worker processes. Errors are
+    returned rather than raised so the parent logs them in file order.
+
+    Returns:
+        Tuple of (rows, error message or None).
+    """
+    try:
+        return flatten_controls(_load_json(path)), None
+    except Exception as e:
+        return [], str(e)
+
+
+def flatten_all_rows(structured_dir: Path) -> list[dict[str, Any]]:
+    """Flatten controls from all Schema v2.3 JSON files into in-memory rows.
 
     Args:
         structured_dir: Directory containing Schema v2.3 incident JSON files.
-        out_path: Output CSV path.
 
     Returns:
-        Total number of control rows written.
+        Flat control rows in sorted file order (empty if none were found).
     """
-    out_path.parent.mkdir(parents=True, exist_ok=True)
     all_rows: list[dict[str, Any]] = []
 
     json_files = sorted(structured_dir.glob("*.json"))
     if not json_files:
         logger.warning(f"No JSON files found in {structured_dir}")
-        return 0
+        return all_rows
 
-    for jf in json_files:
-        try:
-            incident = json.loads(jf.read_text(encoding="utf-8-sig"))
-            rows = flatten_controls(incident)
-            all_rows.extend(rows)
-            logger.info(f"Flattened {len(rows)} controls from {jf.name}")
-        except Exception as e:
-            logger.error(f"Error processing {jf.name}: {e}")
+    if len(json_files) < PARALLEL_MIN_FILES:
+        results = [_flatten_file(jf) for jf in json_files]
+    else:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_flatten_file, json_files, chunksize=16))
+
+    for jf, (rows, error) in zip(json_files, results):
+        if error is not None:
+            logger.error(f"Error processing {jf.name}: {error}")
+            continue
+        all_rows.extend(rows)
+        logger.info(f"Flattened {len(rows)} controls from {jf.name}")
 
     if not all_rows:
         logger.warning("No controls found across all incidents")
-        return 0
+    return all_rows
+
+
+def write_controls_csv(rows: list[dict[str, Any]], out_path: Path) -> None:
+    """Write flat control rows to ``out_path`` (parent dirs are created)."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_controls_csv(rows, out_path)
+    logger.info(f"Wrote {len(rows)} control rows to {out_path}")
 
-    with open(out_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CONTROLS_CSV_COLUMNS)
-        writer.writeheader()
-        writer.writerows(all_rows)
 
-    logger.info(f"Wrote {len(all_rows)} control rows to {out_path}")
+def flatten_all(structured_dir: Path, out_path: Path) -> int:
+    """Flatten controls from all Schema v2.3 JSON files into a single CSV.
+
+    Args:
+        structured_dir: Directory containing Schema v2.3 incident JSON files.
+        out_path: Output CSV path.
+
+    Returns:
+        Total number of control rows written.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    all_rows = flatten_all_rows(structured_dir)
+    if not all_rows:
+        return 0
+
+    write_controls_csv(all_rows, out_path)
     return len(all_rows)
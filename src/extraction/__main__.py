@@ -35,6 +35,20 @@ def main() -> None:
         action="store_true",
         help="Reprocess even if already in manifest",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for PDF extraction (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--ocr-workers",
+        type=int,
+        default=None,
+        dest="ocr_workers",
+        help="Pages OCR'd concurrently in total, shared across --workers "
+             "(default: OCR_WORKERS env var or CPU count)",
+    )
 
     args = parser.parse_args()
     run_extraction_qc(
@@ -42,6 +56,8 @@ def main() -> None:
         output_dir=Path(args.output_dir),
         manifest_path=Path(args.manifest),
         force=args.force,
+        workers=args.workers,
+        ocr_workers=args.ocr_workers,
     )
 
 
@@ -1,11 +1,19 @@
 """Multi-pass PDF text extraction with fallback chain."""
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Pages OCR'd concurrently per PDF; each pytesseract call runs its own
+# tesseract process. Override with the OCR_WORKERS env var.
+OCR_WORKERS: int = int(os.environ.get("OCR_WORKERS") or 0) or os.cpu_count() or 1
+# Render resolution for OCR (pdf2image's former default)
+OCR_DPI: int = 200
+
 
 @dataclass
 class ExtractionResult:
@@ -21,13 +29,9 @@ def _try_pymupdf(pdf_path: Path) -> ExtractionResult:
     """Extract text using PyMuPDF (fitz)."""
     import fitz
 
-    doc = fitz.open(str(pdf_path))
-    pages = []
-    for page in doc:
-        pages.append(page.get_text())
-    text = "\n\n".join(pages)
-    page_count = len(doc)
-    doc.close()
+    with fitz.open(str(pdf_path)) as doc:
+        text = "\n\n".join(page.get_text("text") for page in doc)
+        page_count = doc.page_count
     return ExtractionResult(
         text=text, extractor_used="pymupdf", page_count=page_count, error=None
     )
@@ -48,15 +52,30 @@ def _try_pdfminer(pdf_path: Path) -> ExtractionResult:
     )
 
 
-def _try_ocr(pdf_path: Path) -> ExtractionResult:
-    """Extract text using OCR (pytesseract + pdf2image)."""
-    from pdf2image import convert_from_path
-    import pytesseract
+def _try_ocr(pdf_path: Path, workers: Optional[int] = None) -> ExtractionResult:
+    """Extract text using OCR (pytesseract on PyMuPDF-rendered pages).
 
-    images = convert_from_path(str(pdf_path))
-    pages = []
-    for img in images:
-        pages.append(pytesseract.image_to_string(img))
+    *workers* pages are OCR'd at a time (default: ``OCR_WORKERS``).
+    """
+    import fitz
+    import pytesseract
+    from PIL import Image
+
+    # Render in-process with MuPDF (no pdftoppm subprocess); grayscale is
+    # a third of the RGB bytes and tesseract binarizes anyway.
+    with fitz.open(str(pdf_path)) as doc:
+        images = []
+        for page in doc:
+            pix = page.get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY)
+            images.append(Image.frombytes("L", (pix.width, pix.height), pix.samples))
+
+    workers = workers or OCR_WORKERS
+    if workers > 1 and len(images) > 1:
+        # map() keeps page order; threads suffice since tesseract runs out of process
+        with ThreadPoolExecutor(max_workers=min(workers, len(images))) as pool:
+            pages = list(pool.map(pytesseract.image_to_string, images))
+    else:
+        pages = [pytesseract.image_to_string(img) for img in images]
     text = "\n\n".join(pages)
     return ExtractionResult(
         text=text, extractor_used="ocr", page_count=len(images), error=None
@@ -71,12 +90,13 @@ _EXTRACTORS = [
 ]
 
 
-def extract_text(pdf_path: Path) -> ExtractionResult:
+def extract_text(pdf_path: Path, ocr_workers: Optional[int] = None) -> ExtractionResult:
     """Extract text from PDF using fallback chain.
 
     Tries PyMuPDF first, then pdfminer, then OCR (if available).
     Each extractor is attempted; if it raises an exception, the next
     is tried. OCR is optional — ImportError is caught gracefully.
+    *ocr_workers* caps the pages OCR'd concurrently (default: ``OCR_WORKERS``).
     """
     if not pdf_path.exists():
         return ExtractionResult(
@@ -87,8 +107,9 @@ def extract_text(pdf_path: Path) -> ExtractionResult:
 
     for name, fn in _EXTRACTORS:
         try:
-            result = fn(pdf_path)
-            return result
+            if name == "ocr":
+                return fn(pdf_path, ocr_workers)
+            return fn(pdf_path)
         except ImportError:
             logger.debug(f"{name}: not available (missing dependency)")
             errors.append(f"{name}: missing dependency")
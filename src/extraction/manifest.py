@@ -1,18 +1,22 @@
-"""Pydantic model and I/O for extraction QC manifest."""
+"""Dataclass model and I/O for extraction QC manifest."""
 import csv
 import logging
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Literal, Optional
-
-from pydantic import BaseModel, ConfigDict
+from typing import Iterator, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
+_STATUSES = frozenset({"OK", "EXTRACTION_FAILED"})
+
 
-class ExtractionManifestRow(BaseModel):
-    """One row in the extraction QC manifest CSV."""
+@dataclass(slots=True, kw_only=True)
+class ExtractionManifestRow:
+    """One row in the extraction QC manifest CSV.
 
-    model_config = ConfigDict(strict=False)
+    A plain slotted dataclass: the manifest is written and read only by this
+    module, so per-row model validation is limited to the status check.
+    """
 
     doc_id: str
     pdf_path: str
@@ -26,20 +30,57 @@ class ExtractionManifestRow(BaseModel):
     extraction_status: Literal["OK", "EXTRACTION_FAILED"]
     fail_reason: Optional[str] = None
     extracted_at: str
+    pdf_sha256: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.extraction_status not in _STATUSES:
+            raise ValueError(f"Invalid extraction_status: {self.extraction_status!r}")
+
+
+MANIFEST_COLUMNS: list[str] = [f.name for f in fields(ExtractionManifestRow)]
+
+_INT_COLUMNS = ("text_len",)
+_FLOAT_COLUMNS = ("alpha_ratio", "cid_ratio", "whitespace_ratio")
+_OPTIONAL_COLUMNS = ("fail_reason", "pdf_sha256")
+
+
+def _csv_rows(rows: list[ExtractionManifestRow]) -> Iterator[list]:
+    """Rows as positional CSV values in MANIFEST_COLUMNS order (None -> "")."""
+    for row in rows:
+        yield ["" if v is None else v for v in (getattr(row, col) for col in MANIFEST_COLUMNS)]
 
 
 def save_manifest(rows: list[ExtractionManifestRow], path: Path) -> None:
     """Write extraction manifest rows to CSV."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = list(ExtractionManifestRow.model_fields.keys())
 
     with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            row_dict = row.model_dump()
-            row_dict = {k: ("" if v is None else v) for k, v in row_dict.items()}
-            writer.writerow(row_dict)
+        writer = csv.writer(f)
+        writer.writerow(MANIFEST_COLUMNS)
+        writer.writerows(_csv_rows(rows))
+
+
+def append_manifest(rows: list[ExtractionManifestRow], path: Path) -> None:
+    """Append rows to an extraction manifest CSV, writing only the new rows.
+
+    The header is written when the file is new or empty. A manifest whose
+    header differs from the current columns (e.g. written by an older
+    version) is rewritten in full with the new rows appended.
+    """
+    header: Optional[list[str]] = None
+    if path.exists():
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), None)
+
+    if header is None:
+        save_manifest(rows, path)
+        return
+    if header != MANIFEST_COLUMNS:
+        save_manifest(load_manifest(path) + rows, path)
+        return
+
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(_csv_rows(rows))
 
 
 def load_manifest(path: Path) -> list[ExtractionManifestRow]:
@@ -49,17 +90,24 @@ def load_manifest(path: Path) -> list[ExtractionManifestRow]:
 
     rows: list[ExtractionManifestRow] = []
     with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row_dict in reader:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return rows
+        # Older manifests may lack newer columns; their dataclass defaults apply.
+        columns = [(i, col) for i, col in enumerate(header) if col in MANIFEST_COLUMNS]
+        for values in reader:
+            record = {col: values[i] for i, col in columns if i < len(values)}
             # Convert numeric fields
-            for key in ["text_len"]:
-                if key in row_dict and row_dict[key]:
-                    row_dict[key] = int(row_dict[key])
-            for key in ["alpha_ratio", "cid_ratio", "whitespace_ratio"]:
-                if key in row_dict and row_dict[key]:
-                    row_dict[key] = float(row_dict[key])
+            for key in _INT_COLUMNS:
+                if record.get(key):
+                    record[key] = int(record[key])
+            for key in _FLOAT_COLUMNS:
+                if record.get(key):
+                    record[key] = float(record[key])
             # Handle empty optional strings
-            if row_dict.get("fail_reason", "") == "":
-                row_dict["fail_reason"] = None
-            rows.append(ExtractionManifestRow(**row_dict))
+            for key in _OPTIONAL_COLUMNS:
+                if record.get(key, "") == "":
+                    record[key] = None
+            rows.append(ExtractionManifestRow(**record))
     return rows
@@ -12,6 +12,15 @@ _QUOTE_MAP: dict[str, str] = {
     "\u00bb": '"',   # right guillemet
 }
 
+# NBSP and smart quotes, as a str.translate mapping
+_CHAR_REPLACEMENTS: dict[int, str] = {
+    ord("\u00a0"): " ",
+    **{ord(fancy): plain for fancy, plain in _QUOTE_MAP.items()},
+}
+
+# Control chars that survive normalization
+_KEEP_CONTROL = frozenset("\n\r\t")
+
 # Collapse runs of 3+ spaces (not newlines) to a single space
 _MULTI_SPACE = re.compile(r"[^\S\n]{3,}")
 
@@ -33,23 +42,16 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # 1. NBSP -> space
-    text = text.replace("\u00a0", " ")
-
-    # 2. Smart quotes -> ASCII
-    for fancy, plain in _QUOTE_MAP.items():
-        text = text.replace(fancy, plain)
-
-    # 3. Remove control chars (keep \n \r \t)
-    cleaned_chars = []
-    for ch in text:
-        if ch in ("\n", "\r", "\t"):
-            cleaned_chars.append(ch)
-        elif unicodedata.category(ch).startswith("C"):
-            continue  # skip control chars
-        else:
-            cleaned_chars.append(ch)
-    text = "".join(cleaned_chars)
+    # 1-3. NBSP -> space, smart quotes -> ASCII, drop control chars (keep \n \r \t).
+    # Only the distinct characters of this text are classified, then a single
+    # str.translate pass applies every substitution and deletion.
+    table: dict[int, str | None] = {
+        ord(ch): None
+        for ch in set(text)
+        if ch not in _KEEP_CONTROL and unicodedata.category(ch).startswith("C")
+    }
+    table.update(_CHAR_REPLACEMENTS)
+    text = text.translate(table)
 
     # 4. Collapse excessive inline whitespace
     text = _MULTI_SPACE.sub("  ", text)
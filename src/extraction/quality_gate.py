@@ -1,5 +1,6 @@
 """Deterministic extraction quality gate with tunable thresholds."""
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -11,7 +12,7 @@ MAX_CID_RATIO: float = 0.01
 MAX_CID_COUNT: int = 5
 MIN_ALPHA_RATIO: float = 0.55
 
-_CID_PATTERN = re.compile(r"\(cid:\d+\)")
+_CID_PATTERN = re.compile(r"\(cid:[0-9]+\)")
 
 
 @dataclass
@@ -35,8 +36,15 @@ def compute_metrics(text: str) -> dict:
             "cid_count": 0,
         }
 
-    alpha_count = sum(1 for c in text if c.isalpha())
-    whitespace_count = sum(1 for c in text if c.isspace())
+    # One C-level counting pass; the per-character predicates then run once
+    # per distinct character rather than once per character.
+    alpha_count = 0
+    whitespace_count = 0
+    for ch, n in Counter(text).items():
+        if ch.isalpha():
+            alpha_count += n
+        elif ch.isspace():
+            whitespace_count += n
     cid_matches = _CID_PATTERN.findall(text)
     cid_char_count = sum(len(m) for m in cid_matches)
 
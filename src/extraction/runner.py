@@ -1,21 +1,127 @@
 """Orchestrator for extraction QC pipeline."""
+import hashlib
 import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 
-from src.extraction.extractor import extract_text
-from src.extraction.manifest import ExtractionManifestRow, load_manifest, save_manifest
+from src.extraction.extractor import OCR_WORKERS, extract_text
+from src.extraction.manifest import (
+    ExtractionManifestRow,
+    append_manifest,
+    load_manifest,
+    save_manifest,
+)
 from src.extraction.normalize import normalize_text
 from src.extraction.quality_gate import evaluate
 
 logger = logging.getLogger(__name__)
 
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _sha256_file(path: Path) -> str:
+    """SHA-256 hex digest of a file, streamed in 1 MiB blocks."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _process_one(
+    pdf_path: Path,
+    output_dir: Path,
+    pdf_sha256: str | None = None,
+    ocr_workers: int | None = None,
+) -> ExtractionManifestRow:
+    """Extract, gate, normalize and write one PDF; return its manifest row.
+
+    Top-level and free of shared state so it can run in worker processes.
+    ``pdf_sha256`` is computed here when the caller has not already done so.
+    """
+    doc_id = pdf_path.stem
+    if pdf_sha256 is None:
+        pdf_sha256 = _sha256_file(pdf_path)
+
+    # 1. Extract
+    result = extract_text(pdf_path, ocr_workers=ocr_workers)
+
+    # Handle extraction error (all extractors failed)
+    if result.error and not result.text:
+        row = ExtractionManifestRow(
+            doc_id=doc_id,
+            pdf_path=str(pdf_path.name),
+            text_path="",
+            extractor_used=result.extractor_used,
+            text_len=0,
+            alpha_ratio=0.0,
+            cid_ratio=0.0,
+            whitespace_ratio=0.0,
+            extraction_status="EXTRACTION_FAILED",
+            fail_reason=f"EXTRACTOR_ERROR: {result.error}",
+            extracted_at=datetime.now(timezone.utc).isoformat(),
+            pdf_sha256=pdf_sha256,
+        )
+        logger.warning(f"{doc_id}: extraction error — {result.error}")
+        return row
+
+    # 2. Quality gate
+    qg = evaluate(result.text)
+
+    if not qg.valid:
+        row = ExtractionManifestRow(
+            doc_id=doc_id,
+            pdf_path=str(pdf_path.name),
+            text_path="",
+            extractor_used=result.extractor_used,
+            text_len=qg.metrics.get("text_len", 0),
+            alpha_ratio=qg.metrics.get("alpha_ratio", 0.0),
+            cid_ratio=qg.metrics.get("cid_ratio", 0.0),
+            whitespace_ratio=qg.metrics.get("whitespace_ratio", 0.0),
+            extraction_status="EXTRACTION_FAILED",
+            fail_reason=qg.fail_reason,
+            extracted_at=datetime.now(timezone.utc).isoformat(),
+            pdf_sha256=pdf_sha256,
+        )
+        logger.info(f"{doc_id}: FAILED — {qg.fail_reason}")
+        return row
+
+    # 3. Normalize and write
+    normalized = normalize_text(result.text)
+    text_rel = f"{doc_id}.txt"
+    text_path = output_dir / text_rel
+    text_path.write_text(normalized, encoding="utf-8")
+
+    row = ExtractionManifestRow(
+        doc_id=doc_id,
+        pdf_path=str(pdf_path.name),
+        text_path=text_rel,
+        extractor_used=result.extractor_used,
+        text_len=qg.metrics["text_len"],
+        alpha_ratio=qg.metrics["alpha_ratio"],
+        cid_ratio=qg.metrics["cid_ratio"],
+        whitespace_ratio=qg.metrics["whitespace_ratio"],
+        extraction_status="OK",
+        fail_reason=None,
+        extracted_at=datetime.now(timezone.utc).isoformat(),
+        pdf_sha256=pdf_sha256,
+    )
+    logger.info(f"{doc_id}: OK ({result.extractor_used}, {qg.metrics['text_len']} chars)")
+    return row
+
 
 def run_extraction_qc(
     pdf_dir: Path,
     output_dir: Path,
     manifest_path: Path,
     force: bool = False,
+    workers: int = 1,
+    ocr_workers: int | None = None,
 ) -> list[ExtractionManifestRow]:
     """Run extraction QC on all PDFs in a directory.
 
@@ -29,7 +135,15 @@ def run_extraction_qc(
         pdf_dir: Directory containing PDF files.
         output_dir: Directory for normalized text output.
         manifest_path: Path for extraction manifest CSV.
-        force: If True, reprocess even if already in manifest.
+        force: If True, re-extract every PDF, even if already in manifest.
+            Otherwise a new PDF whose SHA-256 matches an OK manifest row
+            (under any doc_id) with its text file still on disk reuses that
+            text instead of being re-extracted.
+        workers: Number of worker processes; PDFs are extracted in parallel
+            when greater than 1.
+        ocr_workers: Total pages OCR'd concurrently (default: ``OCR_WORKERS``).
+            With several worker processes each gets an equal share, so the
+            machine is not oversubscribed.
 
     Returns:
         List of all manifest rows (existing + new).
@@ -40,94 +154,77 @@ def run_extraction_qc(
     existing = load_manifest(manifest_path)
     existing_ids = {r.doc_id for r in existing}
 
-    pdfs = sorted(pdf_dir.glob("*.pdf"))
+    # One scandir pass; DirEntry.is_file() reuses the d_type from the listing.
+    pdfs: list[Path] = []
+    if pdf_dir.is_dir():
+        with os.scandir(pdf_dir) as entries:
+            pdfs = [Path(e.path) for e in entries if e.name.endswith(".pdf") and e.is_file()]
+        pdfs.sort(key=lambda p: p.name)
     if not pdfs:
         logger.warning(f"No PDFs found in {pdf_dir}")
         return existing
 
-    new_rows: list[ExtractionManifestRow] = []
-    skipped = 0
+    # OK rows whose text output is on disk, by PDF hash (renamed copies reuse them)
+    reusable = {} if force else {
+        r.pdf_sha256: r
+        for r in existing
+        if r.pdf_sha256 and r.text_path and (output_dir / r.text_path).exists()
+    }
 
+    skipped = 0
+    reused: list[ExtractionManifestRow] = []
+    todo: list[Path] = []
+    todo_hashes: list[str | None] = []
     for pdf_path in pdfs:
         doc_id = pdf_path.stem
-
         if not force and doc_id in existing_ids:
             skipped += 1
             continue
-
-        # 1. Extract
-        result = extract_text(pdf_path)
-
-        # Handle extraction error (all extractors failed)
-        if result.error and not result.text:
-            row = ExtractionManifestRow(
-                doc_id=doc_id,
-                pdf_path=str(pdf_path.name),
-                text_path="",
-                extractor_used=result.extractor_used,
-                text_len=0,
-                alpha_ratio=0.0,
-                cid_ratio=0.0,
-                whitespace_ratio=0.0,
-                extraction_status="EXTRACTION_FAILED",
-                fail_reason=f"EXTRACTOR_ERROR: {result.error}",
-                extracted_at=datetime.now(timezone.utc).isoformat(),
-            )
-            new_rows.append(row)
-            logger.warning(f"{doc_id}: extraction error — {result.error}")
-            continue
-
-        # 2. Quality gate
-        qg = evaluate(result.text)
-
-        if not qg.valid:
-            row = ExtractionManifestRow(
-                doc_id=doc_id,
-                pdf_path=str(pdf_path.name),
-                text_path="",
-                extractor_used=result.extractor_used,
-                text_len=qg.metrics.get("text_len", 0),
-                alpha_ratio=qg.metrics.get("alpha_ratio", 0.0),
-                cid_ratio=qg.metrics.get("cid_ratio", 0.0),
-                whitespace_ratio=qg.metrics.get("whitespace_ratio", 0.0),
-                extraction_status="EXTRACTION_FAILED",
-                fail_reason=qg.fail_reason,
-                extracted_at=datetime.now(timezone.utc).isoformat(),
-            )
-            new_rows.append(row)
-            logger.info(f"{doc_id}: FAILED — {qg.fail_reason}")
-            continue
-
-        # 3. Normalize and write
-        normalized = normalize_text(result.text)
-        text_rel = f"{doc_id}.txt"
-        text_path = output_dir / text_rel
-        text_path.write_text(normalized, encoding="utf-8")
-
-        row = ExtractionManifestRow(
-            doc_id=doc_id,
-            pdf_path=str(pdf_path.name),
-            text_path=text_rel,
-            extractor_used=result.extractor_used,
-            text_len=qg.metrics["text_len"],
-            alpha_ratio=qg.metrics["alpha_ratio"],
-            cid_ratio=qg.metrics["cid_ratio"],
-            whitespace_ratio=qg.metrics["whitespace_ratio"],
-            extraction_status="OK",
-            fail_reason=None,
-            extracted_at=datetime.now(timezone.utc).isoformat(),
-        )
-        new_rows.append(row)
-        logger.info(f"{doc_id}: OK ({result.extractor_used}, {qg.metrics['text_len']} chars)")
+        pdf_sha256 = None
+        if reusable:
+            pdf_sha256 = _sha256_file(pdf_path)
+            source = reusable.get(pdf_sha256)
+            if source is not None:
+                text_rel = f"{doc_id}.txt"
+                shutil.copyfile(output_dir / source.text_path, output_dir / text_rel)
+                reused.append(replace(
+                    source,
+                    doc_id=doc_id,
+                    pdf_path=pdf_path.name,
+                    text_path=text_rel,
+                    extracted_at=datetime.now(timezone.utc).isoformat(),
+                ))
+                logger.info(f"{doc_id}: reused text of {source.doc_id} (same sha256)")
+                continue
+        todo.append(pdf_path)
+        todo_hashes.append(pdf_sha256)
+
+    if workers > 1 and len(todo) > 1:
+        pool_size = min(workers, len(todo))
+        ocr_share = max(1, (ocr_workers or OCR_WORKERS) // pool_size)
+        # map() keeps results in sorted PDF order, so the manifest stays deterministic.
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            new_rows = list(pool.map(
+                _process_one, todo, repeat(output_dir), todo_hashes, repeat(ocr_share)
+            ))
+    else:
+        new_rows = [
+            _process_one(pdf_path, output_dir, pdf_sha256, ocr_workers)
+            for pdf_path, pdf_sha256 in zip(todo, todo_hashes)
+        ]
+    if reused:
+        new_rows = sorted(new_rows + reused, key=lambda r: r.pdf_path)
 
     # Merge: replace existing rows for reprocessed docs, keep others
     if force:
         new_ids = {r.doc_id for r in new_rows}
         merged = [r for r in existing if r.doc_id not in new_ids] + new_rows
+        save_manifest(merged, manifest_path)
     else:
+        # Only new doc_ids were processed: append them instead of rewriting
         merged = existing + new_rows
-
-    save_manifest(merged, manifest_path)
+        if new_rows:
+            append_manifest(new_rows, manifest_path)
 
     # Summary
     ok_count = sum(1 for r in merged if r.extraction_status == "OK")
@@ -136,7 +233,8 @@ def run_extraction_qc(
     logger.info("\n===== Extraction QC Summary =====")
     logger.info(f"  Total PDFs found   : {len(pdfs)}")
     logger.info(f"  Skipped (existing) : {skipped}")
-    logger.info(f"  Processed          : {len(new_rows)}")
+    logger.info(f"  Reused (sha256)    : {len(reused)}")
+    logger.info(f"  Processed          : {len(new_rows) - len(reused)}")
     logger.info(f"  OK                 : {ok_count}")
     logger.info(f"  EXTRACTION_FAILED  : {fail_count}")
 
@@ -1,7 +1,10 @@
-import re
+import string
 from datetime import datetime
 from src._legacy.incident import Incident
 
+# Characters allowed in a "Key:" prefix (ASCII letters and whitespace)
+_KEY_CHARS = frozenset(string.ascii_letters + string.whitespace)
+
 def load_incident_from_text(text: str) -> Incident:
     """
     Parses a raw text block into an Incident model.
@@ -32,10 +35,10 @@ def load_incident_from_text(text: str) -> Incident:
             continue
 
         # Check for Key: Value pattern
-        match = re.match(r'^([A-Za-z\s]+):\s*(.*)', line)
-        if match:
-            key = match.group(1).lower().strip()
-            value = match.group(2).strip()
+        key, sep, value = line.partition(':')
+        if sep and key and _KEY_CHARS.issuperset(key):
+            key = key.lower().strip()
+            value = value.strip()
             data[key] = value
             current_key = key
         elif current_key and current_key == 'description':
@@ -24,6 +24,8 @@ BSEE_PANEL_URL = (
 )
 
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
+# Download stream block size: fewer Python-level write/hash iterations per PDF
+DOWNLOAD_CHUNK_BYTES = 1 << 20
 
 
 def _slugify(text: str) -> str:
@@ -162,9 +164,10 @@ def download_bsee_pdf(
             size = 0
 
             with open(pdf_full_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    sha.update(chunk)
+                write, update = f.write, sha.update
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                    write(chunk)
+                    update(chunk)
                     size += len(chunk)
 
             return row.model_copy(
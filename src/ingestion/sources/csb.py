@@ -2,7 +2,8 @@
 import hashlib
 import logging
 import re
-from datetime import datetime, timezone
+from bisect import bisect_left
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Iterator, Optional
 from urllib.parse import urljoin
@@ -17,31 +18,68 @@ CSB_BASE_URL = "https://www.csb.gov"
 CSB_COMPLETED_URL = f"{CSB_BASE_URL}/investigations/completed-investigations/"
 
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
+# Download stream block size: fewer Python-level write/hash iterations per PDF
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# Patterns compiled once at import; reused for every listing and detail page.
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[-\s]+")
+_CTA_RE = re.compile(r"full\s+investigation\s+details", re.IGNORECASE | re.ASCII)
+_ROOT_HREF_RE = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
+_H3_CARD_RE = re.compile(
+    r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
+    re.DOTALL | re.IGNORECASE,
+)
+_PDF_HREF_RE = re.compile(r'href="([^"]+\.pdf)"')
+_PDF_KEYWORD_RE = re.compile(r"final|report|investigation", re.IGNORECASE)
+_FINAL_REPORT_DATE_RE = re.compile(
+    r"Final Report Released On:\s*</strong>\s*([0-9]{2}/[0-9]{2}/[0-9]{4})",
+    re.ASCII,
+)
+_ANY_DATE_RE = re.compile(r"(\w+ [0-9]{1,2}, [0-9]{4})", re.ASCII)
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_MONTH_NAME_FORMATS = ("%B %d, %Y", "%b %d, %Y")
 
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _SLUG_STRIP_RE.sub("", text)
+    text = _SLUG_SEP_RE.sub("-", text)
     return text[:50]
 
 
 def _parse_csb_date(date_str: str) -> Optional[str]:
-    """Parse CSB date format to YYYY-MM-DD."""
+    """Parse CSB date format to YYYY-MM-DD.
+
+    The separator picks the candidate format(s) up front, so at most the two
+    month-name variants are tried; zero-padded ISO dates skip strptime.
+    """
     if not date_str:
         return None
-    try:
-        for fmt in ["%B %d, %Y", "%b %d, %Y", "%m/%d/%Y", "%Y-%m-%d"]:
-            try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
-    except Exception:
+    date_str = date_str.strip()
+    if _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return date.fromisoformat(date_str).isoformat()
+        except ValueError:
+            return None
+
+    if "," in date_str:
+        formats = _MONTH_NAME_FORMATS
+    elif "/" in date_str:
+        formats = ("%m/%d/%Y",)
+    elif "-" in date_str:
+        formats = ("%Y-%m-%d",)
+    else:
         return None
 
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
 
 # Slugs that appear in root-level hrefs but are NOT investigation detail pages.
 _SLUG_DENYLIST = frozenset({
@@ -69,20 +107,25 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
 
     A deny-list filters out remaining non-incident slugs.
     """
-    cta_pattern = re.compile(r"full\s+investigation\s+details", re.IGNORECASE)
-    cta_positions = [m.start() for m in cta_pattern.finditer(html)]
+    cta_positions = [m.start() for m in _CTA_RE.finditer(html)]
 
-    href_pattern = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
     seen: set[str] = set()
     results: list[tuple[str, str]] = []
 
     if cta_positions:
-        # CTA-based extraction: look in a 2000-char window before each CTA
+        # CTA-based extraction: root-level hrefs in a 2000-char window before
+        # each CTA. The html is scanned for hrefs once; each window is then a
+        # bisect over the match offsets rather than a fresh regex scan.
+        href_matches = list(_ROOT_HREF_RE.finditer(html))
+        href_starts = [m.start() for m in href_matches]
         for pos in cta_positions:
             window_start = max(0, pos - 2000)
-            window = html[window_start:pos]
+            lo = bisect_left(href_starts, window_start)
+            hi = bisect_left(href_starts, pos)
 
-            for m in href_pattern.finditer(window):
+            for m in href_matches[lo:hi]:
+                if m.end() > pos:
+                    continue
                 path = m.group(1)
                 slug = path.strip("/")
 
@@ -100,11 +143,7 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
                 results.append((path, title))
     else:
         # Fallback: <h3>-based extraction (tests, alternative markup)
-        h3_pattern = re.compile(
-            r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
-            re.DOTALL | re.IGNORECASE,
-        )
-        for m in h3_pattern.finditer(html):
+        for m in _H3_CARD_RE.finditer(html):
             path = m.group(1)
             title = m.group(2).strip()
             slug = path.strip("/")
@@ -118,20 +157,25 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
     return results
 
 
-def discover_csb_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
+def discover_csb_incidents(
+    limit: int = 20, session: Optional[requests.Session] = None
+) -> Iterator[IncidentManifestRow]:
     """
     Scrape CSB completed investigations to discover incidents.
 
     Args:
         limit: Maximum number of incidents to discover.
+        session: Session to reuse (e.g. the one later used for PDF downloads),
+            so keep-alive connections to csb.gov are shared. A new session is
+            created if omitted.
 
     Yields:
         IncidentManifestRow objects with downloaded=False.
     """
-    session = requests.Session()
-    session.headers["User-Agent"] = USER_AGENT
+    if session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
 
-    pdf_pattern = r'href="([^"]+\.pdf)"'
     seen_ids: set[str] = set()
     count = 0
     page = 1
@@ -171,14 +215,11 @@ def discover_csb_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
                 try:
                     detail_resp = session.get(detail_url, timeout=30)
                     if detail_resp.status_code == 200:
-                        detail_pdfs = re.findall(pdf_pattern, detail_resp.text)
+                        detail_pdfs = _PDF_HREF_RE.findall(detail_resp.text)
                         # Look for "final report" or similar
                         pdf_url = None
                         for pdf_href in detail_pdfs:
-                            if any(
-                                kw in pdf_href.lower()
-                                for kw in ["final", "report", "investigation"]
-                            ):
+                            if _PDF_KEYWORD_RE.search(pdf_href):
                                 pdf_url = urljoin(CSB_BASE_URL, pdf_href)
                                 break
                         if not pdf_url and detail_pdfs:
@@ -186,15 +227,10 @@ def discover_csb_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
 
                         if pdf_url:
                             # Extract date if available
-                            date_match = re.search(
-                                r"Final Report Released On:\s*</strong>\s*(\d{2}/\d{2}/\d{4})",
-                                detail_resp.text,
-                            )
+                            date_match = _FINAL_REPORT_DATE_RE.search(detail_resp.text)
                             if not date_match:
                                 # Fallback to any date pattern
-                                date_match = re.search(
-                                    r"(\w+ \d{1,2}, \d{4})", detail_resp.text
-                                )
+                                date_match = _ANY_DATE_RE.search(detail_resp.text)
                             date_occurred = (
                                 _parse_csb_date(date_match.group(1))
                                 if date_match
@@ -278,9 +314,10 @@ def download_csb_pdf(
             size = 0
 
             with open(pdf_full_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    sha.update(chunk)
+                write, update = f.write, sha.update
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                    write(chunk)
+                    update(chunk)
                     size += len(chunk)
 
             return row.model_copy(
@@ -12,6 +12,8 @@ from urllib.parse import urljoin
 
 import requests
 
+from src.ingestion.sources.csb import _parse_csb_date
+
 logger = logging.getLogger(__name__)
 
 CSB_BASE_URL = "https://www.csb.gov"
@@ -33,18 +35,6 @@ def _slugify(text: str) -> str:
     return text[:80]
 
 
-def _parse_csb_date(date_str: str) -> Optional[str]:
-    """Parse CSB date formats to YYYY-MM-DD."""
-    if not date_str:
-        return None
-    for fmt in ["%B %d, %Y", "%b %d, %Y", "%m/%d/%Y", "%Y-%m-%d"]:
-        try:
-            return __import__("datetime").datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-    return None
-
-
 # ── HTML parsing (no network) ───────────────────────────────────────────
 
 
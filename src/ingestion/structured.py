@@ -2,17 +2,30 @@
 import csv
 import json
 import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from collections import Counter
 from typing import Any, Callable, Optional
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.llm.base import LLMProvider
-from src.models.incident_v23 import IncidentV23
+from src.llm.cache import ExtractionCache, cache_key
 from src.prompts.loader import load_prompt
-from src.validation.incident_validator import validate_incident_v23
+from src.validation.incident_validator import parse_incident_v23
 
 logger = logging.getLogger(__name__)
 
@@ -34,32 +47,42 @@ class StructuredManifestRow(BaseModel):
     raw_response_path: Optional[str] = None
 
 
+_MANIFEST_BOOL_KEYS = ("extracted", "valid")
+_MANIFEST_OPT_KEYS = ("model", "validation_errors", "error", "raw_response_path")
+
+
 def load_structured_manifest(path: Path) -> list[StructuredManifestRow]:
-    """Load structured extraction manifest from CSV."""
+    """Load structured extraction manifest from CSV.
+
+    Rows repeating an (incident_id, provider) key, as appended by
+    :class:`StructuredManifestWriter`, collapse to the last one.
+    """
     if not path.exists():
         return []
 
-    rows: list[StructuredManifestRow] = []
+    by_key: dict[tuple[str, str], StructuredManifestRow] = {}
     with open(path, "r", encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
         for row_dict in reader:
             # Convert string booleans
-            for key in ("extracted", "valid"):
+            for key in _MANIFEST_BOOL_KEYS:
                 if key in row_dict:
                     row_dict[key] = row_dict[key].lower() == "true"
             # Parse datetime
-            if "extracted_at" in row_dict and row_dict["extracted_at"]:
-                row_dict["extracted_at"] = datetime.fromisoformat(
-                    row_dict["extracted_at"]
+            if "extracted_at" in row_dict:
+                extracted_at = row_dict["extracted_at"]
+                row_dict["extracted_at"] = (
+                    datetime.fromisoformat(extracted_at) if extracted_at else None
                 )
-            elif "extracted_at" in row_dict:
-                row_dict["extracted_at"] = None
             # Handle empty optional strings → None
-            for key in ("model", "validation_errors", "error", "raw_response_path"):
-                if key in row_dict and row_dict[key] == "":
+            for key in _MANIFEST_OPT_KEYS:
+                if row_dict.get(key) == "":
                     row_dict[key] = None
-            rows.append(StructuredManifestRow(**row_dict))
-    return rows
+            # Values are already typed above and the file is our own format,
+            # so skip pydantic validation.
+            row = StructuredManifestRow.model_construct(**row_dict)
+            by_key[_manifest_key(row)] = row
+    return list(by_key.values())
 
 
 def _manifest_key(row: StructuredManifestRow) -> tuple[str, str]:
@@ -80,22 +103,88 @@ def merge_structured_manifests(
     return list(by_key.values())
 
 
+_MANIFEST_FIELDNAMES: list[str] = list(StructuredManifestRow.model_fields)
+
+
+def _manifest_csv_row(row: StructuredManifestRow) -> list[Any]:
+    """One manifest row as CSV values in ``_MANIFEST_FIELDNAMES`` order."""
+    return [
+        row.incident_id,
+        row.source_text_path,
+        row.output_json_path,
+        row.provider,
+        "" if row.model is None else row.model,
+        "True" if row.extracted else "False",
+        row.extracted_at.isoformat() if row.extracted_at else "",
+        "True" if row.valid else "False",
+        "" if row.validation_errors is None else row.validation_errors,
+        "" if row.error is None else row.error,
+        "" if row.raw_response_path is None else row.raw_response_path,
+    ]
+
+
 def save_structured_manifest(rows: list[StructuredManifestRow], path: Path) -> None:
     """Save structured extraction manifest to CSV."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = list(StructuredManifestRow.model_fields.keys())
 
     with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            row_dict = row.model_dump()
-            if row_dict["extracted_at"]:
-                row_dict["extracted_at"] = row_dict["extracted_at"].isoformat()
-            row_dict = {k: ("" if v is None else v) for k, v in row_dict.items()}
-            row_dict["extracted"] = str(row_dict["extracted"])
-            row_dict["valid"] = str(row_dict["valid"])
-            writer.writerow(row_dict)
+        writer = csv.writer(f)
+        writer.writerow(_MANIFEST_FIELDNAMES)
+        writer.writerows([_manifest_csv_row(row) for row in rows])
+
+
+class StructuredManifestWriter:
+    """Append manifest rows to CSV as they are finalised.
+
+    Used as a context manager during extraction so a crash loses at most the
+    rows since the last fsync. The header is written when the file is new;
+    a file with an outdated header is rewritten in the current layout first.
+    Rows for the same key may repeat; readers merge them (last one wins).
+
+    Args:
+        path: Manifest CSV to append to.
+        fsync_every: Force rows to disk after this many writes.
+    """
+
+    def __init__(self, path: Path, fsync_every: int = 10) -> None:
+        self.path = path
+        self.fsync_every = fsync_every
+        self._pending = 0
+
+    def __enter__(self) -> "StructuredManifestWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8", newline="") as f:
+                header = next(csv.reader(f), None)
+            if header is not None and header != _MANIFEST_FIELDNAMES:
+                save_structured_manifest(load_structured_manifest(self.path), self.path)
+
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(_MANIFEST_FIELDNAMES)
+        return self
+
+    def write(self, row: StructuredManifestRow) -> None:
+        """Append one row and flush it; fsync every ``fsync_every`` rows."""
+        self._writer.writerow(_manifest_csv_row(row))
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+
+_JSON_DECODER = json.JSONDecoder()
+# Whole lines whose stripped text starts with ``` (opening/closing fences)
+_FENCE_LINE_RE = re.compile(r"^[^\S\n]*```[^\n]*\n?", re.MULTILINE)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 def _parse_llm_json(raw: str) -> dict:
@@ -103,55 +192,278 @@ def _parse_llm_json(raw: str) -> dict:
 
     1. Try ``json.loads`` on the stripped response.
     2. Strip markdown fences and retry.
-    3. Extract the first ``{...}`` block via brace-matching and retry.
+    3. Decode the ``{...}`` object starting at the first ``{`` with
+       ``JSONDecoder.raw_decode``, ignoring surrounding prose.
 
     Raises:
         json.JSONDecodeError: If all strategies fail.
     """
     text = raw.strip()
 
-    # Strategy 1: direct parse
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # Strategy 1: direct parse, only when the text can start a JSON document
+    # of interest (fenced or prose-wrapped responses skip a doomed parse)
+    if text[:1] in ("{", "["):
+        try:
+            return _json_loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Strategy 2: strip markdown fences
     if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [ln for ln in lines if not ln.strip().startswith("```")]
         try:
-            return json.loads("\n".join(lines))
+            return _json_loads(_FENCE_LINE_RE.sub("", text))
         except json.JSONDecodeError:
             pass
 
-    # Strategy 3: extract first {...} block (brace-balanced)
+    # Strategy 3: the object starting at the first "{" (prose may follow).
+    # Later "{" are never tried: when the outer object is truncated they
+    # would yield a nested object that can pass as a whole incident.
     start = text.find("{")
     if start != -1:
-        depth = 0
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                depth += 1
-            elif text[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    candidate = text[start : i + 1]
-                    return json.loads(candidate)  # let it raise if still bad
+        return _JSON_DECODER.raw_decode(text, start)[0]  # let it raise if still bad
 
     raise json.JSONDecodeError("No JSON object found in LLM response", text, 0)
 
 
-def _save_raw_response(
-    raw: str, provider_name: str, incident_id: str, base_dir: Path,
-) -> Path:
-    """Persist the raw LLM response text and return the path."""
-    raw_dir = base_dir / "debug_llm_responses" / provider_name
-    raw_dir.mkdir(parents=True, exist_ok=True)
+def _dump_json_bytes(obj: Any) -> bytes:
+    """Serialise *obj* as 2-space-indented UTF-8 JSON.
+
+    Uses orjson when installed. Payloads it rejects (e.g. integers wider than
+    64 bits) fall back to the stdlib encoder, which also writes non-ASCII
+    characters as raw UTF-8 so the output does not depend on orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _save_raw_response(raw: str, incident_id: str, raw_dir: Path) -> Path:
+    """Persist the raw LLM response text and return the path.
+
+    *raw_dir* must already exist; extract_structured creates it once per run.
+    """
     raw_path = raw_dir / f"{incident_id}.txt"
-    raw_path.write_text(raw, encoding="utf-8")
+    raw_path.write_bytes(raw.encode("utf-8"))
     return raw_path
 
 
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at least ``60 / requests_per_minute`` apart."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self._interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is free, then claim it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _process_one(
+    txt_path: Path,
+    batch_response: Optional[str] = None,
+    *,
+    raw_dir: Path,
+    provider_out_dir: Path,
+    provider: Optional[LLMProvider],
+    provider_name: str,
+    model_name: Optional[str],
+    text_limit: int,
+    _ladder_fn: Optional[Callable],
+    limiter: Optional[_RateLimiter],
+    cache: Optional[ExtractionCache] = None,
+) -> StructuredManifestRow:
+    """Extract one text file and return its manifest row; never raises.
+
+    A cached response (when *cache* is set) or a *batch_response* already
+    fetched via ``provider.extract_batch`` is used when it parses as JSON;
+    otherwise the file goes through the synchronous ladder or provider path
+    as usual.
+    """
+    incident_id = txt_path.stem
+    json_path = provider_out_dir / f"{incident_id}.json"
+
+    row = StructuredManifestRow(
+        incident_id=incident_id,
+        source_text_path=str(txt_path),
+        output_json_path=str(json_path),
+        provider=provider_name,
+        model=model_name,
+    )
+
+    try:
+        text = txt_path.read_text(encoding="utf-8")
+        if not text.strip():
+            row.error = "Empty text file"
+            return row
+
+        # Optional text truncation (mirrors corpus-extract --text-limit)
+        if text_limit > 0 and len(text) > text_limit:
+            logger.info(
+                f"{incident_id}: text truncated {len(text)} → {text_limit} chars"
+            )
+            text = text[:text_limit]
+
+        # Assemble prompt
+        prompt = load_prompt(text)
+
+        # ── Extraction: ladder path or single-provider path ───────────────
+        payload: Optional[dict] = None
+        # Raw text of a freshly fetched, parseable response (cache write-back)
+        fresh_raw: Optional[str] = None
+
+        key = ""
+        if cache is not None:
+            key = cache_key(provider_name, model_name, prompt)
+            cached = cache.get(key)
+            if cached is not None:
+                try:
+                    payload = _parse_llm_json(cached["raw"])
+                    row.model = cached.get("model") or row.model
+                    logger.info(f"{incident_id}: cache hit")
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    payload = None
+
+        if payload is None and batch_response is not None:
+            raw_path = _save_raw_response(batch_response, incident_id, raw_dir)
+            row.raw_response_path = str(raw_path)
+            try:
+                payload = _parse_llm_json(batch_response)
+                fresh_raw = batch_response
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    f"{incident_id}: batch response not JSON ({e}), re-requesting"
+                )
+
+        if payload is None and _ladder_fn is not None:
+            # Policy-driven model ladder — hard safety net, never raises
+            try:
+                if limiter is not None:
+                    limiter.wait()
+                data, _truncated, model_used = _ladder_fn(incident_id, prompt)
+                row.model = model_used
+                payload = data
+                if data is not None:
+                    fresh_raw = json.dumps(data)
+            except Exception as exc:
+                logger.error(
+                    f"{incident_id}: ladder raised unexpected error — {exc}"
+                )
+                payload = None
+
+            if payload is None:
+                error_payload = {
+                    "incident_id": incident_id,
+                    "errors": ["ladder: all models failed or raised error"],
+                }
+                json_path.write_bytes(_dump_json_bytes(error_payload))
+                row.extracted = True
+                row.extracted_at = datetime.now(timezone.utc)
+                row.valid = False
+                row.validation_errors = "ladder: all models failed"
+                logger.warning(f"{incident_id}: ladder failed — recorded in manifest")
+                return row
+
+        elif payload is None:
+            # Single-provider path (backward-compatible)
+            if limiter is not None:
+                limiter.wait()
+            raw_response = provider.extract(prompt)  # type: ignore[union-attr]
+
+            # Save raw response
+            raw_path = _save_raw_response(raw_response, incident_id, raw_dir)
+            row.raw_response_path = str(raw_path)
+
+            # Parse JSON from response (with one retry on parse failure)
+            parse_err = None
+            for _parse_attempt in range(2):
+                try:
+                    payload = _parse_llm_json(raw_response)
+                    fresh_raw = raw_response
+                    break
+                except json.JSONDecodeError as e:
+                    parse_err = e
+                    if _parse_attempt == 0:
+                        logger.warning(
+                            f"{incident_id}: JSON parse failed, retrying with full prompt"
+                        )
+                        _STRICT_SUFFIX = (
+                            "\n\nCRITICAL: Return ONLY a single valid JSON object. "
+                            "No prose, no markdown fences, no explanation."
+                        )
+                        try:
+                            if limiter is not None:
+                                limiter.wait()
+                            raw_response = provider.extract(  # type: ignore[union-attr]
+                                prompt + _STRICT_SUFFIX
+                            )
+                            raw_path = _save_raw_response(
+                                raw_response, incident_id, raw_dir,
+                            )
+                            row.raw_response_path = str(raw_path)
+                        except Exception:
+                            break  # retry failed, fall through
+
+            if payload is None:
+                error_payload = {
+                    "incident_id": incident_id,
+                    "errors": [f"JSON parse error: {parse_err}"],
+                    "raw": raw_response[:2000],
+                }
+                json_path.write_bytes(_dump_json_bytes(error_payload))
+                row.extracted = True
+                row.extracted_at = datetime.now(timezone.utc)
+                row.valid = False
+                row.validation_errors = f"JSON parse error: {parse_err}"
+                logger.warning(f"{incident_id}: JSON parse failed: {parse_err}")
+                return row
+
+        # ── Both paths converge here with payload set ─────────────────────
+        if cache is not None and fresh_raw is not None:
+            cache.put(key, fresh_raw, provider_name, row.model)
+
+        # Override incident_id with filename-based ID
+        payload["incident_id"] = incident_id
+
+        # Validate; a valid model is dumped directly below
+        model, errors = parse_incident_v23(payload)
+        is_valid = model is not None
+        row.valid = is_valid
+        row.extracted = True
+        row.extracted_at = datetime.now(timezone.utc)
+
+        if not is_valid:
+            row.validation_errors = "; ".join(errors[:5])  # Cap at 5 errors
+            logger.warning(f"{incident_id}: validation failed: {errors[:3]}")
+            payload["_validation_errors"] = errors
+
+        # Dump the validated model to fill in all defaults/missing sections;
+        # an invalid payload is written as-is
+        out_payload = model.model_dump(mode="json") if model is not None else payload
+
+        # Preserve validation errors in output for debugging
+        if "_validation_errors" in payload:
+            out_payload["_validation_errors"] = payload["_validation_errors"]
+
+        json_path.write_bytes(_dump_json_bytes(out_payload))
+        logger.info(f"{incident_id}: extracted (valid={is_valid})")
+
+    except Exception as e:
+        row.error = str(e)[:200]
+        logger.error(f"{incident_id}: extraction failed: {e}")
+
+    return row
+
+
 def extract_structured(
     text_dir: Path,
     out_dir: Path,
@@ -162,6 +474,11 @@ def extract_structured(
     resume: bool = False,
     text_limit: int = 0,
     _ladder_fn: Optional[Callable] = None,
+    concurrency: int = 1,
+    requests_per_minute: Optional[int] = None,
+    use_batch_api: bool = False,
+    cache_dir: Optional[Path] = None,
+    manifest_path: Optional[Path] = None,
 ) -> list[StructuredManifestRow]:
     """Run structured extraction on all .txt files in text_dir.
 
@@ -179,188 +496,118 @@ def extract_structured(
             ``(incident_id, prompt, *, policy_path) -> (dict|None, bool, str|None)``.
             When set, replaces the single-provider extraction path with a
             multi-model ladder; every file still produces a manifest row.
+        concurrency: Number of files extracted in parallel. LLM calls are
+            network-bound, so threads overlap the request latency. Values
+            above 1 require *requests_per_minute*.
+        requests_per_minute: Cap on LLM requests started per minute across
+            all threads. ``0`` explicitly opts out of the cap; None leaves it
+            uncapped only for sequential runs.
+        use_batch_api: Send every prompt up front through
+            ``provider.extract_batch`` (e.g. the Anthropic Message Batches
+            API), then validate and write in a second pass. Responses that
+            are missing or unparseable fall back to the per-file path.
+        cache_dir: Optional directory for an :class:`ExtractionCache` of raw
+            responses keyed by provider, model and prompt; hits skip the
+            LLM call entirely (None = no caching).
+        manifest_path: Optional manifest CSV that each row is appended to as
+            soon as its file finishes (see :class:`StructuredManifestWriter`),
+            so an interrupted run keeps its progress.
 
     Returns:
-        List of manifest rows tracking extraction results.
+        List of manifest rows tracking extraction results, in file order.
+
+    Raises:
+        ValueError: If *concurrency* is above 1 and *requests_per_minute* is None.
     """
+    if concurrency > 1 and requests_per_minute is None:
+        raise ValueError(
+            "concurrency > 1 requires requests_per_minute (0 = explicitly unlimited)"
+        )
+
     provider_out_dir = out_dir / provider_name
     provider_out_dir.mkdir(parents=True, exist_ok=True)
-    rows: list[StructuredManifestRow] = []
+    # Raw responses are saved by the provider and batch paths, not the ladder
+    raw_dir = out_dir.parent / "debug_llm_responses" / provider_name
+    if _ladder_fn is None or use_batch_api:
+        raw_dir.mkdir(parents=True, exist_ok=True)
 
     # Scan directory and all subdirectories for .txt files
     txt_files = sorted(text_dir.rglob("*.txt"))
     if not txt_files:
         logger.warning(f"No .txt files found in {text_dir} (checked subdirs too)")
-        return rows
+        return []
 
     logger.info(f"Processing {len(txt_files)} text files with provider={provider_name}")
 
-    processed = 0
+    todo: list[Path] = []
     for txt_path in txt_files:
         incident_id = txt_path.stem
-        json_path = provider_out_dir / f"{incident_id}.json"
 
         # Resume: skip already-extracted files
-        if resume and json_path.exists():
+        if resume and (provider_out_dir / f"{incident_id}.json").exists():
             logger.info(f"{incident_id}: already extracted, skipping (--resume)")
             continue
 
         # Limit guard
-        if limit is not None and processed >= limit:
+        if limit is not None and len(todo) >= limit:
             logger.info(f"Reached --limit={limit}, stopping.")
             break
 
-        row = StructuredManifestRow(
-            incident_id=incident_id,
-            source_text_path=str(txt_path),
-            output_json_path=str(json_path),
-            provider=provider_name,
-            model=model_name,
-        )
-
-        try:
-            text = txt_path.read_text(encoding="utf-8")
-            if not text.strip():
-                row.error = "Empty text file"
-                rows.append(row)
-                processed += 1
-                continue
-
-            # Optional text truncation (mirrors corpus-extract --text-limit)
-            if text_limit > 0 and len(text) > text_limit:
-                logger.info(
-                    f"{incident_id}: text truncated {len(text)} → {text_limit} chars"
-                )
-                text = text[:text_limit]
-
-            # Assemble prompt
-            prompt = load_prompt(text)
-
-            # ── Extraction: ladder path or single-provider path ───────────────
-            payload: Optional[dict] = None
+        todo.append(txt_path)
 
-            if _ladder_fn is not None:
-                # Policy-driven model ladder — hard safety net, never raises
-                try:
-                    data, _truncated, model_used = _ladder_fn(incident_id, prompt)
-                    row.model = model_used
-                    payload = data
-                except Exception as exc:
-                    logger.error(
-                        f"{incident_id}: ladder raised unexpected error — {exc}"
-                    )
-                    payload = None
+    cache = ExtractionCache(cache_dir) if cache_dir is not None else None
 
-                if payload is None:
-                    error_payload = {
-                        "incident_id": incident_id,
-                        "errors": ["ladder: all models failed or raised error"],
-                    }
-                    json_path.write_text(
-                        json.dumps(error_payload, indent=2), encoding="utf-8"
-                    )
-                    row.extracted = True
-                    row.extracted_at = datetime.now(timezone.utc)
-                    row.valid = False
-                    row.validation_errors = "ladder: all models failed"
-                    rows.append(row)
-                    processed += 1
-                    logger.warning(f"{incident_id}: ladder failed — recorded in manifest")
-                    continue
-
-            else:
-                # Single-provider path (backward-compatible)
-                raw_response = provider.extract(prompt)  # type: ignore[union-attr]
-
-                # Save raw response
-                raw_path = _save_raw_response(
-                    raw_response, provider_name, incident_id, out_dir.parent,
-                )
-                row.raw_response_path = str(raw_path)
-
-                # Parse JSON from response (with one retry on parse failure)
-                parse_err = None
-                for _parse_attempt in range(2):
-                    try:
-                        payload = _parse_llm_json(raw_response)
-                        break
-                    except json.JSONDecodeError as e:
-                        parse_err = e
-                        if _parse_attempt == 0:
-                            logger.warning(
-                                f"{incident_id}: JSON parse failed, retrying with full prompt"
-                            )
-                            _STRICT_SUFFIX = (
-                                "\n\nCRITICAL: Return ONLY a single valid JSON object. "
-                                "No prose, no markdown fences, no explanation."
-                            )
-                            try:
-                                raw_response = provider.extract(  # type: ignore[union-attr]
-                                    prompt + _STRICT_SUFFIX
-                                )
-                                raw_path = _save_raw_response(
-                                    raw_response, provider_name, incident_id,
-                                    out_dir.parent,
-                                )
-                                row.raw_response_path = str(raw_path)
-                            except Exception:
-                                break  # retry failed, fall through
-
-                if payload is None:
-                    error_payload = {
-                        "incident_id": incident_id,
-                        "errors": [f"JSON parse error: {parse_err}"],
-                        "raw": raw_response[:2000],
-                    }
-                    json_path.write_text(
-                        json.dumps(error_payload, indent=2), encoding="utf-8",
-                    )
-                    row.extracted = True
-                    row.extracted_at = datetime.now(timezone.utc)
-                    row.valid = False
-                    row.validation_errors = f"JSON parse error: {parse_err}"
-                    rows.append(row)
-                    processed += 1
-                    logger.warning(f"{incident_id}: JSON parse failed: {parse_err}")
-                    continue
-
-            # ── Both paths converge here with payload set ─────────────────────
-            # Override incident_id with filename-based ID
-            payload["incident_id"] = incident_id
-
-            # Validate
-            is_valid, errors = validate_incident_v23(payload)
-            row.valid = is_valid
-            row.extracted = True
-            row.extracted_at = datetime.now(timezone.utc)
-
-            if not is_valid:
-                row.validation_errors = "; ".join(errors[:5])  # Cap at 5 errors
-                logger.warning(f"{incident_id}: validation failed: {errors[:3]}")
-                payload["_validation_errors"] = errors
-
-            # Round-trip through model to fill in all defaults/missing sections
+    batch_responses: dict[Path, str] = {}
+    if use_batch_api and todo:
+        prompts: dict[Path, str] = {}
+        for txt_path in todo:
             try:
-                model = IncidentV23.model_validate(payload)
-                out_payload = model.model_dump(mode="json")
-            except Exception:
-                # If model_validate fails, fall back to raw payload
-                out_payload = payload
-
-            # Preserve validation errors in output for debugging
-            if "_validation_errors" in payload:
-                out_payload["_validation_errors"] = payload["_validation_errors"]
-
-            json_path.write_text(json.dumps(out_payload, indent=2), encoding="utf-8")
-            logger.info(f"{incident_id}: extracted (valid={is_valid})")
-
-        except Exception as e:
-            row.error = str(e)[:200]
-            logger.error(f"{incident_id}: extraction failed: {e}")
-
-        rows.append(row)
-        processed += 1
+                text = txt_path.read_text(encoding="utf-8")
+            except OSError:
+                continue  # reported by _process_one
+            if not text.strip():
+                continue
+            prompt = load_prompt(text[:text_limit] if text_limit > 0 else text)
+            if cache is None or cache.get(cache_key(provider_name, model_name, prompt)) is None:
+                prompts[txt_path] = prompt
+        logger.info(f"Submitting {len(prompts)} prompts via batch API")
+        responses = provider.extract_batch(list(prompts.values()))  # type: ignore[union-attr]
+        batch_responses = {
+            path: raw for path, raw in zip(prompts, responses) if raw is not None
+        }
+
+    process = partial(
+        _process_one,
+        raw_dir=raw_dir,
+        provider_out_dir=provider_out_dir,
+        provider=provider,
+        provider_name=provider_name,
+        model_name=model_name,
+        text_limit=text_limit,
+        _ladder_fn=_ladder_fn,
+        limiter=_RateLimiter(requests_per_minute) if requests_per_minute else None,
+        cache=cache,
+    )
+    prefetched = [batch_responses.get(p) for p in todo]
+    rows: list[StructuredManifestRow] = []
+    with ExitStack() as stack:
+        if concurrency <= 1 or len(todo) <= 1:
+            results = map(process, todo, prefetched)
+        else:
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=min(concurrency, len(todo)))
+            )
+            # map() yields in submission order, so the manifest stays deterministic.
+            results = pool.map(process, todo, prefetched)
 
+        writer = (
+            stack.enter_context(StructuredManifestWriter(manifest_path))
+            if manifest_path is not None else None
+        )
+        for row in results:
+            rows.append(row)
+            if writer is not None:
+                writer.write(row)
     return rows
 
 
@@ -376,22 +623,25 @@ def generate_run_report(
         and top validation error prefixes.
     """
     total = len(rows)
-    extracted = sum(1 for r in rows if r.extracted)
-    valid = sum(1 for r in rows if r.valid)
-    invalid = sum(1 for r in rows if r.extracted and not r.valid)
-    parse_failed = sum(
-        1 for r in rows
-        if r.validation_errors and r.validation_errors.startswith("JSON parse error")
-    )
-    errored = sum(1 for r in rows if r.error and not r.extracted)
-
+    extracted = valid = invalid = parse_failed = errored = 0
     # Top validation errors by message prefix (first 60 chars)
     error_counter: Counter[str] = Counter()
+
+    # Single pass over the manifest for every count
     for r in rows:
-        if r.validation_errors:
-            for msg in r.validation_errors.split("; "):
-                prefix = msg[:60]
-                error_counter[prefix] += 1
+        if r.extracted:
+            extracted += 1
+            if not r.valid:
+                invalid += 1
+        elif r.error:
+            errored += 1
+        if r.valid:
+            valid += 1
+        validation_errors = r.validation_errors
+        if validation_errors:
+            if validation_errors.startswith("JSON parse error"):
+                parse_failed += 1
+            error_counter.update(msg[:60] for msg in validation_errors.split("; "))
 
     return {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -418,7 +668,12 @@ def compute_quality_gate(incident_dir: Path) -> dict[str, Any]:
         Dict with counts, percentages, and controls_count distribution
         (min, p50, p90, max).
     """
-    json_files = sorted(incident_dir.glob("*.json"))
+    # Every metric is an order-independent aggregate, so skip sorting; scandir
+    # reports entry types from the directory read without a stat per file.
+    if not incident_dir.is_dir():
+        return {"total": 0}
+    with os.scandir(incident_dir) as it:
+        json_files = [e.path for e in it if e.name.endswith(".json") and e.is_file()]
     total = len(json_files)
     if total == 0:
         return {"total": 0}
@@ -433,8 +688,9 @@ def compute_quality_gate(incident_dir: Path) -> dict[str, Any]:
 
     for jp in json_files:
         try:
-            data = json.loads(jp.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            with open(jp, "rb") as f:
+                data = _json_loads(f.read())
+        except (ValueError, OSError):  # JSONDecodeError / bad UTF-8 / unreadable
             continue
 
         bt = data.get("bowtie", {})
@@ -468,15 +724,14 @@ def compute_quality_gate(incident_dir: Path) -> dict[str, Any]:
     def _pct(n: int) -> float:
         return round(n / total * 100, 1)
 
-    def _percentile(data: list[int], pct: float) -> float:
-        """Compute percentile without numpy."""
-        if not data:
-            return 0.0
-        s = sorted(data)
-        k = (len(s) - 1) * pct / 100.0
-        f = int(k)
-        c = f + 1 if f + 1 < len(s) else f
-        return s[f] + (k - f) * (s[c] - s[f])
+    # One vectorised pass for the distribution (linear interpolation, as before)
+    if controls_counts:
+        counts = np.asarray(controls_counts, dtype=np.int64)
+        p50, p90 = np.percentile(counts, [50, 90])
+        cmin, cmax = int(counts.min()), int(counts.max())
+    else:
+        p50 = p90 = 0.0
+        cmin = cmax = 0
 
     return {
         "total": total,
@@ -492,8 +747,8 @@ def compute_quality_gate(incident_dir: Path) -> dict[str, Any]:
         "has_threats_pct": _pct(has_threats),
         "has_consequences": has_consequences,
         "has_consequences_pct": _pct(has_consequences),
-        "controls_count_min": min(controls_counts) if controls_counts else 0,
-        "controls_count_p50": round(_percentile(controls_counts, 50), 1),
-        "controls_count_p90": round(_percentile(controls_counts, 90), 1),
-        "controls_count_max": max(controls_counts) if controls_counts else 0,
+        "controls_count_min": cmin,
+        "controls_count_p50": round(float(p50), 1),
+        "controls_count_p90": round(float(p90), 1),
+        "controls_count_max": cmax,
     }
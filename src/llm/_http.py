@@ -0,0 +1,186 @@
+"""Shared HTTP session and retry loop for LLM providers.
+
+Providers are created per model and, on the ladder path, per incident, so a
+session owned by each instance would still reconnect on almost every call.
+One module-level session keeps TCP/TLS connections alive across instances
+and threads. Retries are done by :func:`request_with_retry` rather than the
+adapter (``max_retries=0``) so back-off can honour ``retry-after`` and jitter.
+"""
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0),
+)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_BACKOFF_SECONDS = 30
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+_prewarmed: set[str] = set()
+_prewarm_lock = threading.Lock()
+
+
+def prewarm(url: str) -> Optional[threading.Thread]:
+    """Open a pooled connection to *url* in the background, once per process.
+
+    Sends a HEAD request from a daemon thread so DNS, TCP and TLS setup are
+    done before the first real request, which then reuses the idle
+    keep-alive connection. The response and any error are ignored.
+
+    Returns:
+        The started thread, or None if *url* was already warmed.
+    """
+    with _prewarm_lock:
+        if url in _prewarmed:
+            return None
+        _prewarmed.add(url)
+    thread = threading.Thread(target=_warm, args=(url,), name="llm-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm(url: str) -> None:
+    try:
+        SESSION.head(url, timeout=5)
+    except requests.RequestException:
+        pass
+
+
+def backoff(attempt: int) -> float:
+    """Exponential back-off for *attempt* (0-based), capped at 30s, with up to 25% jitter."""
+    base = min(2 ** attempt, _MAX_BACKOFF_SECONDS)
+    return base + random.uniform(0, base / 4)
+
+
+def retry_after(resp: requests.Response) -> Optional[float]:
+    """Seconds from a numeric ``retry-after`` header, or None if absent/unparseable."""
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form; fall back to back-off
+
+
+def request_with_retry(
+    session: requests.Session,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    body: Optional[bytes],
+    timeout: float,
+    retries: int,
+    *,
+    provider_name: str,
+    logger: logging.Logger,
+    json_response: bool = True,
+) -> tuple[Any, int]:
+    """Send a *method* (``"GET"``/``"POST"``) request, retrying 429/5xx and transport errors.
+
+    A numeric ``retry-after`` header (``0`` included) sets the delay after a
+    retryable status, capped at 30s; otherwise :func:`backoff` does. A 200
+    body that is not valid JSON (with *json_response*) is retried like a
+    transport error. *provider_name* (e.g. ``"Anthropic"``) prefixes log and
+    error messages.
+
+    Returns:
+        The decoded JSON response (the raw response when *json_response* is
+        False) and the latency of the successful attempt in milliseconds.
+
+    Raises:
+        RuntimeError: On a non-retryable status or once retries are exhausted.
+    """
+    send = getattr(session, method.lower())
+    last_err: Optional[Exception] = None
+    attempts = 1 + retries
+
+    for attempt in range(attempts):
+        t0 = time.monotonic_ns()
+        try:
+            resp = send(url, headers=headers, data=body, timeout=timeout)
+            latency_ms = (time.monotonic_ns() - t0 + 500_000) // 1_000_000  # nearest ms
+
+            if resp.status_code == 200:
+                if not json_response:
+                    return resp, latency_ms
+                try:
+                    return _loads(resp.content), latency_ms
+                except ValueError as exc:
+                    # Same handling as resp.json(): treated as a request error
+                    raise requests.exceptions.InvalidJSONError(
+                        f"Invalid JSON in {provider_name} response: {exc}"
+                    ) from exc
+
+            if resp.status_code in RETRYABLE_STATUS_CODES and attempt < attempts - 1:
+                server_delay = retry_after(resp)
+                delay = (
+                    backoff(attempt) if server_delay is None
+                    else min(server_delay, _MAX_BACKOFF_SECONDS)
+                )
+                logger.warning(
+                    "%s API %s (attempt %d/%d), retrying in %.1fs …",
+                    provider_name, resp.status_code, attempt + 1, attempts, delay,
+                )
+                time.sleep(delay)
+                last_err = RuntimeError(
+                    f"{provider_name} API returned {resp.status_code}: {resp.text[:300]}"
+                )
+                continue
+
+            raise RuntimeError(
+                f"{provider_name} API returned {resp.status_code}: {resp.text[:500]}"
+            )
+
+        except requests.RequestException as exc:
+            last_err = exc
+            if attempt < attempts - 1:
+                delay = backoff(attempt)
+                logger.warning(
+                    "%s request error (attempt %d/%d): %s, retrying in %.1fs …",
+                    provider_name, attempt + 1, attempts, exc, delay,
+                )
+                time.sleep(delay)
+                continue
+            raise RuntimeError(
+                f"{provider_name} request failed after {attempts} attempts: {exc}"
+            ) from exc
+
+    raise RuntimeError(
+        f"{provider_name} request failed after {attempts} attempts: {last_err}"
+    )
+
+
+
+def post_with_retry(
+    session: requests.Session,
+    url: str,
+    headers: dict[str, str],
+    body: bytes,
+    timeout: float,
+    retries: int,
+    *,
+    provider_name: str,
+    logger: logging.Logger,
+) -> tuple[dict[str, Any], int]:
+    """POST *body* to *url* via :func:`request_with_retry`; return (JSON, latency_ms)."""
+    return request_with_retry(
+        session, "POST", url, headers, body, timeout, retries,
+        provider_name=provider_name, logger=logger,
+    )
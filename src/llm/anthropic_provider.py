@@ -1,18 +1,37 @@
 """Anthropic Messages API provider (HTTP, no SDK dependency)."""
+import json
 import logging
 import os
 import time
 from typing import Any, Optional
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+from src.llm._http import SESSION, post_with_retry, prewarm, request_with_retry
 from src.llm.base import LLMProvider
+from src.llm.cache import ResponseCache, cache_key, normalize_prompt
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 _API_URL = "https://api.anthropic.com/v1/messages"
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+_BATCHES_URL = "https://api.anthropic.com/v1/messages/batches"
+# Message Batches API limits per batch
+_MAX_BATCH_REQUESTS = 100_000
+_MAX_BATCH_BYTES = 256 * 1024 * 1024
+
+
+def _dumps(body: dict[str, Any]) -> bytes:
+    """Encode a request body as UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 class AnthropicProvider(LLMProvider):
@@ -25,6 +44,15 @@ class AnthropicProvider(LLMProvider):
         temperature: Sampling temperature.
         timeout: Per-request timeout in seconds.
         retries: Number of retries on transient (429 / 5xx) failures.
+        batch_poll_interval: Seconds between status polls in :meth:`extract_batch`.
+        cache: Optional :class:`ResponseCache`; identical requests (model,
+            temperature, max tokens, prompt) are answered from it. Prompts
+            match only when equal after whitespace normalization (see
+            :func:`normalize_prompt`); paraphrased or otherwise semantically
+            equivalent prompts are separate entries. Only
+            complete (``end_turn``) responses are stored. None (default)
+            disables caching; persisting entries is opt-in via
+            ``ResponseCache(disk=...)``.
     """
 
     def __init__(
@@ -35,6 +63,8 @@ class AnthropicProvider(LLMProvider):
         temperature: float = 0.0,
         timeout: int = 120,
         retries: int = 2,
+        batch_poll_interval: float = 30.0,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         if not self.api_key:
@@ -46,6 +76,17 @@ class AnthropicProvider(LLMProvider):
         self.temperature = temperature
         self.timeout = timeout
         self.retries = retries
+        self.batch_poll_interval = batch_poll_interval
+        self.cache = cache
+
+        # Pooled keep-alive session shared by all provider instances
+        self._session = SESSION
+        prewarm(_API_URL)
+        self._headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        }
 
         # Populated after each extract() call
         self.last_meta: dict[str, Any] = {}
@@ -53,83 +94,160 @@ class AnthropicProvider(LLMProvider):
     def extract(self, prompt: str) -> str:
         """Send *prompt* to the Anthropic Messages API and return the raw text.
 
-        Retries on 429 and 5xx with exponential back-off (1s, 2s, 4s …).
+        Retries on 429 and 5xx with exponential back-off (1s, 2s, 4s …,
+        capped at 30s) plus up to 25% random jitter, so concurrent workers
+        do not retry in lockstep. A numeric ``retry-after`` header takes precedence.
         """
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "Content-Type": "application/json",
+        key = ""
+        if self.cache is not None:
+            # Whitespace-only differences (re-wrapped or re-extracted text)
+            # cannot change the answer, so they share a cache entry. There is
+            # no similarity matching: near-identical prompts for different
+            # incidents must never share an answer.
+            key = cache_key(
+                "anthropic", self.model, self.temperature, self.max_output_tokens,
+                normalize_prompt(prompt),
+            )
+            cached = self.cache.lookup(key)
+            if cached is not None:
+                # Only end_turn responses are cached, so callers checking
+                # for truncation see the same stop_reason as the original call.
+                self.last_meta = {
+                    "provider": "anthropic",
+                    "model": self.model,
+                    "latency_ms": 0,
+                    "usage": None,
+                    "stop_reason": "end_turn",
+                    "cache_hit": True,
+                }
+                return cached
+
+        data, latency_ms = post_with_retry(
+            self._session,
+            _API_URL,
+            self._headers,
+            _dumps(self._message_params(prompt)),
+            self.timeout,
+            self.retries,
+            provider_name="Anthropic",
+            logger=logger,
+        )
+        raw_text = self._extract_text(data)
+        self.last_meta = {
+            "provider": "anthropic",
+            "model": self.model,
+            "latency_ms": latency_ms,
+            "usage": data.get("usage"),
+            "stop_reason": data.get("stop_reason"),
         }
-        body = {
+        if self.cache is not None and data.get("stop_reason") == "end_turn":
+            self.cache.update(key, raw_text, provider="anthropic", model=self.model)
+        return raw_text
+
+    def extract_batch(self, prompts: list[str]) -> list[Optional[str]]:
+        """Run *prompts* through the Message Batches API.
+
+        Prompts are split into batches within the API's per-batch limits
+        (``_MAX_BATCH_REQUESTS`` requests, ``_MAX_BATCH_BYTES`` of request
+        body). All batches are submitted first, then each is polled every
+        ``batch_poll_interval`` seconds until processing has ended and its
+        JSONL results are downloaded. Submit, poll and download requests
+        retry like :meth:`extract`. Batches are billed at a discount but may
+        take up to 24 hours to complete.
+
+        Returns:
+            Raw response text per prompt, in prompt order; ``None`` for
+            requests that errored, expired or were canceled.
+        """
+        if not prompts:
+            return []
+
+        submitted = [self._submit_batch(chunk) for chunk in self._batch_chunks(prompts)]
+        by_id: dict[str, Optional[str]] = {}
+        request_counts = []
+        for batch in submitted:
+            batch = self._await_batch(batch)
+            request_counts.append(batch.get("request_counts"))
+            by_id.update(self._batch_results(batch["id"], batch["results_url"]))
+        self.last_meta = {
+            "provider": "anthropic",
             "model": self.model,
-            "max_tokens": self.max_output_tokens,
-            "temperature": self.temperature,
-            "messages": [{"role": "user", "content": prompt}],
+            "batch_ids": [batch["id"] for batch in submitted],
+            "request_counts": request_counts,
         }
+        return [by_id.get(f"req-{i}") for i in range(len(prompts))]
 
-        last_err: Optional[Exception] = None
-        attempts = 1 + self.retries
-
-        for attempt in range(attempts):
-            t0 = time.monotonic()
-            try:
-                resp = requests.post(
-                    _API_URL,
-                    headers=headers,
-                    json=body,
-                    timeout=self.timeout,
-                )
-                latency_ms = round((time.monotonic() - t0) * 1000)
-
-                if resp.status_code == 200:
-                    data = resp.json()
-                    raw_text = self._extract_text(data)
-                    self.last_meta = {
-                        "provider": "anthropic",
-                        "model": self.model,
-                        "latency_ms": latency_ms,
-                        "usage": data.get("usage"),
-                        "stop_reason": data.get("stop_reason"),
-                    }
-                    return raw_text
-
-                if resp.status_code in _RETRYABLE_STATUS_CODES and attempt < attempts - 1:
-                    delay = 2 ** attempt
-                    logger.warning(
-                        "Anthropic API %s (attempt %d/%d), retrying in %ds …",
-                        resp.status_code, attempt + 1, attempts, delay,
-                    )
-                    time.sleep(delay)
-                    last_err = RuntimeError(
-                        f"Anthropic API returned {resp.status_code}: {resp.text[:300]}"
-                    )
-                    continue
-
-                raise RuntimeError(
-                    f"Anthropic API returned {resp.status_code}: {resp.text[:500]}"
-                )
+    def _batch_chunks(self, prompts: list[str]) -> list[list[bytes]]:
+        """Encoded batch requests, grouped to fit the per-batch limits."""
+        chunks: list[list[bytes]] = []
+        chunk: list[bytes] = []
+        size = 0
+        for i, prompt in enumerate(prompts):
+            request = _dumps({"custom_id": f"req-{i}", "params": self._message_params(prompt)})
+            if chunk and (
+                len(chunk) >= _MAX_BATCH_REQUESTS or size + len(request) + 1 > _MAX_BATCH_BYTES
+            ):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(request)
+            size += len(request) + 1
+        chunks.append(chunk)
+        return chunks
 
-            except requests.RequestException as exc:
-                last_err = exc
-                if attempt < attempts - 1:
-                    delay = 2 ** attempt
-                    logger.warning(
-                        "Anthropic request error (attempt %d/%d): %s, retrying in %ds …",
-                        attempt + 1, attempts, exc, delay,
-                    )
-                    time.sleep(delay)
-                    continue
-                raise RuntimeError(
-                    f"Anthropic request failed after {attempts} attempts: {exc}"
-                ) from exc
+    def _send(
+        self, method: str, url: str, body: Optional[bytes] = None, json_response: bool = True,
+    ) -> Any:
+        return request_with_retry(
+            self._session, method, url, self._headers, body, self.timeout, self.retries,
+            provider_name="Anthropic", logger=logger, json_response=json_response,
+        )[0]
 
-        raise RuntimeError(
-            f"Anthropic request failed after {attempts} attempts: {last_err}"
-        )
+    def _submit_batch(self, encoded: list[bytes]) -> dict[str, Any]:
+        batch = self._send("POST", _BATCHES_URL, b'{"requests":[' + b",".join(encoded) + b"]}")
+        logger.info("Anthropic batch %s submitted (%d requests)", batch["id"], len(encoded))
+        return batch
+
+    def _await_batch(self, batch: dict[str, Any]) -> dict[str, Any]:
+        while batch.get("processing_status") != "ended":
+            time.sleep(self.batch_poll_interval)
+            batch = self._send("GET", f"{_BATCHES_URL}/{batch['id']}")
+        return batch
+
+    def _batch_results(self, batch_id: str, results_url: str) -> dict[str, Optional[str]]:
+        resp = self._send("GET", results_url, json_response=False)
+        by_id: dict[str, Optional[str]] = {}
+        for line in resp.text.splitlines():
+            if not line.strip():
+                continue
+            entry = _loads(line)
+            result = entry.get("result") or {}
+            if result.get("type") == "succeeded":
+                by_id[entry["custom_id"]] = self._extract_text(result["message"])
+            else:
+                logger.warning(
+                    "Anthropic batch %s: %s %s", batch_id, entry.get("custom_id"),
+                    result.get("type"),
+                )
+        return by_id
+
+    def _message_params(self, prompt: str) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": self.max_output_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
     @staticmethod
     def _extract_text(response_data: dict) -> str:
         """Pull text from the Messages API JSON envelope."""
+        # Fast path: a single leading text block is the common shape
+        try:
+            first = response_data["content"][0]
+            if first.get("type") == "text":
+                return first["text"]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            pass
         for block in response_data.get("content", []):
             if block.get("type") == "text":
                 return block["text"]
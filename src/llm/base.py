@@ -1,5 +1,9 @@
 """Abstract base for LLM providers."""
+import logging
 from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 
 class LLMProvider(ABC):
@@ -16,3 +20,21 @@ class LLMProvider(ABC):
             Raw JSON string from the LLM.
         """
         ...
+
+    def extract_batch(self, prompts: list[str]) -> list[Optional[str]]:
+        """Send several prompts and return the raw responses in prompt order.
+
+        The default implementation calls :meth:`extract` once per prompt.
+        Providers with a native batch endpoint override this.
+
+        Returns:
+            One entry per prompt; ``None`` where that request failed.
+        """
+        responses: list[Optional[str]] = []
+        for i, prompt in enumerate(prompts):
+            try:
+                responses.append(self.extract(prompt))
+            except Exception as exc:
+                logger.warning("Batch prompt %d failed: %s", i, exc)
+                responses.append(None)
+        return responses
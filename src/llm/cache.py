@@ -0,0 +1,172 @@
+"""Caches of raw LLM responses (on-disk and in-process), keyed by request hash."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: object) -> str:
+    """Return the SHA-256 hex digest identifying one request.
+
+    Callers pass e.g. ``(provider_name, model_name, prompt)``; ``None`` parts
+    hash as empty strings and other non-strings via ``str()``. Each part is
+    length-prefixed before hashing so that different splits of the same
+    characters (e.g. ``("ab", "c")`` vs ``("a", "bc")``) cannot collide. The
+    prompt is the fully assembled one, so edits to the prompt or schema
+    templates invalidate old entries without a separate version.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = ("" if part is None else str(part)).encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace runs to single spaces and trim the ends.
+
+    Case and punctuation are kept: prompts embed a JSON schema and incident
+    text where either can change the answer. This is the only equivalence
+    the response cache applies; there is no semantic (embedding) matching.
+    """
+    return " ".join(prompt.split())
+
+
+class ExtractionCache:
+    """Content-addressable store of raw LLM responses, one JSON file per key.
+
+    Args:
+        cache_dir: Directory holding ``{key}.json`` entries; created on demand.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Return the cached entry for *key*, or None on a miss.
+
+        Entries have ``raw``, ``provider``, ``model``, ``created_at`` and
+        ``ts`` (epoch seconds). With *ttl*, entries older than *ttl* seconds,
+        or without ``ts``, are misses. Unreadable entries are treated as
+        misses.
+        """
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {exc}")
+            return None
+        if ttl is not None and entry.get("ts", float("-inf")) + ttl < time.time():
+            return None
+        return entry
+
+    def put(
+        self,
+        key: str,
+        raw_response: str,
+        provider_name: str,
+        model_name: Optional[str],
+    ) -> None:
+        """Store *raw_response* under *key*.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry.
+        """
+        entry = {
+            "raw": raw_response,
+            "provider": provider_name,
+            "model": model_name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "ts": time.time(),
+        }
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{id(entry)}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class ResponseCache:
+    """In-process LRU cache of raw responses with a time-to-live.
+
+    Keys are :func:`cache_key` digests, the same scheme the on-disk
+    :class:`ExtractionCache` uses. Thread-safe, so one instance can be shared by providers used from the
+    concurrent extraction workers. With *disk* (opt-in), entries are also
+    written through to an :class:`ExtractionCache`, so reruns in a new
+    process are answered without API calls; the TTL is checked on read
+    there too.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl: Seconds an entry stays valid. Defaults to the ``LLM_CACHE_TTL``
+            env var, or 1800.
+        disk: Optional on-disk store backing the in-memory entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: Optional[float] = None,
+        disk: Optional[ExtractionCache] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl if ttl is not None else float(os.environ.get("LLM_CACHE_TTL", 1800))
+        self.disk = disk
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the cached value for *key*, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+        if self.disk is None:
+            return None
+
+        stored = self.disk.get(key, ttl=self.ttl)
+        if stored is None:
+            return None
+        remaining = stored["ts"] + self.ttl - time.time()
+        self._store(key, stored["raw"], time.monotonic() + remaining)
+        return stored["raw"]
+
+    def update(
+        self,
+        key: str,
+        value: str,
+        *,
+        provider: str = "",
+        model: Optional[str] = None,
+    ) -> None:
+        """Store *value* under *key*, evicting the oldest entries if full.
+
+        *provider* and *model* are recorded with the on-disk entry, if any.
+        """
+        self._store(key, value, time.monotonic() + self.ttl)
+        if self.disk is not None:
+            self.disk.put(key, value, provider, model)
+
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -10,6 +10,22 @@ _ENV_KEY_MAP = {
         "anthropic": "ANTHROPIC_API_KEY",
     }
 
+# Provider classes resolved so far; modules are imported on first use only.
+_PROVIDER_CLASS_CACHE: dict[str, type[LLMProvider]] = {}
+
+
+def _provider_class(name: str) -> type[LLMProvider]:
+    cls = _PROVIDER_CLASS_CACHE.get(name)
+    if cls is None:
+        if name == "stub":
+            from src.llm.stub import StubProvider as cls
+        elif name == "anthropic":
+            from src.llm.anthropic_provider import AnthropicProvider as cls
+        else:
+            raise ValueError(f"Unknown provider: {name!r}")
+        _PROVIDER_CLASS_CACHE[name] = cls
+    return cls
+
 
 def get_provider(name: str, model: Optional[str] = None, **kwargs: Any) -> LLMProvider:
     """Return an LLMProvider instance for *name*.
@@ -34,8 +50,7 @@ def get_provider(name: str, model: Optional[str] = None, **kwargs: Any) -> LLMPr
         )
 
     if name == "stub":
-        from src.llm.stub import StubProvider
-        return StubProvider()
+        return _provider_class("stub")()
 
     # Non-stub: fail-fast on missing API key
     env_var = _ENV_KEY_MAP[name]
@@ -44,7 +59,4 @@ def get_provider(name: str, model: Optional[str] = None, **kwargs: Any) -> LLMPr
         raise RuntimeError(
             f"Provider {name!r} requires env var {env_var} but it is not set."
         )
-    if name == "anthropic":
-        from src.llm.anthropic_provider import AnthropicProvider
-        return AnthropicProvider(api_key=api_key, model=model, **kwargs)
-    raise ValueError(f"Unknown provider: {name!r}")
+    return _provider_class(name)(api_key=api_key, model=model, **kwargs)
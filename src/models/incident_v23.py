@@ -1,10 +1,22 @@
 """Pydantic v2 models for Incident Schema v2.3."""
 
+import json
+import sys
 from typing import Any, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
+def _intern(v: Optional[str]) -> Optional[str]:
+    """Share one string object per distinct value of a low-cardinality field.
+
+    ``Literal`` fields already resolve to the shared literal objects; this
+    covers free-form fields such as region or severity that repeat across
+    thousands of incidents in a bulk load.
+    """
+    return sys.intern(v) if v else v
+
+
 # ---------------------------------------------------------------------------
 # Source
 # ---------------------------------------------------------------------------
@@ -12,7 +24,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 class SourceInfo(BaseModel):
     """Document source metadata."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     doc_type: str = Field(default="unknown", description="Type of source document")
     url: Optional[str] = Field(default=None, description="URL of the source document")
@@ -27,6 +39,11 @@ class SourceInfo(BaseModel):
         default=None, description="Timezone of the incident"
     )
 
+    @field_validator("doc_type", "timezone")
+    @classmethod
+    def _intern_fields(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
 # ---------------------------------------------------------------------------
 # Context
@@ -35,7 +52,7 @@ class SourceInfo(BaseModel):
 class ContextInfo(BaseModel):
     """Operational context for the incident."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     region: str = Field(default="unknown", description="Geographic region")
     operator: str = Field(default="unknown", description="Facility operator name")
@@ -56,8 +73,7 @@ class ContextInfo(BaseModel):
         if isinstance(v, list):
             return "; ".join(str(x) for x in v).lower()
         if isinstance(v, dict):
-            import json as _json
-            return _json.dumps(v)
+            return json.dumps(v)
         return str(v).lower()
 
     @field_validator("materials", mode="before")
@@ -75,6 +91,16 @@ class ContextInfo(BaseModel):
             return [str(x) for x in v]
         return [str(v)]
 
+    @field_validator("region", "operator", "operating_phase")
+    @classmethod
+    def _intern_fields(cls, v: str) -> str:
+        return _intern(v)
+
+    @field_validator("materials")
+    @classmethod
+    def _intern_materials(cls, v: list[str]) -> list[str]:
+        return [_intern(m) for m in v]
+
 
 # ---------------------------------------------------------------------------
 # Event
@@ -83,7 +109,7 @@ class ContextInfo(BaseModel):
 class EventInfo(BaseModel):
     """Top-level event details."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     top_event: str = Field(default="unknown", description="Top event classification")
     incident_type: str = Field(default="unknown", description="Incident type")
@@ -118,8 +144,7 @@ class EventInfo(BaseModel):
         if isinstance(v, list):
             return "; ".join(str(x) for x in v)
         if isinstance(v, dict):
-            import json as _json
-            return _json.dumps(v)
+            return json.dumps(v)
         return str(v)
 
     @field_validator("costs", mode="before")
@@ -131,8 +156,7 @@ class EventInfo(BaseModel):
             # Empty dict from LLM means "unknown"
             if not v:
                 return None
-            import json as _json
-            return _json.dumps(v)
+            return json.dumps(v)
         return str(v)
     actions_taken: list[str] = Field(
         default_factory=list, description="Actions taken during/after the event"
@@ -153,7 +177,7 @@ class EventInfo(BaseModel):
 class HazardItem(BaseModel):
     """A hazard in the bowtie diagram."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     hazard_id: str = Field(..., description="Unique hazard identifier")
     name: str = Field(..., description="Short name of the hazard")
@@ -165,7 +189,7 @@ class HazardItem(BaseModel):
 class ThreatItem(BaseModel):
     """A threat (cause) in the bowtie diagram."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     threat_id: str = Field(..., description="Unique threat identifier")
     name: str = Field(..., description="Short name of the threat")
@@ -177,7 +201,7 @@ class ThreatItem(BaseModel):
 class ConsequenceItem(BaseModel):
     """A consequence (outcome) in the bowtie diagram."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     consequence_id: str = Field(..., description="Unique consequence identifier")
     name: str = Field(..., description="Short name of the consequence")
@@ -186,6 +210,11 @@ class ConsequenceItem(BaseModel):
     )
     severity: Optional[str] = Field(default=None, description="Severity rating")
 
+    @field_validator("severity")
+    @classmethod
+    def _intern_severity(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
 # ---------------------------------------------------------------------------
 # Control sub-models
@@ -194,7 +223,7 @@ class ConsequenceItem(BaseModel):
 class ControlPerformance(BaseModel):
     """Performance attributes of a control/barrier."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     barrier_status: Literal[
         "active", "degraded", "failed", "bypassed", "not_installed", "unknown"
@@ -227,7 +256,7 @@ class ControlPerformance(BaseModel):
 class ControlHuman(BaseModel):
     """Human-factors attributes of a control/barrier."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     human_contribution_value: Optional[str] = Field(
         default=None, description="Description of human contribution"
@@ -248,7 +277,7 @@ class ControlHuman(BaseModel):
 class ControlEvidence(BaseModel):
     """Evidence supporting a control assessment."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     supporting_text: list[str] = Field(
         default_factory=list,
@@ -262,7 +291,7 @@ class ControlEvidence(BaseModel):
 class ControlItem(BaseModel):
     """A single control (barrier) in the bowtie diagram."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     control_id: str = Field(..., description="Unique control identifier")
     name: str = Field(default="unknown", description="Name of the control")
@@ -290,6 +319,11 @@ class ControlItem(BaseModel):
     human: ControlHuman = Field(default_factory=ControlHuman)
     evidence: ControlEvidence = Field(default_factory=ControlEvidence)
 
+    @field_validator("barrier_role")
+    @classmethod
+    def _intern_barrier_role(cls, v: str) -> str:
+        return _intern(v)
+
 
 # ---------------------------------------------------------------------------
 # Bowtie container
@@ -298,7 +332,7 @@ class ControlItem(BaseModel):
 class BowtieV2(BaseModel):
     """Full bowtie diagram structure for Schema v2.3."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     hazards: list[HazardItem] = Field(
         default_factory=list, description="List of hazards"
@@ -321,7 +355,7 @@ class BowtieV2(BaseModel):
 class PeoplePifs(BaseModel):
     """People-related Performance Influencing Factors."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     competence_value: Optional[str] = Field(default=None)
     competence_mentioned: bool = Field(default=False)
@@ -336,7 +370,7 @@ class PeoplePifs(BaseModel):
 class WorkPifs(BaseModel):
     """Work-related Performance Influencing Factors."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     procedures_value: Optional[str] = Field(default=None)
     procedures_mentioned: bool = Field(default=False)
@@ -351,7 +385,7 @@ class WorkPifs(BaseModel):
 class OrganisationPifs(BaseModel):
     """Organisation-related Performance Influencing Factors."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     safety_culture_value: Optional[str] = Field(default=None)
     safety_culture_mentioned: bool = Field(default=False)
@@ -366,7 +400,7 @@ class OrganisationPifs(BaseModel):
 class PifsInfo(BaseModel):
     """All Performance Influencing Factors grouped by category."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     people: PeoplePifs = Field(default_factory=PeoplePifs)
     work: WorkPifs = Field(default_factory=WorkPifs)
@@ -380,7 +414,7 @@ class PifsInfo(BaseModel):
 class NotesInfo(BaseModel):
     """Schema metadata and extraction rules."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     rules: str = Field(
         default="JSON output only. mentioned fields must be evidence-based. Use null for unknown values.",
@@ -398,7 +432,7 @@ class NotesInfo(BaseModel):
 class IncidentV23(BaseModel):
     """Complete Schema v2.3 incident record."""
 
-    model_config = ConfigDict(strict=False)
+    model_config = ConfigDict(strict=False, defer_build=True)
 
     incident_id: str = Field(..., description="Unique incident identifier")
     source: SourceInfo = Field(default_factory=SourceInfo)
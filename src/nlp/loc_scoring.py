@@ -3,10 +3,19 @@
 import csv
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # ---------------------------------------------------------------------------
 # Keyword groups
 # ---------------------------------------------------------------------------
@@ -40,10 +49,52 @@ HAZARDOUS_CONTEXT: list[str] = [
     "fire",
 ]
 
-# Pre-compile patterns (word-boundary, case-insensitive)
-_PRIMARY_PATTERNS = [(t, re.compile(rf"\b{re.escape(t)}\b", re.IGNORECASE)) for t in PRIMARY_LOC_TERMS]
-_SECONDARY_PATTERNS = [(t, re.compile(rf"\b{re.escape(t)}\b", re.IGNORECASE)) for t in SECONDARY_LOC_TERMS]
-_HAZARDOUS_PATTERNS = [(t, re.compile(rf"\b{re.escape(t)}\b", re.IGNORECASE)) for t in HAZARDOUS_CONTEXT]
+
+# Every distinct term across the groups ("explosion" and "fire" are in two)
+_ALL_TERMS: list[str] = list(dict.fromkeys(PRIMARY_LOC_TERMS + SECONDARY_LOC_TERMS + HAZARDOUS_CONTEXT))
+
+
+@lru_cache(maxsize=None)
+def _compile_terms(terms: tuple[str, ...]) -> tuple[re.Pattern, re.Pattern, dict[str, str]]:
+    """Compile one word-boundary alternation over *terms*, cached per tuple.
+
+    A document is scanned once: each term gets a named group (t0, t1 …) and
+    matches are tallied per term via ``lastgroup``. Terms are whole words that
+    never overlap one another, so counts equal per-term ``findall``.
+
+    Returns:
+        The case-insensitive pattern; a case-sensitive variant for text
+        lower-cased up front (cheaper than folding case at every position
+        inside the regex engine); and the group-name -> term map.
+    """
+    def alternation(words: list[str]) -> str:
+        return r"\b(?:" + "|".join(f"(?P<t{i}>{re.escape(w)})" for i, w in enumerate(words)) + r")\b"
+
+    return (
+        re.compile(alternation(list(terms)), re.IGNORECASE),
+        re.compile(alternation([t.lower() for t in terms])),
+        {f"t{i}": t for i, t in enumerate(terms)},
+    )
+
+
+_TERMS_PATTERN, _LOWER_TERMS_PATTERN, _GROUP_TERMS = _compile_terms(tuple(_ALL_TERMS))
+# The only characters for which str.lower() and re.IGNORECASE disagree about
+# matching the terms' ASCII letters (dotted/dotless i, long s); text holding
+# any of them takes the IGNORECASE pattern so counts never change.
+_CASE_FOLD_EXCEPTIONS = re.compile("[\u0130\u0131\u017f]")
+
+
+def _build_automaton() -> "ahocorasick.Automaton":
+    automaton = ahocorasick.Automaton()
+    for term in _ALL_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick installed, lower-cased text is scanned by an
+# Aho-Corasick automaton in C instead of the regex engine.
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -59,12 +110,49 @@ OUTPUT_PATH = PROJECT_ROOT / "data" / "processed" / "csb_loc_scored.csv"
 # Scoring helpers
 # ---------------------------------------------------------------------------
 
-def _count_matches(text: str, patterns: list[tuple[str, re.Pattern]]) -> tuple[int, list[str]]:
-    """Return total match count and list of matched terms."""
+def _is_word_char(ch: str) -> bool:
+    """Same test as ``\\w`` in a str pattern."""
+    return ch.isalnum() or ch == "_"
+
+
+def _automaton_counts(text: str) -> Counter:
+    """Whole-word occurrences of each term in lower-cased *text*.
+
+    The automaton reports every occurrence, including those inside longer
+    words, so each hit is kept only if it sits on word boundaries as ``\\b``
+    would require. Terms never overlap as whole words, so the counts equal
+    the regex scan's.
+    """
+    counts: Counter = Counter()
+    last = len(text) - 1
+    for end, term in _AUTOMATON.iter(text):
+        start = end - len(term) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        counts[term] += 1
+    return counts
+
+
+def _term_counts(text: str) -> Counter:
+    """Occurrences of each LOC term in *text*, from a single scan."""
+    if text.isascii() or _CASE_FOLD_EXCEPTIONS.search(text) is None:
+        lowered = text.lower()
+        if _AUTOMATON is not None:
+            return _automaton_counts(lowered)
+        matches = _LOWER_TERMS_PATTERN.finditer(lowered)
+    else:
+        matches = _TERMS_PATTERN.finditer(text)
+    return Counter(_GROUP_TERMS[m.lastgroup] for m in matches)
+
+
+def _count_matches(counts: Counter, terms: list[str]) -> tuple[int, list[str]]:
+    """Return total match count and list of matched terms for one term group."""
     total = 0
     matched: list[str] = []
-    for term, pat in patterns:
-        count = len(pat.findall(text))
+    for term in terms:
+        count = counts[term]
         if count > 0:
             total += count
             matched.append(term)
@@ -73,9 +161,10 @@ def _count_matches(text: str, patterns: list[tuple[str, re.Pattern]]) -> tuple[i
 
 def score_text(text: str) -> dict:
     """Score a single document's text for LOC relevance."""
-    primary_count, matched_primary = _count_matches(text, _PRIMARY_PATTERNS)
-    secondary_count, matched_secondary = _count_matches(text, _SECONDARY_PATTERNS)
-    hazardous_count, matched_context = _count_matches(text, _HAZARDOUS_PATTERNS)
+    counts = _term_counts(text)
+    primary_count, matched_primary = _count_matches(counts, PRIMARY_LOC_TERMS)
+    secondary_count, matched_secondary = _count_matches(counts, SECONDARY_LOC_TERMS)
+    hazardous_count, matched_context = _count_matches(counts, HAZARDOUS_CONTEXT)
 
     loc_score = (primary_count * 2) + (secondary_count * 1) + hazardous_count
     loc_flag = (primary_count >= 1 and hazardous_count >= 1) or (secondary_count >= 1 and hazardous_count >= 2)
@@ -177,10 +266,79 @@ def run() -> pd.DataFrame:
     return df
 
 
+def _score_row(row: dict, text_dir: Path) -> dict:
+    """Build one output row for a manifest record; scores OK documents."""
+    doc_id = row["doc_id"]
+    extraction_status = row.get("extraction_status", "OK")
+    fail_reason = row.get("fail_reason", "")
+
+    if extraction_status != "OK":
+        return {
+            "doc_id": doc_id,
+            "final_label": "EXTRACTION_FAILED",
+            "loc_score": None,
+            "primary_count": None,
+            "secondary_count": None,
+            "hazardous_count": None,
+            "loc_flag": None,
+            "extraction_status": extraction_status,
+            "fail_reason": fail_reason if fail_reason else None,
+            "extractor_used": row.get("extractor_used", ""),
+            "text_len": row.get("text_len", "0"),
+            "matched_primary_terms": "",
+            "matched_secondary_terms": "",
+            "matched_context_terms": "",
+        }
+
+    # Read text file
+    text_path = text_dir / row.get("text_path", f"{doc_id}.txt")
+    if not text_path.exists():
+        return {
+            "doc_id": doc_id,
+            "final_label": "EXTRACTION_FAILED",
+            "loc_score": None,
+            "primary_count": None,
+            "secondary_count": None,
+            "hazardous_count": None,
+            "loc_flag": None,
+            "extraction_status": "EXTRACTION_FAILED",
+            "fail_reason": "TEXT_FILE_MISSING",
+            "extractor_used": row.get("extractor_used", ""),
+            "text_len": "0",
+            "matched_primary_terms": "",
+            "matched_secondary_terms": "",
+            "matched_context_terms": "",
+        }
+
+    text = text_path.read_text(encoding="utf-8", errors="replace")
+    scores = score_text(text)
+
+    loc_flag = scores["loc_flag"]
+    final_label = "TRUE" if loc_flag else "FALSE"
+
+    return {
+        "doc_id": doc_id,
+        "final_label": final_label,
+        "loc_score": scores["loc_score"],
+        "primary_count": scores["primary_count"],
+        "secondary_count": scores["secondary_count"],
+        "hazardous_count": scores["hazardous_count"],
+        "loc_flag": loc_flag,
+        "extraction_status": "OK",
+        "fail_reason": None,
+        "extractor_used": row.get("extractor_used", ""),
+        "text_len": scores["text_length"],
+        "matched_primary_terms": scores["matched_primary_terms"],
+        "matched_secondary_terms": scores["matched_secondary_terms"],
+        "matched_context_terms": scores["matched_context_terms"],
+    }
+
+
 def run_with_extraction_manifest(
     manifest_path: Path,
     text_dir: Path,
     output_path: Path,
+    workers: int = 1,
 ) -> pd.DataFrame:
     """Score LOC using extraction manifest — skip EXTRACTION_FAILED documents.
 
@@ -191,81 +349,23 @@ def run_with_extraction_manifest(
         manifest_path: Path to extraction_manifest.csv.
         text_dir: Directory containing normalized text files.
         output_path: Path to write scored CSV.
+        workers: Number of worker processes; documents are read and scored
+            in parallel when greater than 1.
 
     Returns:
         DataFrame with all rows including scored and failed.
     """
     manifest_df = pd.read_csv(manifest_path, dtype=str)
 
-    results: list[dict] = []
-
-    for _, row in manifest_df.iterrows():
-        doc_id = row["doc_id"]
-        extraction_status = row.get("extraction_status", "OK")
-        fail_reason = row.get("fail_reason", "")
-
-        if extraction_status != "OK":
-            results.append({
-                "doc_id": doc_id,
-                "final_label": "EXTRACTION_FAILED",
-                "loc_score": None,
-                "primary_count": None,
-                "secondary_count": None,
-                "hazardous_count": None,
-                "loc_flag": None,
-                "extraction_status": extraction_status,
-                "fail_reason": fail_reason if fail_reason else None,
-                "extractor_used": row.get("extractor_used", ""),
-                "text_len": row.get("text_len", "0"),
-                "matched_primary_terms": "",
-                "matched_secondary_terms": "",
-                "matched_context_terms": "",
-            })
-            continue
-
-        # Read text file
-        text_path = text_dir / row.get("text_path", f"{doc_id}.txt")
-        if not text_path.exists():
-            results.append({
-                "doc_id": doc_id,
-                "final_label": "EXTRACTION_FAILED",
-                "loc_score": None,
-                "primary_count": None,
-                "secondary_count": None,
-                "hazardous_count": None,
-                "loc_flag": None,
-                "extraction_status": "EXTRACTION_FAILED",
-                "fail_reason": "TEXT_FILE_MISSING",
-                "extractor_used": row.get("extractor_used", ""),
-                "text_len": "0",
-                "matched_primary_terms": "",
-                "matched_secondary_terms": "",
-                "matched_context_terms": "",
-            })
-            continue
-
-        text = text_path.read_text(encoding="utf-8", errors="replace")
-        scores = score_text(text)
-
-        loc_flag = scores["loc_flag"]
-        final_label = "TRUE" if loc_flag else "FALSE"
-
-        results.append({
-            "doc_id": doc_id,
-            "final_label": final_label,
-            "loc_score": scores["loc_score"],
-            "primary_count": scores["primary_count"],
-            "secondary_count": scores["secondary_count"],
-            "hazardous_count": scores["hazardous_count"],
-            "loc_flag": loc_flag,
-            "extraction_status": "OK",
-            "fail_reason": None,
-            "extractor_used": row.get("extractor_used", ""),
-            "text_len": scores["text_length"],
-            "matched_primary_terms": scores["matched_primary_terms"],
-            "matched_secondary_terms": scores["matched_secondary_terms"],
-            "matched_context_terms": scores["matched_context_terms"],
-        })
+    # Plain dicts: iterrows() builds a Series per row, which dominates on
+    # large manifests. Scoring itself is one regex pass per document.
+    records = manifest_df.to_dict("records")
+    if workers > 1 and len(records) > 1:
+        # map() keeps manifest order, so the output CSV stays deterministic.
+        with ProcessPoolExecutor(max_workers=min(workers, len(records))) as pool:
+            results = list(pool.map(_score_row, records, repeat(text_dir), chunksize=32))
+    else:
+        results = [_score_row(row, text_dir) for row in records]
 
     df = pd.DataFrame(results)
 
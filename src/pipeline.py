@@ -1,6 +1,7 @@
 import argparse
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def get_sources_root() -> Path:
@@ -10,12 +11,14 @@ def get_sources_root() -> Path:
 
 
 
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.ingestion.loader import load_incident_from_text
 from src.ingestion.manifests import (
+    IncidentManifestRow,
     load_incident_manifest,
     save_incident_manifest,
     save_text_manifest,
@@ -26,7 +29,7 @@ from src.ingestion.sources.csb import discover_csb_incidents, download_csb_pdf
 from src.ingestion.sources.bsee import discover_bsee_incidents, download_bsee_pdf
 from src._legacy.incident import Incident
 from src._legacy.bowtie import Bowtie
-from src._legacy.engine import calculate_barrier_coverage, identify_gaps
+from src._legacy.engine import calculate_barrier_coverage, identify_gaps, partition_barrier_names
 from src.analytics.aggregation import calculate_fleet_metrics
 from src.analytics.build_combined_exports import build_all as build_combined_all
 from src.ingestion.structured import (
@@ -72,6 +75,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+# Concurrent PDF downloads during acquire; downloads are network-latency bound
+DOWNLOAD_WORKERS = 8
 
 def load_bowtie(bowtie_path: Path) -> Optional[Bowtie]:
     """Loads a Bowtie definition from a JSON file."""
@@ -80,8 +85,8 @@ def load_bowtie(bowtie_path: Path) -> Optional[Bowtie]:
         return None
 
     try:
-        data = json.loads(bowtie_path.read_text(encoding='utf-8'))
-        return Bowtie(**data)
+        # Parsed and validated in one pass by pydantic-core
+        return Bowtie.model_validate_json(bowtie_path.read_bytes())
     except Exception as e:
         logger.error(f"Failed to load Bowtie definition: {e}")
         return None
@@ -111,6 +116,7 @@ def process_raw_files(raw_dir: Path, processed_dir: Path, bowtie_path: Optional[
     bowtie = load_bowtie(bowtie_path) if bowtie_path else None
     if bowtie:
         logger.info(f"Loaded Bowtie reference: {bowtie.hazard} -> {bowtie.top_event}")
+        barrier_partition = partition_barrier_names(bowtie)
 
     for file_path in raw_dir.glob("*.txt"):
         logger.info(f"Processing file: {file_path.name}")
@@ -133,7 +139,7 @@ def process_raw_files(raw_dir: Path, processed_dir: Path, bowtie_path: Optional[
 
                     # Run analytics if Bowtie is available
                     if bowtie:
-                        coverage = calculate_barrier_coverage(incident, bowtie)
+                        coverage = calculate_barrier_coverage(incident, bowtie, barrier_partition)
                         gaps = identify_gaps(incident, bowtie)
 
                         output_data["analytics"] = {
@@ -166,6 +172,29 @@ def process_raw_files(raw_dir: Path, processed_dir: Path, bowtie_path: Optional[
     return processed_incidents
 
 
+def _download_concurrently(
+    rows: Iterable[IncidentManifestRow],
+    download_fn: Callable[..., IncidentManifestRow],
+    raw_dir: Path,
+    session: requests.Session,
+    timeout: int,
+    workers: int,
+) -> list[IncidentManifestRow]:
+    """Download PDFs for rows as they are discovered, up to ``workers`` at once.
+
+    Each row is submitted as soon as discovery yields it, so downloads overlap
+    with the remaining detail-page fetches. Results keep discovery order.
+    """
+    if workers <= 1:
+        return [download_fn(row, raw_dir, session, timeout=timeout) for row in rows]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(download_fn, row, raw_dir, session, timeout=timeout)
+            for row in rows
+        ]
+        return [f.result() for f in futures]
+
+
 def cmd_acquire(args: argparse.Namespace) -> None:
     """Acquire incident metadata and optionally download PDFs."""
     out_path = Path(args.out)
@@ -180,22 +209,31 @@ def cmd_acquire(args: argparse.Namespace) -> None:
     new_rows = []
     session = requests.Session()
     session.headers["User-Agent"] = "BowtieRiskAnalytics/0.1 (academic research)"
+    # One keep-alive pool shared by discovery and every download thread
+    pool_size = max(DOWNLOAD_WORKERS, args.download_workers) if args.download else DOWNLOAD_WORKERS
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
     # Discover CSB incidents
     if args.csb_limit > 0:
         logger.info(f"Discovering up to {args.csb_limit} CSB incidents...")
-        for row in discover_csb_incidents(limit=args.csb_limit):
-            if args.download:
-                row = download_csb_pdf(row, raw_dir, session, timeout=args.timeout)
-            new_rows.append(row)
+        discovered = discover_csb_incidents(limit=args.csb_limit, session=session)
+        if args.download:
+            discovered = _download_concurrently(
+                discovered, download_csb_pdf, raw_dir, session, args.timeout, args.download_workers
+            )
+        new_rows.extend(discovered)
 
     # Discover BSEE incidents
     if args.bsee_limit > 0:
         logger.info(f"Discovering up to {args.bsee_limit} BSEE incidents...")
-        for row in discover_bsee_incidents(limit=args.bsee_limit):
-            if args.download:
-                row = download_bsee_pdf(row, raw_dir, session, timeout=args.timeout)
-            new_rows.append(row)
+        discovered = discover_bsee_incidents(limit=args.bsee_limit)
+        if args.download:
+            discovered = _download_concurrently(
+                discovered, download_bsee_pdf, raw_dir, session, args.timeout, args.download_workers
+            )
+        new_rows.extend(discovered)
 
     # Merge or overwrite
     if args.append and existing_rows:
@@ -247,6 +285,10 @@ def cmd_extract_structured(args: argparse.Namespace) -> None:
     out_dir = Path(args.out_dir)
     manifest_path = Path(args.manifest)
 
+    if args.concurrency > 1 and args.rpm is None:
+        logger.error("--concurrency above 1 requires --rpm (use --rpm 0 for no cap)")
+        raise SystemExit(1)
+
     # Load policy + build per-file model ladder
     from src.llm.model_policy import ModelPolicy
     from src.corpus.extract import _run_model_ladder
@@ -266,20 +308,38 @@ def cmd_extract_structured(args: argparse.Namespace) -> None:
 
     provider_name = "schema_v2_3"
 
+    # Batch mode sends every prompt to the policy's provider and default
+    # model up front; anything missing or unparseable from the batch still
+    # goes through the ladder.
+    batch_provider = None
+    if args.use_batch_api:
+        from src.llm.registry import get_provider
+        batch_provider = get_provider(
+            policy.provider, model=policy.default_model, max_output_tokens=8192,
+        )
+
+    # Rows are checkpointed to the manifest as they finish; read the prior
+    # state first so the final merge below reports it accurately.
+    existing_rows = load_structured_manifest(manifest_path)
+
     rows = extract_structured(
         text_dir,
         out_dir,
-        provider=None,
+        provider=batch_provider,
         provider_name=provider_name,
         model_name=policy.default_model,
         limit=args.limit,
         resume=args.resume,
         text_limit=args.text_limit,
         _ladder_fn=_ladder,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        use_batch_api=args.use_batch_api,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        manifest_path=manifest_path,
     )
 
     # Merge with existing manifest so prior rows are not dropped
-    existing_rows = load_structured_manifest(manifest_path)
     merged = merge_structured_manifests(existing_rows, rows)
     save_structured_manifest(merged, manifest_path)
     logger.info(f"Saved {len(merged)} structured extraction results to {manifest_path} "
@@ -346,7 +406,7 @@ def cmd_convert_schema(args: argparse.Namespace) -> None:
 
 def cmd_schema_check(args: argparse.Namespace) -> None:
     """Validate extracted JSON files against Schema v2.3."""
-    from src.validation.incident_validator import validate_incident_v23
+    from src.validation.incident_validator import parse_incident_v23_json
 
     incident_dir = Path(args.incident_dir)
     if not incident_dir.exists():
@@ -360,14 +420,9 @@ def cmd_schema_check(args: argparse.Namespace) -> None:
 
     invalid_files: list[tuple[Path, list[str]]] = []
     for json_path in json_files:
-        try:
-            payload = json.loads(json_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            invalid_files.append((json_path, [f"JSON decode error: {exc}"]))
-            continue
-
-        is_valid, errors = validate_incident_v23(payload)
-        if not is_valid:
+        # Decoded and validated in one pass; malformed JSON surfaces as an error
+        model, errors = parse_incident_v23_json(json_path.read_bytes())
+        if model is None:
             invalid_files.append((json_path, errors))
 
     valid_count = len(json_files) - len(invalid_files)
@@ -402,6 +457,8 @@ def cmd_extract_qc(args: argparse.Namespace) -> None:
         output_dir=Path(args.output_dir),
         manifest_path=Path(args.manifest),
         force=args.force,
+        workers=args.workers,
+        ocr_workers=args.ocr_workers,
     )
 
 
@@ -568,6 +625,12 @@ def main():
     p_acquire.add_argument(
         "--timeout", type=int, default=30, help="Download timeout in seconds"
     )
+    p_acquire.add_argument(
+        "--download-workers",
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help=f"Concurrent PDF downloads (default: {DOWNLOAD_WORKERS})",
+    )
     p_acquire.add_argument(
         "--append",
         action="store_true",
@@ -631,6 +694,32 @@ def main():
     p_struct.add_argument(
         "--resume", action="store_true", help="Skip files with existing output JSON"
     )
+    p_struct.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of files extracted in parallel (default: 1; above 1 requires --rpm)",
+    )
+    p_struct.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="Max LLM requests started per minute across workers "
+             "(0 = explicitly unlimited; default: unlimited when sequential)",
+    )
+    p_struct.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        dest="use_batch_api",
+        help="Submit all prompts via the Anthropic Message Batches API "
+             "(cheaper, but batches can take up to 24 hours)",
+    )
+    p_struct.add_argument(
+        "--cache-dir",
+        default=None,
+        dest="cache_dir",
+        help="Reuse raw LLM responses cached here for unchanged prompts (default: off)",
+    )
     p_struct.set_defaults(func=cmd_extract_structured)
 
     # convert-schema subcommand
@@ -697,6 +786,20 @@ def main():
         action="store_true",
         help="Reprocess all PDFs even if already in manifest",
     )
+    p_eqc.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for PDF extraction (default: 1, sequential)",
+    )
+    p_eqc.add_argument(
+        "--ocr-workers",
+        type=int,
+        default=None,
+        dest="ocr_workers",
+        help="Pages OCR'd concurrently in total, shared across --workers "
+             "(default: OCR_WORKERS env var or CPU count)",
+    )
     p_eqc.set_defaults(func=cmd_extract_qc)
 
     # ingest-source subcommand
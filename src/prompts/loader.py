@@ -1,5 +1,6 @@
 """Prompt template loader for incident extraction."""
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -33,15 +34,30 @@ def load_prompt(
     prompt_path = prompt_path or _DEFAULT_PROMPT_PATH
     schema_path = schema_path or _DEFAULT_SCHEMA_PATH
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema template not found: {schema_path}")
+    try:
+        prompt_mtime = prompt_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt template not found: {prompt_path}") from None
+    try:
+        schema_mtime = schema_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema template not found: {schema_path}") from None
 
+    parts = _template_parts(prompt_path, prompt_mtime, schema_path, schema_mtime)
+    return incident_text.join(parts)
+
+
+@lru_cache(maxsize=8)
+def _template_parts(
+    prompt_path: Path, prompt_mtime: int, schema_path: Path, schema_mtime: int,
+) -> tuple[str, ...]:
+    """Prompt template with the schema filled in, split at ``{{INCIDENT_TEXT}}``.
+
+    Cached per file modification time, so the templates are read once per run
+    rather than once per incident, but edits are still picked up.
+    """
     prompt_template = prompt_path.read_text(encoding="utf-8")
     schema_template = schema_path.read_text(encoding="utf-8")
 
     result = prompt_template.replace("{{SCHEMA_TEMPLATE}}", schema_template)
-    result = result.replace("{{INCIDENT_TEXT}}", incident_text)
-
-    return result
+    return tuple(result.split("{{INCIDENT_TEXT}}"))
@@ -1,27 +1,65 @@
 """Validation utilities for Schema v2.3 incident payloads."""
 
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import ValidationError
 
 from src.models.incident_v23 import IncidentV23
 
 
+def parse_incident_v23(
+    payload: dict[str, Any],
+) -> tuple[Optional[IncidentV23], list[str]]:
+    """Validate a dict against Schema v2.3 and keep the validated model.
+
+    Callers that also need the model (e.g. to dump it with defaults filled
+    in) use this to avoid validating the payload a second time.
+
+    Returns:
+        Tuple of (model_or_None, list_of_error_messages).
+    """
+    try:
+        return IncidentV23.model_validate(payload), []
+    except ValidationError as e:
+        return None, _error_messages(e)
+
+
+def parse_incident_v23_json(
+    raw: str | bytes,
+) -> tuple[Optional[IncidentV23], list[str]]:
+    """Like :func:`parse_incident_v23`, but straight from JSON text.
+
+    pydantic-core parses and validates in one pass, so no intermediate dict
+    is built. Malformed JSON is reported as ``"JSON decode error: ..."``.
+
+    Returns:
+        Tuple of (model_or_None, list_of_error_messages).
+    """
+    try:
+        return IncidentV23.model_validate_json(raw), []
+    except ValidationError as e:
+        return None, _error_messages(e)
+
+
+def _error_messages(exc: ValidationError) -> list[str]:
+    errors = []
+    for err in exc.errors():
+        if err["type"] == "json_invalid":
+            errors.append(f"JSON decode error: {err['ctx']['error']}")
+            continue
+        loc = " -> ".join(str(x) for x in err["loc"])
+        errors.append(f"{loc}: {err['msg']}")
+    return errors
+
+
 def validate_incident_v23(payload: dict[str, Any]) -> tuple[bool, list[str]]:
     """Validate a dict against the Schema v2.3 incident schema.
 
     Returns:
         Tuple of (is_valid, list_of_error_messages).
     """
-    try:
-        IncidentV23.model_validate(payload)
-        return True, []
-    except ValidationError as e:
-        errors = []
-        for err in e.errors():
-            loc = " -> ".join(str(x) for x in err["loc"])
-            errors.append(f"{loc}: {err['msg']}")
-        return False, errors
+    model, errors = parse_incident_v23(payload)
+    return model is not None, errors
 
 
 # Backwards-compat alias — schema is v2.3; old name kept for one release cycle
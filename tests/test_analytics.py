@@ -2,7 +2,7 @@
 import pytest
 from src._legacy.bowtie import Bowtie, Threat, Barrier, Consequence
 from src._legacy.incident import Incident
-from src._legacy.engine import calculate_barrier_coverage, identify_gaps
+from src._legacy.engine import calculate_barrier_coverage, identify_gaps, partition_barrier_names
 
 @pytest.fixture
 def sample_bowtie():
@@ -49,3 +49,10 @@ class TestAnalytics:
         assert len(gaps) == 1
         assert gaps[0].name == "Sprinkler"
         assert gaps[0].type == "mitigation"
+
+    def test_precomputed_partition_matches(self, sample_bowtie, sample_incident):
+        """A precomputed partition gives the same metrics as the default path."""
+        partition = partition_barrier_names(sample_bowtie)
+        assert partition.n_prevention == 1 and partition.n_mitigation == 1 and partition.n_all == 2
+        assert calculate_barrier_coverage(sample_incident, sample_bowtie, partition) == \
+            calculate_barrier_coverage(sample_incident, sample_bowtie)
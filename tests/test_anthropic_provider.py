@@ -7,7 +7,10 @@ import pytest
 import requests
 
 from src.llm.base import LLMProvider
+from src.llm import _http
+from src.llm._http import backoff
 from src.llm.anthropic_provider import AnthropicProvider
+from src.llm.cache import ResponseCache
 from src.llm.registry import get_provider
 
 
@@ -21,18 +24,33 @@ def _messages_payload(text: str) -> dict:
         "role": "assistant",
         "content": [{"type": "text", "text": text}],
         "model": "claude-sonnet-4-5-20250929",
+        "stop_reason": "end_turn",
         "usage": {"input_tokens": 50, "output_tokens": 120},
     }
 
 
-def _mock_response(status_code: int = 200, json_data: dict | None = None, text: str = "") -> MagicMock:
+def _mock_response(
+    status_code: int = 200,
+    json_data: dict | None = None,
+    text: str = "",
+    headers: dict | None = None,
+) -> MagicMock:
     resp = MagicMock(spec=requests.Response)
     resp.status_code = status_code
+    resp.headers = headers or {}
     resp.text = text or json.dumps(json_data or {})
+    resp.content = resp.text.encode("utf-8")
     resp.json.return_value = json_data or {}
     return resp
 
 
+@pytest.fixture(autouse=True)
+def _no_prewarm():
+    """Keep provider construction off the network."""
+    with patch("src.llm.anthropic_provider.prewarm"):
+        yield
+
+
 # -- construction & fail-fast ------------------------------------------------
 
 class TestAnthropicProviderInit:
@@ -50,11 +68,19 @@ class TestAnthropicProviderInit:
         assert isinstance(provider, LLMProvider)
         assert provider.model == "claude-sonnet-4-5-20250929"
 
+    @patch("src.llm._http.requests.Session.head")
+    def test_prewarm_runs_once_per_url(self, mock_head: MagicMock) -> None:
+        url = "https://prewarm.invalid/v1/messages"
+        thread = _http.prewarm(url)
+        thread.join(timeout=5)
+        assert _http.prewarm(url) is None
+        mock_head.assert_called_once_with(url, timeout=5)
+
 
 # -- extract() ---------------------------------------------------------------
 
 class TestAnthropicProviderExtract:
-    @patch("src.llm.anthropic_provider.requests.post")
+    @patch("src.llm._http.requests.Session.post")
     def test_successful_extraction(self, mock_post: MagicMock) -> None:
         sample_json = '{"incident_id": "INC-001"}'
         mock_post.return_value = _mock_response(200, _messages_payload(sample_json))
@@ -68,13 +94,43 @@ class TestAnthropicProviderExtract:
 
         # Verify request shape
         call_kwargs = mock_post.call_args
-        body = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        body = json.loads(call_kwargs.kwargs["data"])
         assert body["messages"] == [{"role": "user", "content": "some prompt"}]
         headers = call_kwargs.kwargs.get("headers") or call_kwargs[1].get("headers")
         assert headers["x-api-key"] == "sk-ant-test"
         assert headers["anthropic-version"] == "2023-06-01"
 
-    @patch("src.llm.anthropic_provider.requests.post")
+    @patch("src.llm._http.requests.Session.post")
+    def test_response_cache_skips_repeat_request(self, mock_post: MagicMock) -> None:
+        mock_post.return_value = _mock_response(200, _messages_payload('{"a": 1}'))
+        provider = AnthropicProvider(api_key="sk-ant-test", cache=ResponseCache())
+
+        assert provider.extract("same prompt") == '{"a": 1}'
+        assert provider.extract("same prompt") == '{"a": 1}'
+        assert mock_post.call_count == 1
+        assert provider.last_meta["cache_hit"] is True
+        assert provider.last_meta["stop_reason"] == "end_turn"
+
+        provider.extract("other prompt")
+        assert mock_post.call_count == 2
+
+        # Whitespace-only variants hit the same entry
+        provider.extract("  same\n\tprompt ")
+        assert mock_post.call_count == 2
+
+    @patch("src.llm._http.requests.Session.post")
+    def test_response_cache_skips_truncated_response(self, mock_post: MagicMock) -> None:
+        truncated = {**_messages_payload('{"a": '), "stop_reason": "max_tokens"}
+        mock_post.return_value = _mock_response(200, truncated)
+        provider = AnthropicProvider(api_key="sk-ant-test", cache=ResponseCache())
+
+        provider.extract("same prompt")
+        provider.extract("same prompt")
+        assert mock_post.call_count == 2
+        assert provider.last_meta["stop_reason"] == "max_tokens"
+        assert "cache_hit" not in provider.last_meta
+
+    @patch("src.llm._http.requests.Session.post")
     def test_non_retryable_error_raises_immediately(self, mock_post: MagicMock) -> None:
         mock_post.return_value = _mock_response(401, text="Unauthorized")
         provider = AnthropicProvider(api_key="sk-ant-test", retries=2)
@@ -83,7 +139,7 @@ class TestAnthropicProviderExtract:
         assert mock_post.call_count == 1
 
     @patch("src.llm.anthropic_provider.time.sleep")
-    @patch("src.llm.anthropic_provider.requests.post")
+    @patch("src.llm._http.requests.Session.post")
     def test_retry_on_429_then_success(self, mock_post: MagicMock, mock_sleep: MagicMock) -> None:
         sample_json = '{"ok": true}'
         mock_post.side_effect = [
@@ -94,10 +150,39 @@ class TestAnthropicProviderExtract:
         result = provider.extract("prompt")
         assert result == sample_json
         assert mock_post.call_count == 2
-        mock_sleep.assert_called_once_with(1)
+        mock_sleep.assert_called_once()
+        assert 1 <= mock_sleep.call_args[0][0] <= 1.25  # 1s back-off + jitter
+
+    def test_backoff_is_capped(self) -> None:
+        assert all(30 <= backoff(attempt) <= 37.5 for attempt in (5, 10, 20))
+
+    @patch("src.llm.anthropic_provider.time.sleep")
+    @patch("src.llm._http.requests.Session.post")
+    def test_retry_after_header_honoured(self, mock_post: MagicMock, mock_sleep: MagicMock) -> None:
+        mock_post.side_effect = [
+            _mock_response(429, text="Rate limited", headers={"retry-after": "7"}),
+            _mock_response(200, _messages_payload("{}")),
+        ]
+        provider = AnthropicProvider(api_key="sk-ant-test", retries=2)
+        assert provider.extract("prompt") == "{}"
+        mock_sleep.assert_called_once_with(7.0)
 
+    @pytest.mark.parametrize(("header", "expected"), [("0", 0.0), ("3600", 30.0)])
     @patch("src.llm.anthropic_provider.time.sleep")
-    @patch("src.llm.anthropic_provider.requests.post")
+    @patch("src.llm._http.requests.Session.post")
+    def test_retry_after_zero_and_capped(
+        self, mock_post: MagicMock, mock_sleep: MagicMock, header: str, expected: float
+    ) -> None:
+        mock_post.side_effect = [
+            _mock_response(429, text="Rate limited", headers={"retry-after": header}),
+            _mock_response(200, _messages_payload("{}")),
+        ]
+        provider = AnthropicProvider(api_key="sk-ant-test", retries=2)
+        assert provider.extract("prompt") == "{}"
+        mock_sleep.assert_called_once_with(expected)
+
+    @patch("src.llm.anthropic_provider.time.sleep")
+    @patch("src.llm._http.requests.Session.post")
     def test_all_retries_exhausted_raises(self, mock_post: MagicMock, mock_sleep: MagicMock) -> None:
         mock_post.return_value = _mock_response(503, text="Overloaded")
         provider = AnthropicProvider(api_key="sk-ant-test", retries=1)
@@ -106,6 +191,80 @@ class TestAnthropicProviderExtract:
         assert mock_post.call_count == 2
 
 
+# -- extract_batch() ---------------------------------------------------------
+
+class TestAnthropicProviderExtractBatch:
+    @patch("src.llm.anthropic_provider.time.sleep")
+    @patch("src.llm._http.requests.Session.get")
+    @patch("src.llm._http.requests.Session.post")
+    def test_results_returned_in_prompt_order(
+        self, mock_post: MagicMock, mock_get: MagicMock, mock_sleep: MagicMock,
+    ) -> None:
+        results_url = "https://api.anthropic.com/v1/messages/batches/b1/results"
+        mock_post.return_value = _mock_response(
+            200, {"id": "b1", "processing_status": "in_progress"},
+        )
+        results = "\n".join(json.dumps(line) for line in [
+            {"custom_id": "req-1", "result": {"type": "succeeded", "message": _messages_payload("second")}},
+            {"custom_id": "req-2", "result": {"type": "errored", "error": {}}},
+            {"custom_id": "req-0", "result": {"type": "succeeded", "message": _messages_payload("first")}},
+        ])
+        mock_get.side_effect = [
+            _mock_response(200, {"id": "b1", "processing_status": "ended", "results_url": results_url}),
+            _mock_response(200, text=results),
+        ]
+
+        provider = AnthropicProvider(api_key="sk-ant-test", batch_poll_interval=5)
+        assert provider.extract_batch(["a", "b", "c"]) == ["first", "second", None]
+
+        requests_sent = json.loads(mock_post.call_args[1]["data"])["requests"]
+        assert [r["custom_id"] for r in requests_sent] == ["req-0", "req-1", "req-2"]
+        assert requests_sent[0]["params"]["messages"][0]["content"] == "a"
+        mock_sleep.assert_called_once_with(5)
+        assert mock_get.call_args_list[1][0][0] == results_url
+
+    @patch("src.llm.anthropic_provider._MAX_BATCH_REQUESTS", 2)
+    @patch("src.llm.anthropic_provider.time.sleep")
+    @patch("src.llm._http.requests.Session.get")
+    @patch("src.llm._http.requests.Session.post")
+    def test_prompts_split_into_batches_and_submit_retried(
+        self, mock_post: MagicMock, mock_get: MagicMock, mock_sleep: MagicMock,
+    ) -> None:
+        def ended(batch_id: str) -> dict:
+            return {
+                "id": batch_id, "processing_status": "ended",
+                "results_url": f"https://api.anthropic.com/v1/messages/batches/{batch_id}/results",
+            }
+
+        mock_post.side_effect = [
+            _mock_response(503, text="Overloaded"),
+            _mock_response(200, ended("b1")),
+            _mock_response(200, ended("b2")),
+        ]
+        mock_get.side_effect = [
+            _mock_response(200, text="\n".join(json.dumps(
+                {"custom_id": f"req-{i}", "result": {"type": "succeeded", "message": _messages_payload(p)}}
+            ) for i, p in enumerate(["x", "y"]))),
+            _mock_response(200, text=json.dumps(
+                {"custom_id": "req-2", "result": {"type": "succeeded", "message": _messages_payload("z")}}
+            )),
+        ]
+
+        provider = AnthropicProvider(api_key="sk-ant-test", retries=2)
+        assert provider.extract_batch(["a", "b", "c"]) == ["x", "y", "z"]
+        assert mock_post.call_count == 3
+        sizes = [len(json.loads(c[1]["data"])["requests"]) for c in mock_post.call_args_list[1:]]
+        assert sizes == [2, 1]
+        assert provider.last_meta["batch_ids"] == ["b1", "b2"]
+
+    @patch("src.llm._http.requests.Session.post")
+    def test_submit_error_raises(self, mock_post: MagicMock) -> None:
+        mock_post.return_value = _mock_response(400, text="Bad request")
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        with pytest.raises(RuntimeError, match="400"):
+            provider.extract_batch(["a"])
+
+
 # -- registry integration ----------------------------------------------------
 
 class TestRegistryAnthropic:
@@ -1,7 +1,7 @@
 import pytest
 import json
 from pathlib import Path
-from src._legacy.utils import load_data
+from src._legacy.utils import data_cache_key, load_data
 
 def test_load_data_returns_empty_when_no_data(tmp_path):
     # Given an empty directory
@@ -65,3 +65,18 @@ def test_load_data_handles_missing_optional_fields(tmp_path):
     assert len(incidents) == 1
     assert incidents[0]["incident_id"] == "INC-2024-001"
     assert "title" not in incidents[0]  # Field doesn't exist in source data
+
+
+def test_data_cache_key_changes_when_inputs_change(tmp_path):
+    data_dir = tmp_path / "processed"
+    assert data_cache_key(data_dir) == ()
+
+    data_dir.mkdir()
+    (data_dir / "INC-001.json").write_text(json.dumps({"incident_id": "INC-001"}), encoding='utf-8')
+    first = data_cache_key(data_dir)
+    assert [name for name, _ in first] == ["INC-001.json"]
+
+    (data_dir / "fleet_metrics.json").write_text(json.dumps({"total_incidents": 1}), encoding='utf-8')
+    second = data_cache_key(data_dir)
+    assert second != first
+    assert [name for name, _ in second] == ["INC-001.json", "fleet_metrics.json"]
@@ -10,8 +10,10 @@ from src.analytics.baseline import (
     co_occurrence_crosstab,
     human_contribution_summary,
     run_baseline,
+    run_flatten_and_baseline,
     load_controls,
 )
+from src.analytics.flatten import flatten_all
 
 
 def _make_controls_df() -> pd.DataFrame:
@@ -85,6 +87,15 @@ class TestCoOccurrenceCrosstab:
         result = co_occurrence_crosstab(df)
         assert result.empty
 
+    def test_pairs_counted_across_incidents(self):
+        df = _make_controls_df()
+        second = df.copy()
+        second["incident_id"] = "INC-002"
+        result = co_occurrence_crosstab(pd.concat([df, second], ignore_index=True))
+        assert list(result.columns) == ["name_a", "name_b", "co_occurrences"]
+        assert len(result) == 1
+        assert result.iloc[0]["co_occurrences"] == 2
+
 
 class TestHumanContribution:
     def test_summary(self):
@@ -113,7 +124,80 @@ class TestRunBaseline:
             assert summary["total_controls"] == 3
             assert summary["total_incidents"] == 1
 
+    def test_load_controls_categorical_labels(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "controls.csv"
+            _make_controls_df().to_csv(csv_path, index=False)
+
+            df = load_controls(csv_path)
+            assert isinstance(df["barrier_status"].dtype, pd.CategoricalDtype)
+            assert isinstance(df["barrier_type"].dtype, pd.CategoricalDtype)
+            assert df["barrier_failed"].dtype == bool
+
+            assert barrier_status_distribution(df)["failed"]["count"] == 2
+            assert failure_rates(df, "barrier_type") == failure_rates(_make_controls_df(), "barrier_type")
+
+    def test_load_controls_blank_flags_match_read_csv(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "controls.csv"
+            controls = _make_controls_df()
+            controls["barrier_failed"] = [False, None, True]
+            controls.to_csv(csv_path, index=False)
+
+            df = load_controls(csv_path)
+            expected = pd.read_csv(csv_path)["barrier_failed"].astype(bool)
+            assert df["barrier_failed"].tolist() == expected.tolist() == [False, True, True]
+            assert failure_rates(df, "barrier_type")["engineering"]["failed"] == 2
+
     def test_missing_csv_raises(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             with pytest.raises(FileNotFoundError):
                 load_controls(Path(tmpdir) / "nonexistent.csv")
+
+
+def _make_incident(incident_id: str) -> dict:
+    """Minimal Schema v2.3 incident with four controls of mixed status/LOD."""
+    controls = []
+    for i, (status, lod, human) in enumerate([
+        ("worked", 1, None), ("failed", "1st", "high"), ("failed", 2, ""), ("degraded", None, None),
+    ]):
+        controls.append({
+            "control_id": f"C-{i+1:03d}",
+            "name": f"Control {i+1}",
+            "side": "left" if i % 2 == 0 else "right",
+            "barrier_role": "detect",
+            "barrier_type": "engineering",
+            "line_of_defense": lod,
+            "lod_basis": None,
+            "linked_threat_ids": ["T-001"],
+            "linked_consequence_ids": [],
+            "performance": {"barrier_status": status, "barrier_failed": status != "worked"},
+            "human": {"human_contribution_value": human, "barrier_failed_human": human == "high"},
+            "evidence": {"supporting_text": ["Evidence text"], "confidence": "medium"},
+        })
+    return {"incident_id": incident_id, "bowtie": {"controls": controls}}
+
+
+class TestRunFlattenAndBaseline:
+    def test_matches_flatten_then_baseline(self, tmp_path: Path):
+        struct_dir = tmp_path / "structured"
+        struct_dir.mkdir()
+        for i in range(3):
+            inc = _make_incident(f"INC-{i:03d}")
+            (struct_dir / f"INC-{i:03d}.json").write_text(json.dumps(inc))
+
+        flatten_all(struct_dir, tmp_path / "two_step.csv")
+        run_baseline(tmp_path / "two_step.csv", tmp_path / "two_step")
+
+        n = run_flatten_and_baseline(struct_dir, tmp_path / "fused.csv", tmp_path / "fused")
+        assert n == 12
+
+        assert (tmp_path / "fused.csv").read_text() == (tmp_path / "two_step.csv").read_text()
+        for name in ("control_summary.json", "failure_crosstab.csv"):
+            assert (tmp_path / "fused" / name).read_text() == (tmp_path / "two_step" / name).read_text()
+
+    def test_empty_dir_writes_nothing(self, tmp_path: Path):
+        struct_dir = tmp_path / "structured"
+        struct_dir.mkdir()
+        assert run_flatten_and_baseline(struct_dir, tmp_path / "c.csv", tmp_path / "out") == 0
+        assert not (tmp_path / "c.csv").exists()
@@ -0,0 +1,24 @@
+"""Tests for the shared bulk JSON-to-CSV helpers."""
+import csv
+import io
+
+import pytest
+
+from src.analytics.bulk_io import encode_csv_rows
+
+
+def _csv_writer_bytes(rows) -> bytes:
+    text = io.StringIO()
+    csv.writer(text).writerows(rows)
+    return text.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize("rows", [
+    [],
+    [("a", "b", 1), ("", None, 2), ("é", "1.5", 3)],          # Arrow path
+    [("a,b", 'q"x', 1), ("l\nb", None, 2)],                     # needs quoting
+    [(True, False, 1e16), (None, 2**70, -1)],                   # rendered via str()
+    [("",), (None,)],                                           # csv.writer quotes lone empties
+])
+def test_matches_csv_writer_bytes(rows):
+    assert encode_csv_rows(rows) == _csv_writer_bytes(rows)
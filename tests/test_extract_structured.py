@@ -11,6 +11,8 @@ from src.ingestion.structured import (
     merge_structured_manifests,
     save_structured_manifest,
     StructuredManifestRow,
+    StructuredManifestWriter,
+    _dump_json_bytes,
     _parse_llm_json,
 )
 from src.llm.stub import StubProvider
@@ -26,6 +28,19 @@ class TestParseJson:
         result = _parse_llm_json(raw)
         assert result == {"key": "value"}
 
+    def test_object_embedded_in_prose(self):
+        raw = 'Result follows: {"key": "a {brace} in a string"} done.'
+        assert _parse_llm_json(raw) == {"key": "a {brace} in a string"}
+
+    def test_truncated_response_raises(self):
+        """A truncated outer object must not fall back to a nested one."""
+        raw = (
+            '{"incident_id": "INC-1", "source": {"doc_type": "report"}, '
+            '"event": {"summary": "cut off'
+        )
+        with pytest.raises(json.JSONDecodeError):
+            _parse_llm_json(raw)
+
     def test_invalid_json_raises(self):
         with pytest.raises(json.JSONDecodeError):
             _parse_llm_json("not json at all")
@@ -92,6 +107,39 @@ class TestExtractStructured:
             assert len(rows) == 2
             assert all(r.extracted for r in rows)
 
+    def test_concurrent_rows_follow_file_order_and_limit(self):
+        provider = StubProvider()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text_dir = Path(tmpdir) / "text"
+            out_dir = Path(tmpdir) / "out"
+            text_dir.mkdir()
+
+            for i in range(6):
+                (text_dir / f"inc-{i:03d}.txt").write_text(f"Incident {i} narrative.")
+
+            rows = extract_structured(
+                text_dir, out_dir, provider, "stub", limit=5, concurrency=4,
+                requests_per_minute=0,
+            )
+            assert [r.incident_id for r in rows] == [f"inc-{i:03d}" for i in range(5)]
+            assert all(r.extracted for r in rows)
+            assert not (out_dir / "stub" / "inc-005.json").exists()
+
+    def test_concurrency_requires_rate_limit_opt_in(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="requests_per_minute"):
+                extract_structured(
+                    Path(tmpdir), Path(tmpdir) / "out", StubProvider(), "stub", concurrency=4,
+                )
+
+
+def test_dump_json_bytes_same_without_orjson(monkeypatch):
+    payload = {"incident_id": "INC-é", "notes": {"summary": "Bränd – 40°C"}, "n": [1, 2]}
+    with_orjson = _dump_json_bytes(payload)
+    monkeypatch.setattr("src.ingestion.structured.orjson", None)
+    assert _dump_json_bytes(payload) == with_orjson
+    assert "Bränd".encode("utf-8") in with_orjson
+
 
 class TestManifestPersistence:
     def _make_row(self, incident_id: str) -> StructuredManifestRow:
@@ -120,6 +168,51 @@ class TestManifestPersistence:
             assert loaded[0].extracted is True
             assert loaded[0].valid is True
 
+    def test_writer_appends_rows_incrementally(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = Path(tmpdir) / "manifest.csv"
+            save_structured_manifest([self._make_row("INC-001")], manifest_path)
+
+            with StructuredManifestWriter(manifest_path) as writer:
+                writer.write(self._make_row("INC-002"))
+                # Visible on disk before the writer is closed
+                assert [r.incident_id for r in load_structured_manifest(manifest_path)] == [
+                    "INC-001", "INC-002",
+                ]
+                writer.write(self._make_row("INC-001"))
+
+            loaded = load_structured_manifest(manifest_path)
+            merged = merge_structured_manifests(loaded, [])
+            assert sorted(r.incident_id for r in merged) == ["INC-001", "INC-002"]
+
+    def test_load_keeps_last_of_repeated_rows(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = Path(tmpdir) / "manifest.csv"
+            first = self._make_row("INC-001")
+            retried = self._make_row("INC-001")
+            retried.valid = False
+            save_structured_manifest(
+                [first, self._make_row("INC-002"), retried], manifest_path
+            )
+
+            loaded = load_structured_manifest(manifest_path)
+            assert [r.incident_id for r in loaded] == ["INC-001", "INC-002"]
+            assert loaded[0].valid is False
+
+    def test_extract_checkpoints_rows_to_manifest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text_dir = Path(tmpdir) / "text"
+            text_dir.mkdir()
+            (text_dir / "inc-001.txt").write_text("Incident one narrative.")
+            manifest_path = Path(tmpdir) / "manifest.csv"
+
+            rows = extract_structured(
+                text_dir, Path(tmpdir) / "out", StubProvider(), "stub",
+                manifest_path=manifest_path,
+            )
+            loaded = load_structured_manifest(manifest_path)
+            assert [r.incident_id for r in loaded] == [r.incident_id for r in rows]
+
     def test_load_nonexistent_returns_empty(self):
         loaded = load_structured_manifest(Path("/tmp/does_not_exist.csv"))
         assert loaded == []
@@ -258,6 +351,69 @@ class TestParseRetryOnFailure:
             assert "CRITICAL" in prompts_received[1]  # strict suffix
 
 
+class TestBatchApi:
+    """use_batch_api prefetches responses and falls back per file."""
+
+    def test_batch_responses_used_and_bad_ones_reextracted(self):
+        good = StubProvider().extract("")
+        batch_calls: list[int] = []
+        single_calls: list[str] = []
+
+        class BatchProvider(StubProvider):
+            def extract_batch(self, prompts):
+                batch_calls.append(len(prompts))
+                return [good, "not json", None]
+
+            def extract(self, prompt):
+                single_calls.append(prompt)
+                return good
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text_dir = Path(tmpdir) / "text"
+            out_dir = Path(tmpdir) / "out"
+            text_dir.mkdir()
+            for i in range(3):
+                (text_dir / f"inc-{i}.txt").write_text(f"Incident {i} narrative.")
+            (text_dir / "inc-3.txt").write_text("")
+
+            rows = extract_structured(
+                text_dir, out_dir, BatchProvider(), "stub", use_batch_api=True,
+            )
+
+            assert batch_calls == [3]
+            assert len(single_calls) == 2
+            assert [r.extracted for r in rows] == [True, True, True, False]
+            assert rows[3].error == "Empty text file"
+
+
+class TestExtractionCache:
+    def test_second_run_served_from_cache(self):
+        calls: list[str] = []
+
+        class CountingProvider(StubProvider):
+            def extract(self, prompt):
+                calls.append(prompt)
+                return super().extract(prompt)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text_dir = Path(tmpdir) / "text"
+            out_dir = Path(tmpdir) / "out"
+            cache_dir = Path(tmpdir) / "cache"
+            text_dir.mkdir()
+            (text_dir / "inc-001.txt").write_text("Incident one narrative.")
+
+            first = extract_structured(
+                text_dir, out_dir, CountingProvider(), "stub", cache_dir=cache_dir,
+            )
+            second = extract_structured(
+                text_dir, out_dir, CountingProvider(), "stub", cache_dir=cache_dir,
+            )
+
+            assert len(calls) == 1
+            assert first[0].valid == second[0].valid
+            assert second[0].extracted is True
+
+
 class TestRunReport:
     def _make_row(self, incident_id: str, valid: bool = True,
                   validation_errors: str | None = None,
@@ -6,6 +6,7 @@ import pytest
 
 from src.extraction.manifest import (
     ExtractionManifestRow,
+    append_manifest,
     save_manifest,
     load_manifest,
 )
@@ -98,3 +99,58 @@ class TestManifestIO:
     def test_load_nonexistent_returns_empty(self) -> None:
         result = load_manifest(Path("/nonexistent/manifest.csv"))
         assert result == []
+
+    def test_load_manifest_without_sha256_column(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "manifest.csv"
+            path.write_text(
+                "doc_id,pdf_path,text_path,extractor_used,text_len,alpha_ratio,"
+                "cid_ratio,whitespace_ratio,lang_guess,extraction_status,fail_reason,extracted_at\n"
+                "doc-001,a.pdf,doc-001.txt,pymupdf,3000,0.8,0.0,0.1,unknown,OK,,2026-02-14T10:00:00\n",
+                encoding="utf-8",
+            )
+            loaded = load_manifest(path)
+
+        assert loaded[0].text_len == 3000
+        assert loaded[0].fail_reason is None
+        assert loaded[0].pdf_sha256 is None
+
+    def test_invalid_status_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ExtractionManifestRow(
+                doc_id="doc-003",
+                pdf_path="c.pdf",
+                text_path="",
+                extractor_used="none",
+                text_len=0,
+                alpha_ratio=0.0,
+                cid_ratio=0.0,
+                whitespace_ratio=0.0,
+                extraction_status="MAYBE",
+                extracted_at="2026-02-14T10:00:00",
+            )
+
+    def test_append_writes_only_new_rows(self) -> None:
+        def _row(doc_id: str) -> ExtractionManifestRow:
+            return ExtractionManifestRow(
+                doc_id=doc_id,
+                pdf_path=f"{doc_id}.pdf",
+                text_path=f"{doc_id}.txt",
+                extractor_used="pymupdf",
+                text_len=1000,
+                alpha_ratio=0.8,
+                cid_ratio=0.0,
+                whitespace_ratio=0.1,
+                extraction_status="OK",
+                extracted_at="2026-02-14T10:00:00",
+            )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "manifest.csv"
+            append_manifest([_row("doc-001")], path)
+            append_manifest([_row("doc-002"), _row("doc-003")], path)
+            text = path.read_text(encoding="utf-8")
+            loaded = load_manifest(path)
+
+        assert text.count("doc_id,") == 1
+        assert [r.doc_id for r in loaded] == ["doc-001", "doc-002", "doc-003"]
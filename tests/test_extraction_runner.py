@@ -1,5 +1,6 @@
 """Tests for extraction QC runner (orchestrator)."""
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,7 +11,7 @@ from src.extraction.manifest import load_manifest
 from src.extraction.extractor import ExtractionResult
 
 
-def _mock_extract(pdf_path: Path) -> ExtractionResult:
+def _mock_extract(pdf_path: Path, ocr_workers: int | None = None) -> ExtractionResult:
     """Mock extractor that returns deterministic text based on filename."""
     name = pdf_path.stem
     if "bad" in name:
@@ -90,3 +91,79 @@ class TestRunExtractionQC:
             # With force — should reprocess
             rows3 = run_extraction_qc(pdf_dir, output_dir, manifest_path, force=True)
             assert len(rows3) == 1
+
+    @patch("src.extraction.runner.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("src.extraction.runner.extract_text", side_effect=_mock_extract)
+    def test_workers_preserve_pdf_order(self, mock_ext) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pdf_dir = tmp_path / "pdfs"
+            pdf_dir.mkdir()
+
+            for name in ("good_c", "bad_b", "good_a", "empty_d"):
+                (pdf_dir / f"{name}.pdf").write_bytes(b"%PDF-fake")
+
+            serial = run_extraction_qc(pdf_dir, tmp_path / "out1", tmp_path / "m1.csv")
+            parallel = run_extraction_qc(
+                pdf_dir, tmp_path / "out2", tmp_path / "m2.csv", workers=4
+            )
+
+            assert [r.doc_id for r in parallel] == ["bad_b", "empty_d", "good_a", "good_c"]
+            assert [(r.doc_id, r.extraction_status) for r in parallel] == [
+                (r.doc_id, r.extraction_status) for r in serial
+            ]
+
+    @patch("src.extraction.runner.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("src.extraction.runner.extract_text", side_effect=_mock_extract)
+    def test_workers_split_ocr_concurrency(self, mock_ext) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pdf_dir = tmp_path / "pdfs"
+            pdf_dir.mkdir()
+            for name in ("good_a", "good_b", "good_c", "good_d"):
+                (pdf_dir / f"{name}.pdf").write_bytes(name.encode())
+
+            run_extraction_qc(pdf_dir, tmp_path / "out1", tmp_path / "m1.csv", ocr_workers=8)
+            assert {c.kwargs["ocr_workers"] for c in mock_ext.call_args_list} == {8}
+
+            mock_ext.reset_mock()
+            run_extraction_qc(
+                pdf_dir, tmp_path / "out2", tmp_path / "m2.csv", workers=4, ocr_workers=8
+            )
+            assert {c.kwargs["ocr_workers"] for c in mock_ext.call_args_list} == {2}
+
+    @patch("src.extraction.runner.extract_text", side_effect=_mock_extract)
+    def test_renamed_pdf_reuses_text_by_hash(self, mock_ext) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pdf_dir = tmp_path / "pdfs"
+            pdf_dir.mkdir()
+            output_dir = tmp_path / "output"
+            manifest_path = tmp_path / "manifest.csv"
+
+            (pdf_dir / "good_report.pdf").write_bytes(b"%PDF-fake")
+            (pdf_dir / "good_other.pdf").write_bytes(b"%PDF-fake-2")
+
+            rows1 = run_extraction_qc(pdf_dir, output_dir, manifest_path)
+            assert all(r.pdf_sha256 for r in rows1)
+            assert load_manifest(manifest_path)[0].pdf_sha256 == rows1[0].pdf_sha256
+            assert mock_ext.call_count == 2
+
+            # Same content under a new name: text reused, not re-extracted
+            (pdf_dir / "good_copy.pdf").write_bytes(b"%PDF-fake")
+            rows2 = run_extraction_qc(pdf_dir, output_dir, manifest_path)
+            assert mock_ext.call_count == 2
+            copy = {r.doc_id: r for r in rows2}["good_copy"]
+            assert copy.text_path == "good_copy.txt"
+            assert copy.pdf_sha256 == {r.doc_id: r for r in rows1}["good_report"].pdf_sha256
+            assert (output_dir / "good_copy.txt").read_text() == (
+                output_dir / "good_report.txt"
+            ).read_text()
+            assert [r.doc_id for r in load_manifest(manifest_path)] == [
+                r.doc_id for r in rows2
+            ]
+
+            # --force always re-extracts, unchanged hashes included
+            rows3 = run_extraction_qc(pdf_dir, output_dir, manifest_path, force=True)
+            assert mock_ext.call_count == 5
+            assert len(rows3) == 3
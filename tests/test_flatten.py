@@ -2,7 +2,7 @@ import json
 import pytest
 import tempfile
 from pathlib import Path
-from src.analytics.flatten import flatten_controls, flatten_all
+from src.analytics.flatten import CONTROLS_CSV_COLUMNS, flatten_controls, flatten_all
 
 
 def _make_incident(incident_id: str = "TEST-001", n_controls: int = 2) -> dict:
@@ -114,6 +114,44 @@ class TestFlattenAll:
             n = flatten_all(struct_dir, out_csv)
             assert n == 3
 
+    def test_flatten_all_parallel_preserves_order(self, monkeypatch):
+        import csv
+        monkeypatch.setattr("src.analytics.flatten.PARALLEL_MIN_FILES", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            struct_dir = Path(tmpdir) / "structured"
+            struct_dir.mkdir()
+            out_csv = Path(tmpdir) / "controls.csv"
+
+            for i in range(5):
+                inc = _make_incident(f"INC-{i:03d}", n_controls=2)
+                (struct_dir / f"INC-{i:03d}.json").write_text(json.dumps(inc))
+            (struct_dir / "ZZZ-bad.json").write_text("{not json")
+
+            n = flatten_all(struct_dir, out_csv)
+            assert n == 10
+
+            with open(out_csv, "r") as f:
+                rows = list(csv.DictReader(f))
+            assert [r["incident_id"] for r in rows[::2]] == [f"INC-{i:03d}" for i in range(5)]
+
+    @pytest.mark.parametrize("threat_ids", [["T-001"], ["T-001", "T-002"]])
+    def test_flatten_all_matches_csv_dictwriter_bytes(self, tmp_path: Path, threat_ids):
+        import csv
+        incident = _make_incident(n_controls=2)
+        incident["bowtie"]["controls"][0]["linked_threat_ids"] = threat_ids
+        incident["bowtie"]["controls"][1]["name"] = ""
+        incident["bowtie"]["controls"][1]["line_of_defense"] = 2
+        (tmp_path / "TEST-001.json").write_text(json.dumps(incident))
+        out_csv = tmp_path / "controls.csv"
+        flatten_all(tmp_path, out_csv)
+
+        expected = tmp_path / "expected.csv"
+        with open(expected, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CONTROLS_CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(flatten_controls(incident))
+        assert out_csv.read_bytes() == expected.read_bytes()
+
 
 def test_flatten_reads_bom_encoded_json(tmp_path: Path) -> None:
     """Regression test: flatten_all must correctly read utf-8-sig (BOM) encoded JSON files."""
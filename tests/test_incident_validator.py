@@ -6,7 +6,12 @@ from pathlib import Path
 
 import pytest
 
-from src.validation.incident_validator import validate_incident_v23
+from src.models.incident_v23 import IncidentV23
+from src.validation.incident_validator import (
+    parse_incident_v23,
+    parse_incident_v23_json,
+    validate_incident_v23,
+)
 
 TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "assets" / "schema" / "incident_schema_v2_3_template.json"
 
@@ -99,6 +104,36 @@ class TestIncidentValidatorV2_2:
         assert is_valid is True
         assert errors == []
 
+    def test_parse_returns_model_or_errors(self) -> None:
+        """parse_incident_v23 returns the validated model, or None with errors."""
+        model, errors = parse_incident_v23(_minimal_valid_doc())
+        assert isinstance(model, IncidentV23)
+        assert errors == []
+
+        doc = _minimal_valid_doc()
+        del doc["incident_id"]
+        model, errors = parse_incident_v23(doc)
+        assert model is None
+        assert errors == validate_incident_v23(doc)[1]
+
+    def test_parse_json_matches_dict_path(self) -> None:
+        """parse_incident_v23_json validates raw JSON like the dict path."""
+        doc = _minimal_valid_doc()
+        model, errors = parse_incident_v23_json(json.dumps(doc).encode("utf-8"))
+        assert errors == []
+        assert model == parse_incident_v23(doc)[0]
+
+        del doc["incident_id"]
+        assert parse_incident_v23_json(json.dumps(doc)) == parse_incident_v23(doc)
+
+    def test_parse_json_reports_decode_error(self) -> None:
+        """Malformed JSON keeps the schema-check "JSON decode error" prefix."""
+        model, errors = parse_incident_v23_json("{not json")
+        assert model is None
+        assert len(errors) == 1
+        assert errors[0].startswith("JSON decode error: ")
+        assert "line 1 column 2" in errors[0]
+
     def test_missing_incident_id(self) -> None:
         """Removing incident_id (a required field) should fail validation."""
         doc = _minimal_valid_doc()
@@ -240,6 +275,14 @@ class TestIncidentValidatorV2_2:
             # Should contain a location indicator
             assert "incident_id" in err
 
+    def test_low_cardinality_strings_are_shared(self) -> None:
+        """Repeated free-form values like region resolve to one string object."""
+        raw = json.dumps(_minimal_valid_doc())
+        first = IncidentV23.model_validate_json(raw)
+        second = IncidentV23.model_validate_json(raw)
+        assert first.context.region is second.context.region
+        assert first.context.operating_phase is second.context.operating_phase
+
     def test_top_event_list_becomes_string(self) -> None:
         """LLM returning a list for top_event should be coerced to string."""
         doc = _minimal_valid_doc()
@@ -0,0 +1,73 @@
+"""Tests for the on-disk LLM response cache."""
+from pathlib import Path
+
+from src.llm.cache import (
+    ExtractionCache,
+    ResponseCache,
+    cache_key,
+    normalize_prompt,
+)
+
+
+class TestCacheKey:
+    def test_stable_and_model_sensitive(self):
+        assert cache_key("anthropic", "m1", "prompt") == cache_key("anthropic", "m1", "prompt")
+        assert cache_key("anthropic", "m1", "prompt") != cache_key("anthropic", "m2", "prompt")
+
+    def test_length_prefix_prevents_boundary_collisions(self):
+        assert cache_key("ab", "c", "d") != cache_key("a", "bc", "d")
+
+    def test_normalized_prompts_share_key(self):
+        assert normalize_prompt("  a\n\tb  c ") == "a b c"
+        assert cache_key("m", normalize_prompt("a  b")) == cache_key("m", normalize_prompt("a\nb"))
+        assert cache_key("m", "A b") != cache_key("m", "a b")
+
+
+class TestExtractionCache:
+    def test_put_then_get(self, tmp_path: Path):
+        cache = ExtractionCache(tmp_path / "cache")
+        key = cache_key("anthropic", "m1", "prompt")
+        assert cache.get(key) is None
+
+        cache.put(key, '{"a": 1}', "anthropic", "m1")
+        entry = cache.get(key)
+        assert entry["raw"] == '{"a": 1}'
+        assert entry["model"] == "m1"
+        assert list((tmp_path / "cache").iterdir()) == [tmp_path / "cache" / f"{key}.json"]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        cache = ExtractionCache(tmp_path)
+        (tmp_path / "deadbeef.json").write_text("{not json")
+        assert cache.get("deadbeef") is None
+
+    def test_ttl_on_read(self, tmp_path: Path):
+        cache = ExtractionCache(tmp_path)
+        cache.put("k", "raw", "anthropic", "m1")
+        assert cache.get("k", ttl=60)["raw"] == "raw"
+        assert cache.get("k", ttl=-1) is None
+        assert cache.get("k")["raw"] == "raw"
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2, ttl=60)
+        cache.update("a", "1")
+        cache.update("b", "2")
+        assert cache.lookup("a") == "1"  # "a" becomes most recent
+        cache.update("c", "3")
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") == "1"
+        assert cache.lookup("c") == "3"
+
+    def test_expired_entries_miss(self):
+        cache = ResponseCache(ttl=-1)
+        cache.update("a", "1")
+        assert cache.lookup("a") is None
+
+    def test_disk_entries_survive_new_instance(self, tmp_path: Path):
+        ResponseCache(ttl=60, disk=ExtractionCache(tmp_path)).update(
+            "a", "1", provider="anthropic", model="m1"
+        )
+        fresh = ResponseCache(ttl=60, disk=ExtractionCache(tmp_path))
+        assert fresh.lookup("a") == "1"
+        assert ResponseCache(ttl=-1, disk=ExtractionCache(tmp_path)).lookup("a") is None
@@ -29,3 +29,4 @@ class TestStubProvider:
     def test_stub_implements_abc(self):
         provider = StubProvider()
         assert isinstance(provider, LLMProvider)
+
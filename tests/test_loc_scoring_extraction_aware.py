@@ -1,5 +1,6 @@
 """Tests for extraction-aware LOC scoring."""
 import tempfile
+from collections import Counter
 from pathlib import Path
 
 import pandas as pd
@@ -117,6 +118,26 @@ class TestRunWithExtractionManifest:
             assert "extraction_status" in result.columns
             assert "fail_reason" in result.columns
 
+    def test_parallel_workers_match_serial_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            manifest_path = tmp_path / "extraction_manifest.csv"
+            text_dir = tmp_path / "text"
+            text_dir.mkdir()
+
+            _make_extraction_manifest(manifest_path)
+            (text_dir / "good-001.txt").write_text(
+                "The release of gas at the refinery caused an explosion. " * 20,
+                encoding="utf-8",
+            )
+
+            run_with_extraction_manifest(manifest_path, text_dir, tmp_path / "serial.csv")
+            run_with_extraction_manifest(
+                manifest_path, text_dir, tmp_path / "parallel.csv", workers=2,
+            )
+
+            assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "serial.csv").read_bytes()
+
     def test_no_false_label_for_failed_extraction(self) -> None:
         """Critical: no EXTRACTION_FAILED row should ever have final_label=FALSE."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -181,3 +202,15 @@ class TestSecondaryTier:
         scores = score_text(text)
         # primary=1 (release), secondary=1 (explosion), hazardous=2 (explosion+chemical)
         assert scores["loc_score"] == (1 * 2) + (1 * 1) + 2  # = 5
+
+    def test_automaton_matches_regex_scan(self) -> None:
+        """The Aho-Corasick path keeps whole-word counts identical to the regex."""
+        pytest.importorskip("ahocorasick")
+        from src.nlp import loc_scoring
+
+        text = "gases leaked; oil_spill, GAS-fire and loss of containment. fireside oil"
+        regex_counts = Counter(
+            loc_scoring._GROUP_TERMS[m.lastgroup]
+            for m in loc_scoring._LOWER_TERMS_PATTERN.finditer(text.lower())
+        )
+        assert loc_scoring._automaton_counts(text.lower()) == regex_counts
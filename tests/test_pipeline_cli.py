@@ -98,6 +98,45 @@ class TestCmdAcquire:
 
             assert out_path.exists()
 
+    def test_acquire_concurrent_downloads_keep_discovery_order(self):
+        """--download with several workers keeps rows in discovery order."""
+        from src.ingestion.manifests import IncidentManifestRow, load_incident_manifest
+
+        rows = [
+            IncidentManifestRow(
+                source="csb",
+                incident_id=f"test-{i}",
+                title=f"Test {i}",
+                detail_url=f"https://csb.gov/test-{i}",
+                pdf_url=f"https://csb.gov/test-{i}.pdf",
+                pdf_path=f"csb/pdfs/test-{i}.pdf",
+            )
+            for i in range(5)
+        ]
+
+        def fake_download(row, raw_dir, session, timeout=30):
+            return row.model_copy(update={"downloaded": True})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "manifest.csv"
+
+            mock_args = Mock()
+            mock_args.csb_limit = 5
+            mock_args.bsee_limit = 0
+            mock_args.out = str(out_path)
+            mock_args.download = True
+            mock_args.download_workers = 4
+            mock_args.timeout = 30
+            mock_args.append = False
+
+            with patch("src.pipeline.discover_csb_incidents", return_value=iter(rows)):
+                with patch("src.pipeline.download_csb_pdf", side_effect=fake_download):
+                    cmd_acquire(mock_args)
+
+            final = load_incident_manifest(out_path)
+            assert [r.incident_id for r in final] == [f"test-{i}" for i in range(5)]
+            assert all(r.downloaded for r in final)
+
     def test_acquire_append_preserves_downloaded(self):
         """--append mode preserves existing downloaded=True row."""
         from src.ingestion.manifests import (
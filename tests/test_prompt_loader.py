@@ -53,6 +53,22 @@ def test_load_prompt_missing_schema_file() -> None:
         )
 
 
+def test_load_prompt_picks_up_edited_template(tmp_path: Path) -> None:
+    """Cached templates are re-read when the file changes on disk."""
+    import os
+
+    prompt = tmp_path / "prompt.md"
+    schema = tmp_path / "schema.json"
+    schema.write_text("{}", encoding="utf-8")
+    prompt.write_text("v1 {{SCHEMA_TEMPLATE}} {{INCIDENT_TEXT}}", encoding="utf-8")
+    assert load_prompt("x", schema_path=schema, prompt_path=prompt) == "v1 {} x"
+
+    prompt.write_text("v2 {{INCIDENT_TEXT}}|{{INCIDENT_TEXT}}", encoding="utf-8")
+    st = prompt.stat()
+    os.utime(prompt, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_prompt("x", schema_path=schema, prompt_path=prompt) == "v2 x|x"
+
+
 def test_load_prompt_default_paths() -> None:
     """Calling with just incident_text uses default paths and produces valid output."""
     result = load_prompt("A gas leak occurred at the offshore platform.")
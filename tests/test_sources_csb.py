@@ -8,6 +8,7 @@ from src.ingestion.sources.csb import (
     discover_csb_incidents,
     download_csb_pdf,
     _extract_investigation_cards,
+    _parse_csb_date,
     CSB_COMPLETED_URL,
 )
 from src.ingestion.manifests import IncidentManifestRow
@@ -90,6 +91,25 @@ class TestExtractInvestigationCards:
         assert _extract_investigation_cards("<html><body></body></html>") == []
 
 
+class TestParseCsbDate:
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("January 5, 2020", "2020-01-05"),
+            ("Jan 5, 2020", "2020-01-05"),
+            ("01/05/2020", "2020-01-05"),
+            ("1/5/2020", "2020-01-05"),
+            (" 2020-01-05 ", "2020-01-05"),
+            ("2020-1-5", "2020-01-05"),
+            ("2020-02-30", None),
+            ("garbage", None),
+            ("", None),
+        ],
+    )
+    def test_formats(self, raw, expected):
+        assert _parse_csb_date(raw) == expected
+
+
 class TestDiscoverCsbIncidents:
     def test_returns_iterator_of_manifest_rows(self):
         with patch("src.ingestion.sources.csb.requests") as mock_requests: